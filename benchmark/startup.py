@@ -0,0 +1,229 @@
+"""
+Startup benchmarks: `import uplot` time, time to the first `figure()` and to the first `save()`.
+
+Every measurement runs in a fresh interpreter (cold start) with `-X importtime`,
+so the import breakdown shows which modules are responsible for the time.
+
+Usage:
+    python benchmark/startup.py                   # run and compare with the baseline
+    python benchmark/startup.py --save-baseline   # run and store the results as the baseline
+    python benchmark/startup.py --engine mpl-nogui --engine plotly --repeat 10
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+from pathlib import Path
+from typing import NamedTuple
+
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).resolve().parent / 'baseline.json'
+
+# relative slowdown reported as a regression
+REGRESSION_THRESHOLD = 0.2
+# top-level imports faster than this are not stored
+IMPORT_MIN_TIME = 0.001
+
+
+# the case body is timed after `import uplot`, the output file is `{output}`
+CASE_TEMPLATE = '''
+import json, time
+start = time.perf_counter()
+import uplot
+imported = time.perf_counter()
+{body}
+end = time.perf_counter()
+print(json.dumps({{ 'import': imported - start, 'case': end - imported, 'total': end - start }}))
+'''
+
+
+class Case(NamedTuple):
+    name: str
+    body: str
+
+
+class Result(NamedTuple):
+    name: str
+    total: float                # seconds: import + case, median of runs
+    case: float                 # seconds: case only (without `import uplot`), median of runs
+    imports: dict[str, float]   # top-level module -> cumulative import time (fastest run)
+    error: str | None = None
+
+
+def cases(engines: list[str]) -> list[Case]:
+    """
+    Benchmark cases: import, then the first figure and the first save for each engine.
+    """
+    result = [ Case('import', 'pass') ]
+
+    for engine in engines:
+        figure = f'fig = uplot.figure(engine={engine!r})'
+        result.append(Case(f'figure[{engine}]', figure))
+
+        formats = [ 'png', 'html' ] if engine_supports_html(engine) else [ 'png' ]
+        for fmt in formats:
+            save = f'{figure}\nfig.plot([1, 2, 3], [3, 1, 2])\nfig.save({{output}} + {"." + fmt!r})'
+            result.append(Case(f'save[{engine}, {fmt}]', save))
+
+    return result
+
+
+def engine_supports_html(engine: str) -> bool:
+    import uplot
+    names = next(name for name, aliases in uplot.engine.available().items() if engine in aliases)
+    return names.startswith('plotly')
+
+
+def default_engines() -> list[str]:
+    """
+    The first alias of each available engine.
+    """
+    import uplot
+    return [ aliases[0] for aliases in uplot.engine.available().values() ]
+
+
+def run_case(case: Case, repeat: int) -> Result:
+    totals, times, imports = [], [], None
+    best = float('inf')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output = os.path.join(tmp_dir, 'figure')
+        code = CASE_TEMPLATE.format(body=case.body.replace('{output}', repr(output)))
+
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [ str(REPO_DIR), env.get('PYTHONPATH') ]))
+
+        for _ in range(repeat):
+            process = subprocess.run([ sys.executable, '-X', 'importtime', '-c', code ],
+                                     capture_output=True, text=True, env=env, cwd=tmp_dir)
+            if process.returncode != 0:
+                # the exception message: from the last `...Error:` line
+                lines = process.stderr.strip().splitlines()
+                start = max([ i for i, line in enumerate(lines) if re.match(r'[\w.]+(Error|Exception)\b', line) ], default=len(lines) - 1)
+                error = ' '.join(line.strip() for line in lines[start:start + 3] if line.strip())
+                return Result(case.name, total=float('nan'), case=float('nan'), imports={}, error=error)
+
+            timing = json.loads(process.stdout.strip().splitlines()[-1])
+            totals.append(timing['total'])
+            times.append(timing['case'])
+
+            if timing['total'] < best:
+                best = timing['total']
+                imports = parse_importtime(process.stderr)
+
+    return Result(case.name,
+                  total=statistics.median(totals),
+                  case=statistics.median(times),
+                  imports=imports)
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    """
+    Cumulative import time (seconds) of top-level modules from `-X importtime` output:
+
+        import time: self [us] | cumulative | imported package
+        import time:       512 |       2048 | uplot
+    """
+    imports = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue # header
+
+        name = fields[2].rstrip()[1:] # skip the separator space, nesting is marked by indentation
+        if name != name.lstrip():
+            continue # nested import, included to the cumulative time of the parent
+
+        cumulative = int(fields[1]) / 1e6
+        if cumulative >= IMPORT_MIN_TIME:
+            imports[name] = imports.get(name, 0) + cumulative
+
+    return imports
+
+
+def compare(results: list[Result], baseline: dict, threshold: float) -> list[str]:
+    """
+    Regressions of the results relative to the baseline: slower cases and new heavy imports.
+    """
+    regressions = []
+
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None or result.error is not None:
+            continue
+
+        if result.total > base['total']*(1 + threshold):
+            regressions.append(f'{result.name}: {base["total"]*1e3:.0f} ms -> {result.total*1e3:.0f} ms')
+
+        new_imports = sorted(set(result.imports) - set(base['imports']),
+                             key=lambda name: -result.imports[name])
+        for name in new_imports:
+            if result.imports[name] >= base['total']*threshold:
+                regressions.append(f'{result.name}: new import `{name}` ({result.imports[name]*1e3:.0f} ms)')
+
+    return regressions
+
+
+def report(results: list[Result], baseline: dict, top: int):
+    print(f'{"case":<28} {"total, ms":>10} {"case, ms":>10} {"baseline, ms":>13}')
+
+    for result in results:
+        if result.error is not None:
+            print(f'{result.name:<28} failed: {result.error}')
+            continue
+
+        base = baseline.get(result.name)
+        base_str = '-' if base is None else f'{base["total"]*1e3:.0f}'
+        print(f'{result.name:<28} {result.total*1e3:>10.0f} {result.case*1e3:>10.0f} {base_str:>13}')
+
+        heaviest = sorted(result.imports.items(), key=lambda item: -item[1])[:top]
+        for name, duration in heaviest:
+            print(f'    {name:<24} {duration*1e3:>10.0f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--engine', action='append', help='engine name, by default all available engines')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs of each case (median)')
+    parser.add_argument('--top', type=int, default=5, help='number of the heaviest imports to show')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE, help='baseline file (json)')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help='relative slowdown for a regression')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_DIR))
+    engines = args.engine or default_engines()
+
+    results = [ run_case(case, repeat=args.repeat) for case in cases(engines) ]
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    report(results, baseline, top=args.top)
+
+    if args.save_baseline:
+        data = { r.name: { 'total': r.total, 'case': r.case, 'imports': r.imports } for r in results if r.error is None }
+        args.baseline.write_text(json.dumps(data, indent=4))
+        print(f'\nbaseline saved: {args.baseline}')
+        return
+
+    regressions = compare(results, baseline, threshold=args.threshold)
+    if regressions:
+        print('\nregressions:')
+        for regression in regressions:
+            print(f'    {regression}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -27,7 +27,7 @@ if __name__ == '__main__':
         install_requires=dependencies,
         extras_require={
             'matplotlib': [ 'matplotlib >= 3.7, < 4.0' ],
-            'plotly5':    [ 'plotly >= 5.16, < 6.0', 'kaleido' ],
-            'all':        [ 'matplotlib >= 3.7, < 4.0', 'plotly >= 5.16, < 6.0', 'kaleido' ]
+            'plotly5':    [ 'plotly >= 5.16, < 6.0', 'kaleido >= 0.2, < 0.3' ],
+            'all':        [ 'matplotlib >= 3.7, < 4.0', 'plotly >= 5.16, < 6.0', 'kaleido >= 0.2, < 0.3' ]
         },
     )
\ No newline at end of file
@@ -0,0 +1,53 @@
+import numpy as np
+
+import uplot
+
+
+def _bar_rectangles(artist) -> np.ndarray:
+    """
+    (left, bottom, right, top) of each bar: a `BarContainer` or a `PolyCollection`.
+    """
+    if hasattr(artist, 'patches'):
+        return np.array([ [ patch.get_x(), patch.get_y(),
+                            patch.get_x() + patch.get_width(), patch.get_y() + patch.get_height() ]
+                          for patch in artist.patches ])
+
+    vertices = np.array([ path.vertices[:4] for path in artist.get_paths() ])
+    return np.column_stack([ vertices[:, :, 0].min(axis=1), vertices[:, :, 1].min(axis=1),
+                             vertices[:, :, 0].max(axis=1), vertices[:, :, 1].max(axis=1) ])
+
+
+def _plot_bars(monkeypatch, threshold: int) -> tuple[list[np.ndarray], tuple, tuple]:
+    fig = uplot.figure('mpl-nogui')
+    monkeypatch.setattr(fig.engine, 'BAR_COLLECTION_THRESHOLD', threshold)
+
+    heights = [ np.array([ 3, 1, 4, 1, 5 ]), np.array([ 2, 7, 1, 8, 2 ]), np.array([ 1, 1, 2, 3, 5 ]) ]
+    fig.bar(heights[0])
+    fig.bar(heights[1], width=0.6)
+    fig.as_image(dpi=10) # the layout of two series is drawn
+
+    # a series added later: the bars of the group are moved and narrowed on the next drawing
+    fig.bar(heights[2], width=0.6)
+    fig.as_image(dpi=10)
+
+    axis = fig.internal.axes[0]
+    rectangles = [ _bar_rectangles(series) for series in (*axis.containers, *axis.collections) ]
+    limits = axis.get_xlim(), axis.get_ylim()
+    fig.close()
+    return rectangles, *limits
+
+
+def test_bar_collection_geometry(monkeypatch):
+    patches, patches_xlim, patches_ylim = _plot_bars(monkeypatch, threshold=10**9)       # `Axes.bar()`
+    collections, collections_xlim, collections_ylim = _plot_bars(monkeypatch, threshold=1) # `PolyCollection`
+
+    assert len(patches) == len(collections) == 3
+    for index, (expected, actual) in enumerate(zip(patches, collections)):
+        assert np.allclose(actual, expected)
+
+        # the same layout as `Axes.bar()` of the whole group at once
+        center = np.arange(5) + 0.2 + index*0.2
+        assert np.allclose(expected[:, 0], center - 0.1) and np.allclose(expected[:, 2], center + 0.1)
+
+    assert np.allclose(collections_xlim, patches_xlim)
+    assert np.allclose(collections_ylim, patches_ylim)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import uplot.color as ucolor
+
+
+def test_rgba_array_names():
+    expected = np.array([ ucolor.hex_to_rgba(ucolor.name_to_hex('red')),
+                          ucolor.hex_to_rgba(ucolor.name_to_hex('blue')),
+                          ucolor.hex_to_rgba(ucolor.name_to_hex('red')) ])
+
+    for colors in (['red', 'blue', 'red'],
+                   np.array(['red', 'blue', 'red']),
+                   np.array(['red', 'blue', 'red'], dtype=object)):
+        assert np.allclose(ucolor.to_rgba_array(colors), expected)
+
+
+def test_rgba_array_pandas_series():
+    pd = pytest.importorskip('pandas')
+
+    rgba = ucolor.to_rgba_array(pd.Series(['red', '#0000ff']))
+    assert np.allclose(rgba[1], (0, 0, 1, 1))
+
+
+def test_rgba_array_integer_range():
+    # integers in the [0, 1] range are not rescaled
+    assert np.allclose(ucolor.to_rgba_array([ (1, 0, 0) ]), [ (1, 0, 0, 1) ])
+    # integers above 1 and uint8 are in the [0, 255] range
+    assert np.allclose(ucolor.to_rgba_array([ (255, 0, 0) ]), [ (1, 0, 0, 1) ])
+    assert np.allclose(ucolor.to_rgba_array(np.array([ (255, 0, 0, 255) ], dtype=np.uint8)), [ (1, 0, 0, 1) ])
+
+
+def test_rgba_array_float():
+    rgba = ucolor.to_rgba_array(np.array([ (0.5, 0.25, 0.0) ]))
+    assert np.allclose(rgba, [ (0.5, 0.25, 0.0, 1.0) ])
+
+
+def test_palette_max_size():
+    rgba = np.column_stack([ np.random.default_rng(0).random((100_000, 3)), np.ones(100_000) ])
+
+    palette, index = ucolor.to_palette(rgba, max_size=4096)
+    assert len(palette) <= 4096
+    assert index.max() < len(palette)
+    # quantized colors are close to the original ones
+    assert np.abs(palette[index] / 255 - rgba).max() <= 1/15
@@ -0,0 +1,144 @@
+import numpy as np
+
+import uplot.utool as utool
+from uplot.utool.decimate import minmax_index, lttb_index
+
+
+def _memmap(tmp_path, name: str, values: np.ndarray) -> np.memmap:
+    array = np.memmap(tmp_path / name, dtype=values.dtype, mode='w+', shape=values.shape)
+    array[:] = values
+    return array
+
+
+def test_reduce_out_of_core_monotonic(tmp_path, monkeypatch):
+    monkeypatch.setattr('uplot.utool.decimate.BLOCK_SIZE', 1000) # many blocks
+
+    n = 100_000
+    x = _memmap(tmp_path, 'x.bin', np.linspace(0, 1, n))
+    y = _memmap(tmp_path, 'y.bin', np.sin(np.arange(n)))
+    y[12345] = 10.0 # spike
+
+    x_out, y_out = utool.reduce_out_of_core(x, y, n_bins=100, workers=2)
+    assert len(y_out) < n
+    assert y_out.max() == 10.0
+    assert x_out[0] == 0 and x_out[-1] == 1
+
+
+def test_reduce_out_of_core_not_monotonic(tmp_path, monkeypatch):
+    monkeypatch.setattr('uplot.utool.decimate.BLOCK_SIZE', 1000)
+
+    n = 100_000
+    y = _memmap(tmp_path, 'y.bin', np.random.default_rng(0).random(n))
+
+    # unsorted x (scatter) is not reduced
+    x = _memmap(tmp_path, 'x.bin', np.random.default_rng(1).random(n))
+    assert utool.reduce_out_of_core(x, y, n_bins=100) is None
+
+    # sorted blocks in the wrong order
+    x = _memmap(tmp_path, 'x2.bin', np.concatenate([ np.arange(n//2, n), np.arange(n//2) ]))
+    assert utool.reduce_out_of_core(x, y, n_bins=100) is None
+
+
+def test_reduce_out_of_core_as_in_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr('uplot.utool.decimate.BLOCK_SIZE', 1000) # bins are split between blocks
+
+    n = 100_000
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.random(n))[::-1] # non-uniform, decreasing
+    y = rng.standard_normal(n)
+    y[500:900] = np.nan
+
+    index = minmax_index(x, y, n_bins=300)
+    x_out, y_out = utool.reduce_out_of_core(_memmap(tmp_path, 'x.bin', x), _memmap(tmp_path, 'y.bin', y),
+                                            n_bins=300, workers=2)
+    assert np.array_equal(x_out, x[index])
+    assert np.array_equal(y_out, y[index], equal_nan=True)
+
+    # x is the point index
+    x_out, _ = utool.reduce_out_of_core(_memmap(tmp_path, 'y2.bin', y), None, n_bins=300)
+    assert np.array_equal(x_out, minmax_index(np.arange(n), y, n_bins=300))
+
+
+def test_minmax_index():
+    n = 10_000
+    x = np.arange(n)
+    y = np.sin(np.arange(n) / 100)
+    y[1234] = 5.0 # spike
+
+    index = minmax_index(x, y, n_bins=100)
+    assert len(index) <= 4*100
+    assert np.all(np.diff(index) > 0)
+    assert index[0] == 0 and index[-1] == n - 1
+    assert 1234 in index
+
+    # the first and the last points of each bin (uniform in x) are kept
+    bounds = np.arange(100, n, 100)
+    assert np.all(np.isin(bounds, index)) and np.all(np.isin(bounds - 1, index))
+
+    # not decimated: small data, not monotonic x
+    assert minmax_index(x[:100], y[:100], n_bins=100) is None
+    assert minmax_index(np.random.default_rng(0).random(n), y, n_bins=100) is None
+
+
+def test_minmax_index_decreasing_unsigned():
+    n = 10_000
+    y = np.sin(np.arange(n) / 100)
+    y[1234] = 5.0
+
+    expected = minmax_index(np.arange(n), y, n_bins=100)
+    for dtype in (np.int64, np.uint32, np.float64):
+        x = np.arange(n)[::-1].astype(dtype)
+        index = minmax_index(x, y, n_bins=100)
+        assert np.array_equal(index, expected)
+
+
+def test_lttb_index():
+    n = 10_000
+    y = np.sin(np.arange(n) / 100)
+    y[1234] = 5.0
+
+    for x in (np.arange(n), np.arange(n)[::-1].astype(np.uint32)):
+        index = lttb_index(x, y, n_out=200)
+        assert len(index) == 200
+        assert np.all(np.diff(index) > 0)
+        assert index[0] == 0 and index[-1] == n - 1
+        assert 1234 in index
+
+    assert lttb_index(np.arange(100), y[:100], n_out=200) is None
+    assert lttb_index(np.random.default_rng(0).random(n), y, n_out=200) is None
+
+
+def test_decimate_lines_only():
+    import uplot
+
+    n = 100_000
+    x = np.arange(n)
+    y = np.sin(x / 100)
+
+    engines = [ 'mpl-nogui' ]
+    try:
+        import plotly # noqa: F401
+        engines.append('plotly5')
+    except ImportError:
+        pass
+
+    for engine in engines:
+        fig = uplot.figure(engine)
+        sizes = [ ]
+        for plot in (lambda: fig.plot(x, y, decimate='minmax'),
+                     lambda: fig.plot(x, y, marker_style='o', decimate='minmax'),
+                     lambda: fig.scatter(x, y, decimate='minmax')):
+            plot()
+            sizes.append(len(_trace_y(fig.last_trace.internal)))
+        fig.close()
+
+        assert sizes[0] < n and sizes[1] < n # lines (with markers) are decimated
+        assert sizes[2] == n # every marker of a scatter is drawn
+
+
+def _trace_y(artist):
+    if hasattr(artist, 'get_offsets'):
+        return artist.get_offsets()[:, 1] # matplotlib scatter
+    if hasattr(artist, 'get_ydata'):
+        return artist.get_ydata() # matplotlib line
+    return artist.y # plotly trace
@@ -0,0 +1,8 @@
+import uplot.engine as engine
+
+
+def test_available_names():
+    # the names reported without creating the engines are the names of the created engines
+    for engine_name, shortcuts in engine.available().items():
+        for shortcut in shortcuts:
+            assert engine.get(shortcut).name == engine_name
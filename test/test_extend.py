@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+import uplot
+
+
+@pytest.mark.parametrize('engine_name', [ 'mpl-nogui', 'plotly5' ])
+@pytest.mark.parametrize('max_points', [ None, 5 ])
+def test_extend_series(engine_name, max_points):
+    pytest.importorskip({ 'mpl-nogui': 'matplotlib', 'plotly5': 'plotly' }[engine_name])
+
+    fig = uplot.figure(engine_name)
+    fig.plot([ 0, 1, 2 ], [ 0, 1, 4 ])
+    trace = fig.last_trace
+
+    for i in range(3, 10):
+        fig.extend(trace, [ i ], [ i*i ], max_points=max_points)
+
+    # the extended series is passed to the engine on the first use of the figure (not a new change)
+    revision = fig.revision
+    internal = fig.internal
+    assert fig.revision == revision
+    if engine_name == 'plotly5':
+        x, y = internal.data[0].x, internal.data[0].y
+    else:
+        x, y = trace.internal.get_xdata(), trace.internal.get_ydata()
+
+    expected = np.arange(10)[-(max_points or 10):]
+    assert np.array_equal(x, expected)
+    assert np.array_equal(y, expected**2)
+
+    fig.close()
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from uplot.utool.grid import array_to_grid, clear_grid_cache
+
+
+@pytest.mark.parametrize('interpolation', [ 'nearest', 'linear', 'cubic' ])
+def test_array_to_grid_matches_scipy(interpolation):
+    from scipy.interpolate import griddata
+
+    rng = np.random.default_rng(0)
+    x, y = rng.random(2000), rng.random(2000)
+
+    clear_grid_cache()
+    for z in (np.sin(6*x)*np.cos(5*y), x*y): # the second z uses the cached weights
+        grid_x, grid_y, grid_z = array_to_grid(x, y, z, interpolation, interpolation_range=50, workers=2)
+        expected = griddata((x, y), z, (grid_x, grid_y), method=interpolation)
+
+        assert np.array_equal(np.isnan(grid_z), np.isnan(expected))
+        assert np.allclose(grid_z, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize('method', [ 'mean', 'minmax' ])
+def test_downsample_grid(method):
+    from uplot.utool.grid import downsample_grid
+
+    x, y = np.arange(1001), np.arange(501)
+    z = np.add.outer(np.sin(y / 50), np.cos(x / 50))
+    z[:10, :10] = np.nan # all-NaN block
+
+    x_out, y_out, z_out = downsample_grid(x, y, z, max_facets=100*50, method=method)
+    assert (len(y_out) - 1)*(len(x_out) - 1) <= 100*50
+    assert z_out.shape == (len(y_out), len(x_out))
+    assert x_out[0] < x_out[-1] and x_out[0] >= x[0] and x_out[-1] <= x[-1]
+    assert np.isnan(z_out[0, 0]) and np.count_nonzero(np.isnan(z_out)) == 1
+    if method == 'mean':
+        assert abs(np.nanmean(z_out) - np.nanmean(z)) < 1e-2
+    else:
+        assert np.all(np.isin(z_out[1:, 1:], z))
+
+    # within the limit: as is
+    assert downsample_grid(x, y, z, max_facets=z.size)[2] is z
+
+
+def test_surface3d_max_facets(monkeypatch):
+    import uplot
+
+    x, y = np.linspace(0, 1, 400), np.linspace(0, 1, 300)
+    z = np.add.outer(y, x)
+
+    fig = uplot.figure('mpl-nogui')
+    fig.surface3d(x, y, z, max_facets=30*30) # less than the default sampling of matplotlib
+    fig.internal.canvas.draw() # the 3D facets are projected on drawing
+    facets = len(fig.internal.axes[0].collections[0].get_paths())
+    assert 25*25 < facets <= 30*30
+    fig.close()
+
+    def not_called(*args, **kwargs):
+        raise AssertionError('the grid must not be reduced')
+
+    monkeypatch.setattr('uplot.utool.downsample_grid', not_called)
+    fig = uplot.figure('mpl-nogui')
+    fig.surface3d(x, y, z, max_facets=None)
+    fig.close()
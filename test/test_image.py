@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+import uplot
+
+
+def _engines() -> list[str]:
+    engines = [ 'mpl-nogui' ]
+    try:
+        import plotly # noqa: F401
+        import kaleido # noqa: F401
+        engines.append('plotly5')
+    except ImportError:
+        pass
+    return engines
+
+
+@pytest.fixture(params=_engines())
+def figure(request):
+    fig = uplot.figure(request.param)
+    fig.plot([ 0, 1, 2 ], [ 1, 0, 1 ])
+    yield fig
+    fig.close()
+
+
+def test_as_image_channels(figure):
+    rgb = figure.as_image(dpi=50, channels='rgb')
+    rgba = figure.as_image(dpi=50, channels='rgba')
+
+    assert rgb.dtype == rgba.dtype == np.uint8
+    assert rgb.ndim == 3 and rgb.shape[-1] == 3
+    assert rgba.shape == rgb.shape[:2] + (4,)
+    assert np.array_equal(rgba[..., :3], rgb)
+
+
+def test_as_image_out(figure):
+    expected = figure.as_image(dpi=50, channels='rgba')
+
+    out = np.zeros_like(expected)
+    assert figure.as_image(dpi=50, channels='rgba', out=out) is out
+    assert np.array_equal(out, expected)
+
+    # the same buffer for the next frame
+    figure.extend(figure.last_trace, [ 3 ], [ 2 ])
+    assert figure.as_image(dpi=50, channels='rgba', out=out) is out
+    assert not np.array_equal(out, expected)
+
+
+@pytest.mark.parametrize('out_shape, out_dtype', [
+    ((10, 10, 4), np.uint8),       # wrong size
+    (None, np.float32),            # wrong type
+    ('channels', np.uint8),        # wrong number of channels
+])
+def test_as_image_wrong_out(figure, out_shape, out_dtype):
+    shape = figure.as_image(dpi=50, channels='rgba').shape
+    if out_shape is None:
+        out_shape = shape
+    elif out_shape == 'channels':
+        out_shape = shape[:2] + (3,)
+
+    with pytest.raises(ValueError):
+        figure.as_image(dpi=50, channels='rgba', out=np.zeros(out_shape, dtype=out_dtype))
+
+
+def test_as_image_dpi():
+    fig = uplot.figure('mpl-nogui')
+    fig.plot([ 0, 1, 2 ], [ 1, 0, 1 ])
+    width, height = fig.internal.get_size_inches()
+    figure_dpi = fig.internal.dpi
+
+    # the canvas resolution (the figure dpi) and another resolution (rendered by `savefig()`)
+    for dpi in (figure_dpi, figure_dpi / 4, figure_dpi / 4, figure_dpi):
+        image = fig.as_image(dpi=dpi)
+        assert image.shape == (round(height*dpi), round(width*dpi), 4)
+        assert fig.internal.dpi == figure_dpi # restored after rendering
+
+    fig.close()
+
+
+@pytest.mark.parametrize('dtype', [ np.uint8, np.float32 ])
+def test_imshow_downsampling(monkeypatch, dtype):
+    fig = uplot.figure('mpl-nogui')
+    monkeypatch.setattr(fig.engine, 'IMAGE_DOWNSAMPLING', True)
+
+    # larger than the saving resolution, the size is not a multiple of the block size
+    height, width = (np.asarray(fig.internal.get_size_inches()[::-1]) * fig.engine.SAVING_DPI * 3.5).astype(int)
+    image = np.random.default_rng(0).integers(0, 256, size=(height, width)).astype(dtype)
+    fig.imshow(image)
+
+    shown = fig.internal.axes[0].get_images()[0]
+    reduced = shown.get_array()
+    assert reduced.shape == (-(-height // 3), -(-width // 3))
+    assert reduced.dtype == image.dtype
+
+    # the axes keep the original pixel coordinates and the area averaging keeps the mean
+    assert shown.get_extent() == [ -0.5, width - 0.5, height - 0.5, -0.5 ]
+    assert abs(float(np.mean(reduced)) - float(np.mean(image))) < 0.5
+    fig.close()
+
+
+@pytest.mark.parametrize('shape', [ (31, 17), (31, 17, 3), (31, 17, 4) ])
+def test_png16_round_trip(shape):
+    import io
+    from PIL import Image
+    from uplot.utool import image_encode_png
+
+    image = np.random.default_rng(0).integers(0, 2**16, size=shape).astype(np.uint16)
+    png = image_encode_png(image, value_range=2**16 - 1, bit_depth=16)
+
+    with Image.open(io.BytesIO(png)) as decoded:
+        assert decoded.size == (shape[1], shape[0])
+        decoded = np.asarray(decoded)
+
+    if image.ndim == 2:
+        assert decoded.dtype == np.uint16 and np.array_equal(decoded, image)
+    else:
+        # PIL reads 16-bit RGB(A) as 8-bit: the high bytes
+        assert np.array_equal(decoded, image >> 8)
+
+    # all 16 bits: the image data of the file
+    assert np.array_equal(_decode_png_samples(png, shape), image)
+
+
+def _decode_png_samples(png: bytes, shape: tuple) -> np.ndarray:
+    """
+    The samples of a non-interlaced 16-bit PNG without row filters.
+    """
+    import zlib
+    import struct
+
+    data, offset = b'', 8
+    while offset < len(png):
+        length, kind = struct.unpack('>I4s', png[offset:offset + 8])
+        if kind == b'IDAT':
+            data += png[offset + 8:offset + 8 + length]
+        offset += length + 12
+
+    rows = np.frombuffer(zlib.decompress(data), dtype=np.uint8).reshape(shape[0], -1)
+    assert np.all(rows[:, 0] == 0), 'row filters are not expected'
+    return rows[:, 1:].copy().view('>u2').reshape(shape).astype(np.uint16)
@@ -0,0 +1,11 @@
+import subprocess
+import sys
+
+
+def test_lazy_batch():
+    # batch rendering (multiprocessing) is imported on the first use only
+    code = ('import sys, uplot; '
+            'assert "uplot.batch" not in sys.modules; '
+            'uplot.batch.render; '
+            'assert "uplot.batch" in sys.modules')
+    subprocess.run([ sys.executable, '-c', code ], check=True)
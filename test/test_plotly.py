@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+import uplot
+
+
+pytest.importorskip('plotly')
+
+
+def test_scatter_many_colors():
+    from uplot.engine.plotly.plot import PALETTE_MAX_SIZE
+
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    fig = uplot.figure('plotly5')
+    fig.scatter(rng.random(n), rng.random(n), color=rng.random((n, 3)))
+
+    marker = fig.internal.data[0].marker
+    assert isinstance(marker.color, np.ndarray) and marker.color.dtype.kind == 'u'
+    assert len(marker.colorscale) <= PALETTE_MAX_SIZE
+    assert marker.line.color is None
+
+
+def test_bounds_direct_trace_edit():
+    fig = uplot.figure('plotly5')
+    fig.plot([1, 2, 3], [1, 2, 3])
+    fig.ylim() # the data bounds are indexed
+
+    fig.internal.data[0].x = [10, 20, 30]
+    fig.xlim()
+    assert fig.internal.layout.xaxis.range == (10, 30)
+
+
+def test_bounds_direct_traces_replace():
+    fig = uplot.figure('plotly5')
+    fig.plot([1, 2, 3], [1, 2, 3])
+    fig.ylim() # the data bounds are indexed
+
+    fig.internal.data = []
+    fig.plot(np.arange(50, 61), np.arange(50, 61))
+    fig.xlim()
+    assert fig.internal.layout.xaxis.range == (50, 60)
+
+
+def test_bounds_extend():
+    fig = uplot.figure('plotly5')
+    fig.plot([1, 2, 3], [1, 2, 3])
+    fig.ylim()
+
+    fig.extend(fig.last_trace, [4, 5], [-1, 7])
+    fig.xlim()
+    assert fig.internal.layout.xaxis.range == (1, 5)
+    assert fig._bounds.get('y', 'min') == -1 and fig._bounds.get('y', 'max') == 7
+
+
+def test_imshow_png_source():
+    import io
+    import base64
+    from PIL import Image
+
+    image = np.random.default_rng(0).integers(0, 2**16, size=(20, 30)).astype(np.uint16)
+
+    fig = uplot.figure('plotly5')
+    fig.imshow(image, bit_depth=16)
+    source = fig.internal.data[0].source
+    assert source.startswith('data:image/png;base64,')
+
+    with Image.open(io.BytesIO(base64.b64decode(source.split(',', 1)[1]))) as decoded:
+        assert np.array_equal(np.asarray(decoded), image)
@@ -0,0 +1,29 @@
+import pytest
+
+import uplot.plugin as plugin
+import uplot.plugin.manage as manage
+
+
+class DictPlugin(plugin.IPlotPlugin):
+
+    def extract_data(self, obj: dict) -> list[plugin.PlotData]:
+        return [ plugin.PlotData(x=list(obj.values())) ]
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    # isolated registry of plugins
+    monkeypatch.setattr(manage, 'REGISTERED_TYPES', { })
+    monkeypatch.setattr(manage, 'REGISTERED_CONTAINERS', set())
+    monkeypatch.setattr(manage, 'RESOLVED_TYPES', { })
+
+
+def test_generic_alias_not_container(registry):
+    # dict[K, V] is registered as is, its items are not inspected
+    assert plugin.register(dict[str, int], DictPlugin())
+    assert not plugin.is_container_registered(dict)
+
+    def plot(x, y=None, z=None, **kwargs):
+        pass
+
+    assert not plugin.plot(plot_method=plot, x={ 'a': 1 })
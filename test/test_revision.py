@@ -0,0 +1,72 @@
+import pytest
+
+import uplot
+
+
+@pytest.fixture
+def plotly_figure():
+    pytest.importorskip('plotly')
+
+    fig = uplot.figure('plotly5')
+    fig.plot([ 0, 1, 2 ], [ 1, 0, 1 ])
+    yield fig
+    fig.close()
+
+
+@pytest.mark.parametrize('edit', [
+    lambda fig: fig.update_layout(title='edited'),
+    lambda fig: fig.update_traces(line_color='red'),
+    lambda fig: fig.data[0].update(y=[ 0, 1, 0 ]),
+    lambda fig: setattr(fig.data[0], 'name', 'edited'),
+    lambda fig: setattr(fig.layout, 'template', 'plotly_dark'),
+    lambda fig: fig.plotly_restyle({ 'opacity': 0.5 }, 0),
+    lambda fig: fig.plotly_relayout({ 'xaxis.range': [ 0, 5 ] }),
+    lambda fig: fig.add_scatter(x=[ 0, 1 ], y=[ 1, 1 ]),
+    lambda fig: setattr(fig, 'data', fig.data[:0]),
+])
+def test_plotly_internal_edit(plotly_figure, edit, tmp_path):
+    # direct changes via plotly outdate the rendered outputs (the render cache must not be used):
+    # html outputs have random div ids, so a cached output is recognized by the same content
+    plotly_figure.save(tmp_path / 'before.html')
+    plotly_figure.save(tmp_path / 'cached.html')
+    assert (tmp_path / 'before.html').read_text() == (tmp_path / 'cached.html').read_text()
+    revision = plotly_figure.revision
+
+    edit(plotly_figure.internal)
+
+    assert plotly_figure.revision > revision
+    plotly_figure.save(tmp_path / 'after.html')
+    assert (tmp_path / 'before.html').read_text() != (tmp_path / 'after.html').read_text()
+
+
+def test_plotly_internal_batch_update(plotly_figure):
+    revision = plotly_figure.revision
+
+    with plotly_figure.internal.batch_update():
+        plotly_figure.internal.data[0].line.color = 'red'
+        plotly_figure.internal.layout.title = 'edited'
+
+    assert plotly_figure.revision > revision
+
+
+def test_plotly_unwatched_fallback(monkeypatch, tmp_path):
+    pytest.importorskip('plotly')
+    from uplot.engine.PlotlyFigure5 import CHANGE_MESSAGES
+
+    # a plotly version without one of the message stubs: the direct changes can't be tracked
+    monkeypatch.setattr('uplot.engine.PlotlyFigure5.CHANGE_MESSAGES', (*CHANGE_MESSAGES, '_send_unknown_msg'))
+
+    fig = uplot.figure('plotly5')
+    fig.plot([ 0, 1, 2 ], [ 1, 0, 1 ])
+    fig.ylim()
+
+    # the render cache is not used: each save renders the figure (html outputs have random div ids)
+    fig.save(tmp_path / 'first.html')
+    fig.save(tmp_path / 'second.html')
+    assert (tmp_path / 'first.html').read_text() != (tmp_path / 'second.html').read_text()
+
+    # the data bounds are rebuilt on each query
+    fig.internal.data[0].x = [ 10, 20, 30 ]
+    fig.xlim()
+    assert fig.internal.layout.xaxis.range == (10, 30)
+    fig.close()
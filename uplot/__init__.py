@@ -4,7 +4,7 @@ from uplot.info import __version__, __author__, __email__  # noqa: F401
 import uplot.engine as engine
 
 # interface
-from uplot.interface import IFigure, IPlotEngine
+from uplot.interface import IFigure, IPlotEngine, TraceHandle
 
 # main API function
 from uplot.plot import figure
@@ -13,7 +13,7 @@ from uplot.plot import figure
 import uplot.color as color
 
 # common types
-from uplot.utype import LineStyle, MarkerStyle, AspectMode, AxisScale, Colormap
+from uplot.utype import LineStyle, MarkerStyle, AspectMode, AxisScale, Colormap, ImageChannels
 
 # settings
 from uplot.default import DEFAULT
@@ -25,11 +25,13 @@ __all__ = [
 
     'engine',
     'color',
+    'batch',
 
     # interface
 
     'IFigure', 
     'IPlotEngine',
+    'TraceHandle',
     
     # functions
     
@@ -42,8 +44,18 @@ __all__ = [
     'AspectMode',
     'AxisScale', 
     'Colormap',
+    'ImageChannels',
 
     # variables / constants
 
     'DEFAULT'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    # batch rendering: imported on the first use (multiprocessing is not needed for `import uplot`)
+    if name == 'batch':
+        import uplot.batch as batch
+        return batch
+
+    raise AttributeError(f"module 'uplot' has no attribute '{name}'")
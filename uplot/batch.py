@@ -0,0 +1,138 @@
+import os
+import time
+import traceback
+import multiprocessing
+
+from typing import Any, Callable, Iterable, NamedTuple
+
+from uplot.interface import IFigure
+from uplot.default import DEFAULT
+
+
+class RenderTask(NamedTuple):
+    """
+    Specification of a figure for batch rendering.
+    """
+    build: Callable[..., Any]     # build(fig, **kwargs): plotting into the figure, must be picklable (top-level function)
+    filename: str                 # output file: png, jpg, svg, html, ...
+    kwargs: dict | None = None    # parameters for the build function
+    engine: str = 'mpl-nogui'     # engine name, see `uplot.engine.available()`
+    width: int = DEFAULT.figure_width
+    aspect_ratio: float = DEFAULT.figure_aspect_ratio
+
+
+class RenderResult(NamedTuple):
+    """
+    Result of a figure rendering.
+    """
+    filename: str
+    duration: float           # seconds: building + saving
+    error: str | None = None  # traceback if rendering failed
+    worker: int | None = None # worker process id
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def render(tasks               : Iterable[RenderTask],
+           workers             : int | None = None,
+           max_tasks_per_worker: int | None = 100,
+           on_result           : Callable[[RenderResult], None] | None = None,
+           start_method        : str | None = None) -> list[RenderResult]:
+    """
+    Render figures to files in parallel using a pool of worker processes.
+
+    Parameters
+    ----------
+    tasks : Iterable[RenderTask]
+        Figures to render.
+
+    workers : int or None, optional
+        The number of worker processes, by default the number of CPUs.
+        If 0, figures are rendered sequentially in the current process.
+
+    max_tasks_per_worker : int or None, optional
+        A worker is replaced by a new one after this number of tasks
+        to limit the memory growth (e.g. matplotlib caches). None means unlimited.
+
+    on_result : Callable or None, optional
+        Callback for reporting the progress, called in the main process for each finished figure.
+
+    start_method : str or None, optional
+        The multiprocessing start method: 'fork', 'spawn', 'forkserver' or None for the platform default.
+
+    Returns
+    -------
+    list[RenderResult]
+        Rendering results in the order of tasks. Failures are reported, not raised.
+
+    Examples
+    --------
+    >>> def build(fig, x, y):
+    ...     fig.plot(x, y)
+    >>> tasks = [ RenderTask(build, f'fig_{i}.png', kwargs=dict(x=x, y=y)) for i, (x, y) in enumerate(data) ]
+    >>> results = render(tasks, workers=8)
+    >>> failed = [ r for r in results if not r.ok ]
+    """
+    tasks = list(tasks)
+    results: list[RenderResult | None] = [ None ] * len(tasks)
+
+    if len(tasks) == 0:
+        # nothing to render: no worker processes
+        return [ ]
+
+    if workers == 0:
+        # sequential rendering: useful for debugging
+        completed = map(_render_indexed, enumerate(tasks))
+        for index, result in completed:
+            results[index] = result
+            if on_result is not None:
+                on_result(result)
+        return results
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+
+    context = multiprocessing.get_context(start_method)
+    with context.Pool(processes=workers, maxtasksperchild=max_tasks_per_worker) as pool:
+        for index, result in pool.imap_unordered(_render_indexed, enumerate(tasks)):
+            results[index] = result
+            if on_result is not None:
+                on_result(result)
+
+    return results
+
+
+def render_task(task: RenderTask) -> RenderResult:
+    """
+    Render one figure to the file in the current process.
+    """
+    import uplot
+
+    start = time.perf_counter()
+    fig: IFigure | None = None
+    error = None
+
+    try:
+        fig = uplot.figure(engine=task.engine, width=task.width, aspect_ratio=task.aspect_ratio)
+        task.build(fig, **(task.kwargs or {}))
+        fig.save(task.filename)
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        if fig is not None:
+            fig.close()
+
+    return RenderResult(filename=task.filename,
+                        duration=time.perf_counter() - start,
+                        error=error,
+                        worker=os.getpid())
+
+
+## Protected ##
+
+def _render_indexed(indexed_task: tuple[int, RenderTask]) -> tuple[int, RenderResult]:
+    index, task = indexed_task
+    return index, render_task(task)
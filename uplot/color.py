@@ -1,4 +1,6 @@
 import numpy as np
+from functools import lru_cache
+from numpy.typing import ArrayLike
 from typing import overload
 from typing import OrderedDict, Sequence
 
@@ -90,7 +92,7 @@ def rgb_to_str(rgb: list | np.ndarray) -> str | list[str]:
     assert rgb.max() <= 1.0, 'RGB value range must be [0, 1]'
 
     rgb255 = (rgb*255).astype(np.uint8)
-    rgb_str = [ f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}' for rgb in rgb255 ]
+    rgb_str = _hex_strings(rgb255).tolist()
 
     if len(rgb) == 1:
         return rgb_str[0]  # single RGB value
@@ -98,6 +100,141 @@ def rgb_to_str(rgb: list | np.ndarray) -> str | list[str]:
     return rgb_str  # RGB array
 
 
+@lru_cache(maxsize=1024)
+def hex_to_rgba(color: str) -> tuple[float, float, float, float]:
+    """
+    Convert a color name or a hex string (#rgb, #rrggbb, #rrggbbaa) to an RGBA tuple in the [0, 1] range.
+    """
+    hex_str = name_to_hex(color).lstrip('#')
+
+    if len(hex_str) == 3:
+        hex_str = ''.join(2*c for c in hex_str)
+
+    if len(hex_str) == 6:
+        hex_str += 'ff'
+
+    if len(hex_str) != 8:
+        raise LookupError(f'{color} is not a valid hex color')
+
+    r, g, b, a = (int(hex_str[i:i + 2], 16) / 255 for i in range(0, 8, 2))
+    return r, g, b, a
+
+
+def to_rgba_array(colors: ArrayLike) -> np.ndarray:
+    """
+    Convert per-point colors to a dense RGBA array without per-point Python processing.
+
+    Parameters
+    ----------
+    colors : ArrayLike
+        Array of color names or hex strings (N), including object arrays (e.g. pandas Series),
+        or RGB(A) values (N x 3 or N x 4): in the [0, 1] range, or uint8 (integers above 1) in the [0, 255] range.
+
+    Returns
+    -------
+    np.ndarray
+        RGBA array (N x 4) of float values in the [0, 1] range.
+    """
+    if isinstance(colors, (list, tuple)) and len(colors) > 0 and isinstance(colors[0], str):
+        return _names_to_rgba(colors)
+
+    colors = np.asarray(colors)
+
+    if colors.dtype.kind == 'O' and colors.ndim == 1:
+        # object array (e.g. pandas Series): names or hex strings, otherwise RGB(A) tuples
+        if len(colors) > 0 and isinstance(colors[0], str):
+            return _names_to_rgba(colors)
+        colors = np.array(colors.tolist())
+
+    if colors.dtype.kind in 'US':
+        # names or hex strings: resolve unique values only
+        assert colors.ndim == 1, 'Input must be a 1D array of color strings'
+        unique, inverse = np.unique(colors, return_inverse=True)
+        palette = np.array([ hex_to_rgba(str(c)) for c in unique ]).reshape(-1, 4)
+        return palette[inverse.ravel()]
+
+    assert colors.ndim == 2 and colors.shape[1] in (3, 4), 'Input must be an Nx3 or Nx4 array'
+
+    if colors.dtype == np.uint8 or (colors.dtype.kind in 'iu' and colors.size > 0 and colors.max() > 1):
+        # [0, 255] range: uint8 or integer values above 1
+        assert colors.min() >= 0 and colors.max() <= 255, 'RGB value range must be [0, 255]'
+        colors = colors / 255
+    else:
+        # [0, 1] range: float or integer values (e.g. (1, 0, 0))
+        colors = colors.astype(np.float64, copy=False)
+        assert colors.size == 0 or (colors.min() >= 0.0 and colors.max() <= 1.0), 'RGB value range must be [0, 1]'
+
+    if colors.shape[1] == 3:
+        # opaque colors
+        return np.column_stack([colors, np.ones(len(colors))])
+
+    return colors
+
+
+def to_palette(rgba: np.ndarray, max_size: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compact representation of per-point colors: a palette of unique colors and an index for each point.
+    Colors are compared with 8-bit precision. If there are more than **max_size** unique colors,
+    the channels are quantized to fewer levels (7, 6, ... bits) until the palette fits.
+
+    Parameters
+    ----------
+    rgba : np.ndarray
+        RGBA array (N x 4) in the [0, 1] range, see `to_rgba_array()`.
+
+    max_size : int or None, optional
+        The max number of palette colors (at least 16), by default unlimited.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Palette (K x 4) of uint8 RGBA values and index (N) of the smallest suitable integer type.
+    """
+    assert max_size is None or max_size >= 16, 'the palette size must be at least 16 colors'
+
+    levels = 256
+    while True:
+        # the extreme values (black, white, opaque) are kept exactly
+        quantized = np.round(rgba * (levels - 1)).astype(np.uint32)
+        # pack RGBA to a single integer for fast search of unique values
+        packed = (quantized[:, 0] << 24) | (quantized[:, 1] << 16) | (quantized[:, 2] << 8) | quantized[:, 3]
+        unique, index = np.unique(packed, return_inverse=True)
+
+        if max_size is None or len(unique) <= max_size:
+            break
+        levels //= 2 # 2 levels per channel always fit: 16 colors
+
+    palette = np.column_stack([ (unique >> shift) & 0xff for shift in (24, 16, 8, 0) ])
+    palette = np.round(palette * (255 / (levels - 1))).astype(np.uint8)
+    index_type = np.uint8 if len(unique) <= 256 else np.uint16 if len(unique) <= 65536 else np.uint32
+
+    return palette, index.ravel().astype(index_type)
+
+
+def _names_to_rgba(colors: Sequence[str] | np.ndarray) -> np.ndarray:
+    """
+    RGBA array (N x 4) of the color names or hex strings: resolve unique values only.
+    """
+    codes: dict[str, int] = {}
+    index = np.fromiter((codes.setdefault(c, len(codes)) for c in colors), dtype=np.intp, count=len(colors))
+    palette = np.array([ hex_to_rgba(c) for c in codes ]).reshape(-1, 4)
+    return palette[index]
+
+
+def _hex_strings(rgb255: np.ndarray) -> np.ndarray:
+    """
+    Vectorized conversion of uint8 RGB values (N x 3) to hex strings: '#rrggbb'.
+    """
+    digits = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+
+    chars = np.empty((len(rgb255), 7), dtype=np.uint8)
+    chars[:, 0] = ord('#')
+    chars[:, 1::2] = digits[rgb255 >> 4]
+    chars[:, 2::2] = digits[rgb255 & 0x0f]
+
+    return chars.view('S7').ravel().astype(str)
+
+
 class ColorScroller:
     """
     Class for maintaining automatic color switching for plotting.
@@ -7,6 +7,7 @@ class Default:
     figure_aspect_ratio: float = 0.6
     style              : str = 'bmh'
     marker_size        : int = 6
+    reduction_workers  : int = 1   # threads reducing out-of-core (np.memmap, chunked) series
 
 
 DEFAULT = Default()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import importlib.util
 from uplot.interface import IPlotEngine, IFigure
+from uplot.utool import RenderCache
 
 
 class MatplotEngine(IPlotEngine):
@@ -8,12 +9,31 @@ class MatplotEngine(IPlotEngine):
     SAVING_DPI = SHOWING_DPI * 2
     LEGEND_MARKER_SIZE = 8
 
+    # redraw only changed (extended) data series over the cached background
+    BLITTING = True
+
+    # imshow: large images are reduced (area averaging by an integer factor) to the saving resolution,
+    # the axes keep the coordinates of the original image
+    IMAGE_DOWNSAMPLING = False
+
+    # bar: series of at least N bars are drawn as a single collection (not a patch per bar)
+    BAR_COLLECTION_THRESHOLD = 100
+
+    # surface3d: level of detail, uniform grids are reduced by blocks to at most N facets
+    # (`surface3d(..., max_facets='auto')` uses this limit), None - no limit
+    SURFACE_MAX_FACETS: int | None = 100 * 100
+
+    # memory limit (bytes) of the rendered images and files of unchanged figures, 0 - no caching
+    RENDER_CACHE_SIZE = 256 * 2**20
+
     # automatically (default) chosen matplotlib backend
     AUTOMATIC_MPL_BACKEND: str | None = None
 
     @property
     def name(self) -> str:
-        return f'matplotlib-{self._backend.title().lower()}'
+        # the engine with the automatic backend is named without the backend:
+        # the name is known before matplotlib is imported, see `EngineFactory`
+        return 'matplotlib' if self._is_automatic_backend else f'matplotlib-{self._backend.lower()}'
 
     @classmethod
     def is_available(cls) -> bool:
@@ -27,6 +47,11 @@ class MatplotEngine(IPlotEngine):
     def mpl(self):
         return self._mpl
 
+    @property
+    def render_cache(self) -> RenderCache:
+        self._render_cache.max_bytes = self.RENDER_CACHE_SIZE
+        return self._render_cache
+
     @property
     def is_ipython_backend(self) -> bool:
        return ('inline' in self.mpl.get_backend() or
@@ -49,10 +74,12 @@ class MatplotEngine(IPlotEngine):
             # save default matplotlib backend for future use
             self.AUTOMATIC_MPL_BACKEND = mpl.get_backend()
 
+        self._is_automatic_backend = backend is None
         if backend is None:
             backend = self.AUTOMATIC_MPL_BACKEND
 
         self._backend = backend
+        self._render_cache = RenderCache(max_bytes=self.RENDER_CACHE_SIZE)
 
     def figure(self, width: int, aspect_ratio: float) -> IFigure:
         from uplot.engine.MatplotFigure import MatplotFigure
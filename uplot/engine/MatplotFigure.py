@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import contextlib
 import numpy as np
 from numpy import ndarray
 from numpy.typing import ArrayLike
-from typing import Any
+from typing import Any, Literal
 
 import uplot.color as ucolor
 import uplot.utool as utool
 import uplot.plugin as plugin
 
-from uplot.interface import IFigure, LineStyle, MarkerStyle, AspectMode, AxisScale, Colormap
+from uplot.interface import IFigure, LineStyle, MarkerStyle, AspectMode, AxisScale, Colormap, ImageChannels
+from uplot.interface import TraceHandle
 from uplot.engine.MatplotEngine import MatplotEngine
-from uplot.utool import Interpolator
+from uplot.utool import Interpolator, Decimation, GridDownsampling
 from uplot.default import DEFAULT
 
 
@@ -23,19 +25,31 @@ class MatplotFigure(IFigure):
 
     @property
     def internal(self):
+        self._sync_series() # the figure content is up to date for direct use
         return self._fig
 
     @property
     def is_3d(self) -> bool | None:
         return self._is_3d
 
+    @property
+    def last_trace(self) -> TraceHandle | None:
+        return self._traces[-1] if len(self._traces) > 0 else None
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
     def __init__(self, engine: MatplotEngine, width: int, aspect_ratio: float):
         from matplotlib.figure import Figure
 
         # temporary styling (no global effect):
         # https://matplotlib.org/stable/users/explain/customizing.html
         with engine.plt.style.context(DEFAULT.style):
-            self._fig: Figure | None = engine.plt.figure(dpi=engine.SHOWING_DPI, layout='constrained')
+            # offscreen figures are rendered with the saving resolution only (e.g. `as_image()`)
+            dpi = engine.SHOWING_DPI if engine.is_gui_backend or engine.is_ipython_backend else engine.SAVING_DPI
+
+            self._fig: Figure | None = engine.plt.figure(dpi=dpi, layout='constrained')
             # constrained layout automatically adjusts subplots so that decorations like tick labels,
             # legends, and colorbars do not overlap, while still preserving the logical layout requested by the user.
             # constrained layout is similar to Tight layout, but is substantially more flexible.
@@ -44,11 +58,24 @@ class MatplotFigure(IFigure):
             self._fig.set_figheight(aspect_ratio*(width / engine.SHOWING_DPI))
 
         self._engine = engine
+        self._revision = 0 # incremented by each change of the figure, see `utool.mutating`
+        self._rendered_revision = None # the revision of the last rendering (`as_image()`, `save()`)
+        self._is_rendering = False
+        self._cache_owner = object() # key of the figure outputs in the engine render cache
+
+        # changes made directly via matplotlib (`internal`, GUI pan/zoom, ...) mark the figure as stale
+        self._stale_callback = self._fig.stale_callback
+        self._fig.stale_callback = self._on_stale
         self._color_scroller = ucolor.ColorScroller()
         self._is_3d = None
         self._init_axis(is_3d=False)
-        self._bars = [ ]
+        self._bars = None # BarLayout
+        self._traces: list[TraceHandle] = [ ]
+        self._series: dict[int, utool.SeriesBuffer] = { }
+        self._pending: set[int] = set() # extended series not passed to their artists yet
+        self._blit = None
 
+    @utool.mutating
     def plot(self, x           : ArrayLike,
                    y           : ArrayLike | None = None,
                    z           : ArrayLike | None = None,
@@ -59,6 +86,7 @@ class MatplotFigure(IFigure):
                    marker_size : float | None = None,
                    opacity     : float = 1.0,
                    legend_group: str | None = None,
+                   decimate    : Decimation | None = None,
                    **kwargs) -> IFigure:
         from uplot.engine.matplot.plot import plot_line_marker
 
@@ -72,6 +100,7 @@ class MatplotFigure(IFigure):
                        marker_size=marker_size,
                        opacity=opacity,
                        legend_group=legend_group,
+                       decimate=decimate,
                        **kwargs):
             return self
 
@@ -82,26 +111,31 @@ class MatplotFigure(IFigure):
         if color is None:
             color = self.scroll_color()
 
-        plot_line_marker(axis=axis,
-                         x=x, y=y, z=z,
-                         name=name,
-                         color=color,
-                         line_style=line_style,
-                         marker_style=marker_style,
-                         marker_size=marker_size,
-                         opacity=opacity,
-                         **kwargs)
+        artist = plot_line_marker(axis=axis,
+                                  x=x, y=y, z=z,
+                                  name=name,
+                                  color=color,
+                                  line_style=line_style,
+                                  marker_style=marker_style,
+                                  marker_size=marker_size,
+                                  opacity=opacity,
+                                  decimate=decimate,
+                                  n_pixels=self._pixel_width(),
+                                  **kwargs)
+        self._traces.append(TraceHandle(index=len(self._traces), internal=artist))
         return self
 
+    @utool.mutating
     def scatter(self, x           : ArrayLike,
                       y           : ArrayLike | None = None,
                       z           : ArrayLike | None = None,
                       name        : str | None = None,
-                      color       : str | list[str] | None = None,
+                      color       : str | ArrayLike | None = None,
                       marker_style: MarkerStyle | None = None,
                       marker_size : float | None = None,
                       opacity     : float = 1.0,
                       legend_group: str | None = None,
+                      decimate    : Decimation | None = None,
                       **kwargs) -> IFigure:
         from uplot.engine.matplot.plot import plot_line_marker
 
@@ -114,6 +148,7 @@ class MatplotFigure(IFigure):
                        marker_size=marker_size,
                        opacity=opacity,
                        legend_group=legend_group,
+                       decimate=decimate,
                        **kwargs):
             return self
 
@@ -124,17 +159,21 @@ class MatplotFigure(IFigure):
         if color is None:
             color = self.scroll_color()
 
-        plot_line_marker(axis=axis,
-                         x=x, y=y, z=z,
-                         name=name,
-                         color=color,
-                         line_style=' ',  # no line (scatter mode)
-                         marker_style=marker_style,
-                         marker_size=marker_size,
-                         opacity=opacity,
-                         **kwargs)
+        artist = plot_line_marker(axis=axis,
+                                  x=x, y=y, z=z,
+                                  name=name,
+                                  color=color,
+                                  line_style=' ',  # no line (scatter mode)
+                                  marker_style=marker_style,
+                                  marker_size=marker_size,
+                                  opacity=opacity,
+                                  decimate=decimate,
+                                  n_pixels=self._pixel_width(),
+                                  **kwargs)
+        self._traces.append(TraceHandle(index=len(self._traces), internal=artist))
         return self
 
+    @utool.mutating
     def hline(self, y           : float,
                     x_min       : float | None = None,
                     x_max       : float | None = None,
@@ -162,6 +201,7 @@ class MatplotFigure(IFigure):
                          legend_group=legend_group,
                          **kwargs)
 
+    @utool.mutating
     def vline(self, x           : float,
                     y_min       : float | None = None,
                     y_max       : float | None = None,
@@ -188,6 +228,67 @@ class MatplotFigure(IFigure):
                          legend_group=legend_group,
                          **kwargs)
 
+    @utool.mutating
+    def extend(self, trace     : TraceHandle,
+                     x         : ArrayLike,
+                     y         : ArrayLike | None = None,
+                     max_points: int | None = None) -> IFigure:
+        assert self._fig is not None, 'figure is closed'
+
+        if self.is_3d:
+            raise RuntimeError('3D figure is not supported')
+
+        from matplotlib.lines import Line2D
+
+        artist = trace.internal
+        series = self._series.get(trace.index)
+        if series is None or series.max_points != max_points:
+            # the first extension or the storage change: copy plotted data to the buffer
+            if series is not None:
+                x_data, y_data = series.x, series.y
+            elif isinstance(artist, Line2D):
+                x_data, y_data = artist.get_xdata(orig=True), artist.get_ydata(orig=True)
+            else:
+                offsets = artist.get_offsets()
+                x_data, y_data = offsets[:, 0], offsets[:, 1]
+            series = utool.SeriesBuffer(x_data, y_data, max_points=max_points)
+            self._series[trace.index] = series
+
+        x, y = series.extend(x, y)
+
+        # matplotlib artists replace and recache the whole data on update (there is no appending):
+        # the artist is updated once before the next drawing, see `_sync_series()`
+        self._pending.add(trace.index)
+
+        if series.max_points is None:
+            # expand the data limits by the new samples only (no full rescan)
+            self._axis.update_datalim(np.column_stack([self._axis.convert_xunits(x),
+                                                       self._axis.convert_yunits(y)]))
+        else:
+            # sliding window: the oldest samples are dropped, the limits must follow the window
+            self._sync_series()
+            self._axis.relim()
+        self._axis.autoscale_view()
+
+        blit = self._blit_manager()
+        if blit is not None:
+            # the series is redrawn separately from the static background
+            blit.add_artist(artist)
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        if type(self._fig.canvas) is not FigureCanvasAgg:
+            # interactive canvas: the series is shown now (the drawing is O(history) anyway)
+            self._sync_series()
+            if blit is not None and blit.is_valid():
+                # only the changed series over the cached background
+                blit.update()
+            else:
+                # full redraw when the GUI is idle (once for many changes)
+                self._fig.canvas.draw_idle()
+
+        return self
+
+    @utool.mutating
     def surface3d(self, x            : ArrayLike | Any,
                         y            : ArrayLike | None = None,
                         z            : ArrayLike | None = None,
@@ -196,8 +297,10 @@ class MatplotFigure(IFigure):
                         colormap     : Colormap = 'viridis',
                         opacity      : float = 1.0,
                         interpolation: Interpolator = 'cubic',
-                        interpolation_range: int = 100,
+                        interpolation_range: int | None = 100,
                         legend_group : str | None = None,
+                        max_facets   : int | Literal['auto'] | None = 'auto',
+                        downsampling : GridDownsampling = 'mean',
                         **kwargs) -> IFigure:
         assert self._fig is not None, 'figure is closed'
 
@@ -211,6 +314,8 @@ class MatplotFigure(IFigure):
                        interpolation=interpolation,
                        interpolation_range=interpolation_range,
                        legend_group=legend_group,
+                       max_facets=max_facets,
+                       downsampling=downsampling,
                        **kwargs):
             return self
 
@@ -220,15 +325,25 @@ class MatplotFigure(IFigure):
         assert x.ndim == y.ndim == 1, 'x, y must be 1D arrays'
         assert z.ndim == 1 or z.ndim == 2, 'z must be 1D or 2D array'
 
+        if max_facets == 'auto':
+            max_facets = self.engine.SURFACE_MAX_FACETS
+
         if z.ndim == 2:
             # uniform grid
             assert (len(y), len(x)) == z.shape, 'uniform grid: x and y range must match z'
-            x, y = np.meshgrid(x, y)
         else:
             # non-uniform grid - array of points (x, y, z)
             x, y, z = utool.array_to_grid(x, y, z,
                                           interpolation=interpolation,
                                           interpolation_range=interpolation_range)
+            x, y = x[0, :], y[:, 0]
+
+        is_downsampled = False
+        if max_facets is not None:
+            # level of detail: large grids are reduced by blocks
+            n_points = z.size
+            x, y, z = utool.downsample_grid(x, y, z, max_facets=max_facets, method=downsampling)
+            is_downsampled = z.size < n_points
 
         axis = self._init_axis(is_3d=True)
 
@@ -237,7 +352,13 @@ class MatplotFigure(IFigure):
 
         cmap = self.engine.mpl.colormaps[colormap.lower()]
 
-        surf = axis.plot_surface(x, y, z,
+        if is_downsampled and not any(key in kwargs for key in ('rstride', 'cstride', 'rcount', 'ccount')):
+            # all rows/columns of the downsampled grid (it's already within `max_facets`),
+            # otherwise matplotlib's default sampling is kept
+            kwargs.update(rcount=z.shape[0], ccount=z.shape[1])
+
+        # the grid coordinates are broadcast (views), not expanded to 2D arrays
+        surf = axis.plot_surface(x[None, :], y[:, None], z,
                                  label=name,
                                  cmap=cmap,
                                  # antialiased=False: to fix some of z-order issues (not all of them)
@@ -250,6 +371,7 @@ class MatplotFigure(IFigure):
 
         return self
 
+    @utool.mutating
     def bar(self, x           : ArrayLike,
                   y           : ArrayLike | None = None,
                   name        : str | None = None,
@@ -273,41 +395,44 @@ class MatplotFigure(IFigure):
         if color is None:
             color = self.scroll_color()
 
-        # update bar params
-        total_width = kwargs.pop('width', 0.8)
-        bar_ofs = (1 - total_width) / 2
+        from uplot.engine.matplot.bar import BarLayout, bar_collection, COLLECTION_KWARGS
+
+        # the group of bars of the axis: positions and widths are updated once before drawing
+        if self._bars is None or self._bars.axes is not axis:
+            self._bars = BarLayout()
+            axis.add_artist(self._bars)
 
+        total_width = kwargs.pop('width', 0.8)
         bar_idx = len(self._bars)
-        bar_width = total_width / (bar_idx + 1)
-
-        # adjust pos and widths of existing bars
-        for idx, bar_i in enumerate(self._bars):
-            x_idx = np.arange(len(bar_i.patches))
-            bar_pos = x_idx + bar_ofs + idx*bar_width
-            for j in range(len(bar_i.patches)):
-                bar_i.patches[j].set_x(bar_pos[j] - bar_width/2)
-                bar_i.patches[j].set_width(bar_width)
-
-        # add new bar
-        x_idx = np.arange(len(y))
-        bar_pos = x_idx + bar_ofs + bar_idx*bar_width
-
-        rects = axis.bar(bar_pos, y,
-                         width=bar_width,
-                         color=ucolor.name_to_hex(color),
-                         alpha=opacity,
-                         label=name,
-                         **kwargs)
+        bar_pos, bar_width = self._bars.bar_position(len(y), bar_idx, bar_idx + 1, total_width)
+
+        if len(y) >= self.engine.BAR_COLLECTION_THRESHOLD and set(kwargs) <= COLLECTION_KWARGS:
+            # many bars: a single collection instead of a patch per bar
+            rects = bar_collection(axis, bar_pos, y,
+                                   width=bar_width,
+                                   facecolor=ucolor.name_to_hex(color),
+                                   alpha=opacity,
+                                   label=name,
+                                   **kwargs)
+            heights = y
+        else:
+            rects = axis.bar(bar_pos, y,
+                             width=bar_width,
+                             color=ucolor.name_to_hex(color),
+                             alpha=opacity,
+                             label=name,
+                             **kwargs)
+            heights = None
 
         # set ticks names: str or numbers
-        axis.set_xticks(x_idx - bar_width/2 + 0.5, x)
+        axis.set_xticks(np.arange(len(y)) - bar_width/2 + 0.5, x)
 
-        # save bar for future adjustments
-        self._bars.append(rects)
+        self._bars.add(rects, total_width, heights=heights)
 
         return self
 
-    def imshow(self, image: ArrayLike, **kwargs) -> IFigure:
+    @utool.mutating
+    def imshow(self, image: ArrayLike, value_range: float | None = None, **kwargs) -> IFigure:
         image = np.asarray(image)
 
         if 'vmin' in kwargs or 'vmax' in kwargs:
@@ -315,16 +440,28 @@ class MatplotFigure(IFigure):
             # the image range provided directly
             vmin = kwargs.pop('vmin', None)
             vmax = kwargs.pop('vmax', None)
+            normalize_rgb = False
         else:
-            # test the image for type and convert to [0, 1] range
-            image = image / utool.image_range(image)
+            # test the image for type, the range is applied by matplotlib (no copy of the image)
             vmin = 0.0
-            vmax = 1.0
+            vmax = utool.image_range(image) if value_range is None else value_range
+            normalize_rgb = image.ndim == 3 and not _is_rgb_range(image, vmax)
+
+        # the coordinates of the original image pixels (the image could be downsampled)
+        extent = (-0.5, image.shape[1] - 0.5, image.shape[0] - 0.5, -0.5)
+        if self.engine.IMAGE_DOWNSAMPLING:
+            image = self._downsample_image(image)
+
+        if normalize_rgb:
+            # vmin/vmax are ignored by matplotlib for RGB(A) images: float [0, 1] or uint8 is required
+            image = image.astype(np.float32)
+            image /= vmax
 
         axis = self._init_axis(is_3d=False)
         axis.imshow(image,
             cmap=kwargs.pop('cmap', self.engine.plt.get_cmap('gray')),
             vmin=vmin, vmax=vmax,
+            extent=kwargs.pop('extent', extent),
             interpolation=kwargs.pop('interpolation', 'none')
         )
 
@@ -336,10 +473,12 @@ class MatplotFigure(IFigure):
 
         return self
 
+    @utool.mutating
     def title(self, text: str) -> IFigure:
         self._axis.set_title(label=text)
         return self
 
+    @utool.mutating
     def legend(self, show: bool = True,
                      equal_marker_size: bool = True,
                      **kwargs) -> IFigure:
@@ -387,18 +526,22 @@ class MatplotFigure(IFigure):
 
         return self
 
+    @utool.mutating
     def grid(self, show: bool = True) -> IFigure:
         self._axis.grid(visible=show, which='both')
         return self
 
+    @utool.mutating
     def xlabel(self, text: str) -> IFigure:
         self._axis.set_xlabel(xlabel=text)
         return self
 
+    @utool.mutating
     def ylabel(self, text: str) -> IFigure:
         self._axis.set_ylabel(ylabel=text)
         return self
 
+    @utool.mutating
     def zlabel(self, text: str) -> IFigure:
         if self.is_3d:
             from mpl_toolkits.mplot3d import Axes3D
@@ -406,16 +549,19 @@ class MatplotFigure(IFigure):
             self._axis.set_zlabel(zlabel=text)
         return self
 
+    @utool.mutating
     def xlim(self, min_value: float | None = None,
                    max_value: float | None = None) -> IFigure:
         self._axis.set_xlim(left=min_value, right=max_value)
         return self
 
+    @utool.mutating
     def ylim(self, min_value: float | None = None,
                    max_value: float | None = None) -> IFigure:
         self._axis.set_ylim(bottom=min_value, top=max_value)
         return self
 
+    @utool.mutating
     def zlim(self, min_value: float | None = None,
                    max_value: float | None = None) -> IFigure:
         if self.is_3d:
@@ -424,6 +570,7 @@ class MatplotFigure(IFigure):
             self._axis.set_zlim(bottom=min_value, top=max_value)
         return self
 
+    @utool.mutating
     def xscale(self, scale: AxisScale, base: float = 10) -> IFigure:
         if scale == 'linear':
             self._axis.set_xscale(scale)
@@ -431,6 +578,7 @@ class MatplotFigure(IFigure):
             self._axis.set_xscale(scale, base=base)
         return self
 
+    @utool.mutating
     def yscale(self, scale: AxisScale, base: float = 10) -> IFigure:
         if scale == 'linear':
             self._axis.set_yscale(scale)
@@ -448,38 +596,95 @@ class MatplotFigure(IFigure):
         self._color_scroller.reset()
         return self
 
+    @utool.mutating
     def axis_aspect(self, mode: AspectMode) -> IFigure:
         # https://stackoverflow.com/questions/8130823/set-matplotlib-3d-plot-aspect-ratio
         self._axis.set_aspect(aspect=mode)
         return self
 
-    def as_image(self) -> ndarray:
+    def as_image(self, dpi     : float | None = None,
+                       channels: ImageChannels | None = None,
+                       out     : ndarray | None = None) -> ndarray:
         assert self._fig is not None, 'figure is closed'
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
 
         fig = self._fig
+        self._sync_series()
 
-        fig.set_dpi(self.engine.SAVING_DPI)
+        if dpi is None:
+            dpi = self.engine.SAVING_DPI
+        if channels is None:
+            channels = 'rgba' # the canvas buffer layout
 
-        fig.canvas.draw()
+        # the figure is not changed since the last rendering
+        cache = self.engine.render_cache
+        cached = cache.get(self._cache_owner, self._revision, ('image', dpi))
+        if cached is not None:
+            return utool.image_to_channels(cached, channels, out)
 
-        from matplotlib.backends.backend_agg import FigureCanvasAgg
-        assert isinstance(fig.canvas, FigureCanvasAgg)
+        # the image is cached only if the figure is rendered unchanged again (no copies for changing figures)
+        is_unchanged = self._rendered_revision == self._revision
 
-        image = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
+        if fig.dpi == dpi and isinstance(fig.canvas, FigureCanvasAgg):
+            # the canvas resolution: redraw only the changed series if possible (blitting)
+            with self._rendering():
+                self._redraw()
+            rgba = np.asarray(fig.canvas.buffer_rgba())
+            if is_unchanged:
+                self._cache_image(dpi, rgba)
+            return utool.image_to_channels(rgba, channels, out)
 
-        w, h = fig.canvas.get_width_height()
-        return image.reshape([h, w, 4])
+        # rendering with the requested resolution: the figure dpi and canvas are restored by matplotlib
+        from uplot.engine.matplot.raster import RasterWriter
+
+        def consume(rgba: ndarray):
+            if is_unchanged:
+                self._cache_image(dpi, rgba)
+            images.append(utool.image_to_channels(rgba, channels, out))
+
+        images = [ ]
+        with self._rendering():
+            fig.savefig(RasterWriter(consume), format='raw', dpi=dpi)
+
+        return images[0]
 
     def save(self, filename: str):
         assert self._fig is not None, 'figure is closed'
-        self._fig.savefig(filename, dpi=self.engine.SAVING_DPI)
-
+        import io
+        import os
+
+        filename = os.fspath(filename)
+        format = os.path.splitext(filename)[1][1:].lower()
+        if not format:
+            # as matplotlib: the default format, the extension is appended
+            format = self.engine.mpl.rcParams['savefig.format']
+            filename = f'{filename}.{format}'
+
+        cache = self.engine.render_cache
+        content = cache.get(self._cache_owner, self._revision, ('file', format))
+
+        if content is None:
+            self._sync_series()
+            with io.BytesIO() as stream, self._rendering():
+                self._fig.savefig(stream, format=format, dpi=self.engine.SAVING_DPI)
+                content = stream.getvalue()
+            cache.put(self._cache_owner, self._revision, ('file', format), content)
+
+        with open(filename, 'wb') as file:
+            file.write(content)
+
+    @utool.mutating
     def close(self):
+        if self._blit is not None:
+            self._blit.disconnect()
+            self._blit = None
         self.engine.plt.close(self._fig)
+        self.engine.render_cache.clear(self._cache_owner)
         self._fig = None
 
     def show(self, block: bool=True):
         assert self._fig is not None, 'figure is closed'
+        self._sync_series()
 
         if self.engine.is_ipython_backend:
             # there are two ways for consistent figure visualization in jupyter
@@ -501,6 +706,115 @@ class MatplotFigure(IFigure):
                 self._fig.waitforbuttonpress()
 
 
+    def _blit_manager(self):
+        """
+        Get or create the blit manager, None if blitting is disabled or not supported by the canvas.
+        """
+        if self._blit is None and self.engine.BLITTING and self._fig.canvas.supports_blit:
+            from uplot.engine.matplot.blit import BlitManager
+            self._blit = BlitManager(self._fig)
+
+        return self._blit
+
+    def _redraw(self):
+        """
+        Render the figure: full drawing or blitting of the changed series only.
+        """
+        if self._blit is not None:
+            self._blit.update()
+        else:
+            self._fig.canvas.draw()
+
+    def _sync_series(self):
+        """
+        Pass the extended series to their artists. `extend()` only appends to the buffers (O(new samples)),
+        the whole data of an artist is replaced once per drawing instead of once per extension.
+        """
+        if len(self._pending) == 0 or self._fig is None:
+            return
+
+        from matplotlib.lines import Line2D
+
+        # the change is already counted by `extend()`
+        is_rendering, self._is_rendering = self._is_rendering, True
+        try:
+            for index in self._pending:
+                artist = self._traces[index].internal
+                series = self._series[index]
+                if isinstance(artist, Line2D):
+                    artist.set_data(series.x, series.y)
+                else:
+                    artist.set_offsets(np.column_stack([series.x, series.y]))
+        finally:
+            self._is_rendering = is_rendering
+
+        self._pending.clear()
+
+    def _on_stale(self, artist, value: bool):
+        """
+        The figure is changed (directly via matplotlib too): the rendered outputs are outdated.
+        Intermediate changes made by the rendering itself (e.g. the saving dpi) are ignored.
+        """
+        if value and not self._is_rendering:
+            self._revision += 1
+
+        if self._stale_callback is not None:
+            self._stale_callback(artist, value)
+
+    @contextlib.contextmanager
+    def _rendering(self):
+        """
+        Rendering of the current revision by uplot.
+        """
+        self._is_rendering = True
+        try:
+            yield
+        finally:
+            self._is_rendering = False
+            self._rendered_revision = self._revision
+
+    def _cache_image(self, dpi: float, rgba: ndarray):
+        """
+        Store a copy of the rendered image if it fits the render cache.
+        """
+        cache = self.engine.render_cache
+        if rgba.nbytes <= cache.max_bytes:
+            cache.put(self._cache_owner, self._revision, ('image', dpi), rgba.copy())
+
+    def _downsample_image(self, image: ndarray) -> ndarray:
+        """
+        Reduce the image by an integer factor to the saving resolution: the mean of each (step x step) block
+        (area averaging, no aliasing), incomplete edge blocks are averaged over their pixels.
+        """
+        width = self._fig.get_figwidth() * self.engine.SAVING_DPI
+        height = self._fig.get_figheight() * self.engine.SAVING_DPI
+
+        step = int(min(image.shape[0] // height, image.shape[1] // width))
+        if step <= 1:
+            return image
+
+        rows = np.arange(0, image.shape[0], step)
+        columns = np.arange(0, image.shape[1], step)
+        reduced = np.add.reduceat(image, rows, axis=0, dtype=np.float32)
+        reduced = np.add.reduceat(reduced, columns, axis=1)
+
+        # the number of pixels per block
+        row_counts = np.diff(rows, append=image.shape[0]).astype(np.float32)
+        column_counts = np.diff(columns, append=image.shape[1]).astype(np.float32)
+        counts = np.multiply.outer(row_counts, column_counts)
+        reduced /= counts.reshape(counts.shape + (1,)*(image.ndim - 2))
+
+        if image.dtype.kind in 'iub':
+            # keep the image type (the value range and RGB detection depend on it)
+            return np.rint(reduced, out=reduced).astype(image.dtype)
+        return reduced.astype(image.dtype, copy=False)
+
+    def _pixel_width(self) -> int:
+        """
+        The figure width in pixels for the highest (saving) resolution.
+        """
+        return int(self._fig.get_figwidth() * self.engine.SAVING_DPI)
+
     def _init_axis(self, is_3d: bool):
         assert self._fig is not None, 'figure is closed'
 
@@ -523,4 +837,13 @@ class MatplotFigure(IFigure):
             # sync axis and figure color
             self._axis.set_facecolor(self._fig.get_facecolor())
 
-        return self._axis
\ No newline at end of file
+        return self._axis
+
+
+def _is_rgb_range(image: ndarray, value_range: float) -> bool:
+    """
+    Check if RGB(A) image is supported by matplotlib without normalization.
+    """
+    if image.dtype == np.uint8:
+        return value_range == 255
+    return image.dtype.kind == 'f' and value_range == 1.0
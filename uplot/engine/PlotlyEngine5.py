@@ -1,13 +1,48 @@
+import os
 import importlib.util
+from typing import Iterable, Literal
+
 from uplot.interface import IPlotEngine, IFigure
+from uplot.utool import RenderCache
 from uplot.default import DEFAULT
 
 
+RenderMode = Literal[
+    'auto',  # WebGL for large series (see WEBGL_THRESHOLD), SVG otherwise
+    'svg',   # always SVG: Scatter
+    'webgl', # always WebGL: Scattergl
+]
+
+
 class PlotlyEngine5(IPlotEngine):
     # engine specific default parameters
     FILE_RESOLUTION_SCALE = 2
+    SHOWING_DPI = 100 # dpi of the figure size in pixels, see `as_image(dpi=...)`
     LINE_WIDTH = 2.5
 
+    # html & notebook export: trace arrays as base64 typed arrays instead of JSON text
+    # (smaller files and faster loading, requires plotly.js >= 2.28)
+    BINARY_ENCODING = False
+
+    # 2D line/scatter rendering: SVG becomes unresponsive for large series
+    RENDER_MODE: RenderMode = 'auto'
+    WEBGL_THRESHOLD = 50_000 # min number of points for WebGL in 'auto' mode
+
+    # imshow: images are sent as PNG data URIs (display only), 8 - compact, 16 - lossless for uint16 images;
+    # pixel values on hover require raw data: `imshow(..., hover_values=True)`
+    IMAGE_BIT_DEPTH = 8
+
+    # static export (png, jpg, webp, svg, pdf): pool of warm renderers (worker processes with kaleido),
+    # None - the default `plotly.io` export, N - up to N figures are exported in parallel
+    RENDERER_POOL_SIZE: int | None = None
+
+    # surface3d: level of detail, uniform grids are reduced by blocks to at most N facets
+    # (`surface3d(..., max_facets='auto')` uses this limit), None - no limit
+    SURFACE_MAX_FACETS: int | None = 1000 * 1000
+
+    # memory limit (bytes) of the rendered images and files of unchanged figures, 0 - no caching
+    RENDER_CACHE_SIZE = 256 * 2**20
+
     @property
     def name(self) -> str:
         return 'plotly5'
@@ -24,6 +59,11 @@ class PlotlyEngine5(IPlotEngine):
     def pio(self):
         return self._pio
 
+    @property
+    def render_cache(self) -> RenderCache:
+        self._render_cache.max_bytes = self.RENDER_CACHE_SIZE
+        return self._render_cache
+
 
     def __init__(self):
         import plotly.graph_objs as go
@@ -31,6 +71,8 @@ class PlotlyEngine5(IPlotEngine):
 
         self._pio = pio
         self._go = go
+        self._renderer_pool = None
+        self._render_cache = RenderCache(max_bytes=self.RENDER_CACHE_SIZE)
 
         # load style
         if DEFAULT.style.lower() == 'bmh':
@@ -49,4 +91,99 @@ class PlotlyEngine5(IPlotEngine):
                                    width=width,
                                    height=aspect_ratio*width)
 
-        return fig
\ No newline at end of file
+        return fig
+
+    def to_images(self, figures: Iterable[IFigure],
+                        format : str = 'png',
+                        scale  : float | None = None) -> list[bytes]:
+        """
+        Export the figures to static images, in parallel if the renderer pool is used (see RENDERER_POOL_SIZE).
+
+        Parameters
+        ----------
+        figures : Iterable[IFigure]
+            The plotly figures.
+
+        format : str, optional
+            The image format: 'png', 'jpg', 'webp', 'svg' or 'pdf', by default 'png'.
+
+        scale : float or None, optional
+            The image scale factor (resolution), by default 1.
+
+        Returns
+        -------
+        list[bytes]
+            The image file contents in the order of figures.
+        """
+        figures = [ figure.internal for figure in figures ]
+
+        pool = self.renderer_pool()
+        if pool is None:
+            return [ self._pio.to_image(figure, format=format, scale=scale, validate=False) for figure in figures ]
+
+        return pool.to_images([ figure.to_dict() for figure in figures ], format=format, scale=scale)
+
+    def write_images(self, figures: Iterable[IFigure], filenames: Iterable[str]):
+        """
+        Save the figures to static image files, the format is defined by the file extension.
+        The figures are exported in parallel if the renderer pool is used (see RENDERER_POOL_SIZE).
+        """
+        figures = [ figure.internal for figure in figures ]
+        filenames = list(filenames)
+        assert len(figures) == len(filenames), 'the number of figures and filenames must be the same'
+
+        pool = self.renderer_pool()
+        if pool is None:
+            for figure, filename in zip(figures, filenames):
+                self._pio.write_image(figure, filename, validate=False)
+            return
+
+        formats = [ os.path.splitext(filename)[1][1:].lower() for filename in filenames ]
+        futures = [ pool.submit(figure.to_dict(), format=format) for figure, format in zip(figures, formats) ]
+        for future, filename in zip(futures, filenames):
+            with open(filename, 'wb') as file:
+                file.write(future.result())
+
+    def write_report(self, figures: Iterable[IFigure],
+                           path   : str,
+                           title  : str = 'Report',
+                           workers: int | None = None):
+        """
+        Write multiple figures to one HTML report with a single copy of plotly.js,
+        figures are rendered by the browser when they are scrolled into view.
+
+        Parameters
+        ----------
+        figures : Iterable[IFigure]
+            The plotly figures.
+
+        path : str
+            'report.html' - a single file, 'report/' (no extension) - a directory with `index.html`,
+            `plotly.min.js` and a script per figure loaded on scrolling.
+
+        title : str, optional
+            The page title.
+
+        workers : int or None, optional
+            The number of processes for JSON serialization, by default the number of CPUs
+            (at most one per figure, no processes for a few figures), 0 - no processes.
+        """
+        from uplot.engine.plotly.report import write_report
+        write_report(list(figures), path, title=title, encoding=self.BINARY_ENCODING, workers=workers)
+
+    def renderer_pool(self):
+        """
+        The pool of warm renderers or None if RENDERER_POOL_SIZE is None.
+        The pool is created on the first use and recreated if RENDERER_POOL_SIZE is changed.
+        """
+        size = self.RENDERER_POOL_SIZE
+
+        if self._renderer_pool is not None and self._renderer_pool.size != size:
+            self._renderer_pool.close()
+            self._renderer_pool = None
+
+        if self._renderer_pool is None and size is not None:
+            from uplot.engine.plotly.renderer import RendererPool
+            self._renderer_pool = RendererPool(size=size)
+
+        return self._renderer_pool
@@ -3,15 +3,22 @@ from __future__ import annotations
 import numpy as np
 from numpy import ndarray
 from numpy.typing import ArrayLike
+from typing import Callable, Literal
 
 import uplot.color as ucolor
 import uplot.utool as utool
 import uplot.plugin as plugin
 
-from uplot.interface import IFigure
-from uplot.interface import LineStyle, MarkerStyle, AspectMode, AxisScale, Colormap
+from uplot.interface import IFigure, TraceHandle
+from uplot.interface import LineStyle, MarkerStyle, AspectMode, AxisScale, Colormap, ImageChannels
 from uplot.engine.PlotlyEngine5 import PlotlyEngine5
-from uplot.utool import Interpolator
+from uplot.engine.plotly.axis_range import AxisBounds
+from uplot.utool import Interpolator, Decimation, GridDownsampling
+
+
+# the message stubs of `go.Figure` reporting the changes of the figure, see `PlotlyFigure5._watch_changes()`
+CHANGE_MESSAGES = ('_send_addTraces_msg', '_send_moveTraces_msg', '_send_deleteTraces_msg',
+                   '_send_restyle_msg', '_send_relayout_msg', '_send_update_msg', '_send_animate_msg')
 
 
 class PlotlyFigure5(IFigure):
@@ -22,26 +29,47 @@ class PlotlyFigure5(IFigure):
 
     @property
     def internal(self):
+        self._sync_series() # the figure content is up to date for direct use
         return self._fig
 
     @property
     def is_3d(self) -> bool | None:
         return self._is_3d
 
+    @property
+    def last_trace(self) -> TraceHandle | None:
+        return self._traces[-1] if len(self._traces) > 0 else None
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
     def __init__(self, engine: PlotlyEngine5):
         from plotly.graph_objs import Figure
 
         self._engine = engine
+        self._revision = 0 # incremented by each change of the figure, see `utool.mutating`
+        self._cache_owner = object() # key of the figure outputs in the engine render cache
         self._color_scroller = ucolor.ColorScroller()
 
         self._fig: Figure = engine.go.Figure()
+        # changes made directly via plotly (`internal`) are reported by the figure messages,
+        # the render cache and the data bounds are not kept if the messages are not available
+        self._is_watched = self._watch_changes()
+        self._is_syncing = False
         self._is_3d = None
         self._colorbar_x_pos = 1.0
         self._show_grid = True
 
         self._group_counter: dict[str | None, int] = { None: 0 }
 
+        self._traces: list[TraceHandle] = [ ]
+        self._series: dict[int, utool.SeriesBuffer] = { }
+        self._pending: set[int] = set() # extended series not passed to their traces yet
+        self._bounds = AxisBounds() # data min/max per axis for xlim/ylim/hline/vline
 
+
+    @utool.mutating
     def plot(self, x           : ArrayLike,
                    y           : ArrayLike | None = None,
                    z           : ArrayLike | None = None,
@@ -52,6 +80,7 @@ class PlotlyFigure5(IFigure):
                    marker_size : float | None = None,
                    opacity     : float = 1.0,
                    legend_group: str | None = None,
+                   decimate    : Decimation | None = None,
                    **kwargs) -> IFigure:
         from uplot.engine.plotly.plot import plot_line_marker
 
@@ -65,6 +94,7 @@ class PlotlyFigure5(IFigure):
                        marker_size=marker_size,
                        opacity=opacity,
                        legend_group=legend_group,
+                       decimate=decimate,
                        **kwargs):
             return self
 
@@ -75,29 +105,36 @@ class PlotlyFigure5(IFigure):
 
         self._update_group_counter(plot_name=name, legend_group=legend_group)
 
-        plot_line_marker(figure=self._fig,
-                         x=x, y=y, z=z,
-                         color=color,
-                         name=name,
-                         line_style=line_style,
-                         line_width=self.engine.LINE_WIDTH,
-                         marker_style=marker_style,
-                         marker_size=marker_size,
-                         opacity=opacity,
-                         legend_group=legend_group,
-                         legend_group_title=legend_group if self._group_counter[legend_group] > 0 else None,
-                         **kwargs)
+        trace = plot_line_marker(figure=self._fig,
+                                 x=x, y=y, z=z,
+                                 color=color,
+                                 name=name,
+                                 line_style=line_style,
+                                 line_width=self.engine.LINE_WIDTH,
+                                 marker_style=marker_style,
+                                 marker_size=marker_size,
+                                 opacity=opacity,
+                                 legend_group=legend_group,
+                                 legend_group_title=legend_group if self._group_counter[legend_group] > 0 else None,
+                                 decimate=decimate,
+                                 n_pixels=self._pixel_width(),
+                                 render_mode=kwargs.pop('render_mode', self.engine.RENDER_MODE),
+                                 webgl_threshold=self.engine.WEBGL_THRESHOLD,
+                                 **kwargs)
+        self._traces.append(TraceHandle(index=len(self._traces), internal=trace))
         return self
 
+    @utool.mutating
     def scatter(self, x           : ArrayLike,
                       y           : ArrayLike | None = None,
                       z           : ArrayLike | None = None,
                       name        : str | None = None,
-                      color       : str | list[str] | None = None,
+                      color       : str | ArrayLike | None = None,
                       marker_style: MarkerStyle | None = None,
                       marker_size : float | None = None,
                       opacity     : float = 1.0,
                       legend_group: str | None = None,
+                      decimate    : Decimation | None = None,
                       **kwargs) -> IFigure:
         from uplot.engine.plotly.plot import plot_line_marker
 
@@ -110,6 +147,7 @@ class PlotlyFigure5(IFigure):
                        marker_size=marker_size,
                        opacity=opacity,
                        legend_group=legend_group,
+                       decimate=decimate,
                        **kwargs):
             return self
 
@@ -120,20 +158,26 @@ class PlotlyFigure5(IFigure):
 
         self._update_group_counter(plot_name=name, legend_group=legend_group)
 
-        plot_line_marker(figure=self._fig,
-                         x=x, y=y, z=z,
-                         color=color,
-                         name=name,
-                         line_style=' ', # no line (scatter mode)
-                         line_width=self.engine.LINE_WIDTH,
-                         marker_style=marker_style,
-                         marker_size=marker_size,
-                         opacity=opacity,
-                         legend_group=legend_group,
-                         legend_group_title=legend_group if self._group_counter[legend_group] > 0 else None,
-                         **kwargs)
+        trace = plot_line_marker(figure=self._fig,
+                                 x=x, y=y, z=z,
+                                 color=color,
+                                 name=name,
+                                 line_style=' ', # no line (scatter mode)
+                                 line_width=self.engine.LINE_WIDTH,
+                                 marker_style=marker_style,
+                                 marker_size=marker_size,
+                                 opacity=opacity,
+                                 legend_group=legend_group,
+                                 legend_group_title=legend_group if self._group_counter[legend_group] > 0 else None,
+                                 decimate=decimate,
+                                 n_pixels=self._pixel_width(),
+                                 render_mode=kwargs.pop('render_mode', self.engine.RENDER_MODE),
+                                 webgl_threshold=self.engine.WEBGL_THRESHOLD,
+                                 **kwargs)
+        self._traces.append(TraceHandle(index=len(self._traces), internal=trace))
         return self
 
+    @utool.mutating
     def hline(self, y           : float,
                     x_min       : float | None = None,
                     x_max       : float | None = None,
@@ -149,11 +193,11 @@ class PlotlyFigure5(IFigure):
 
         if x_min is None:
             from uplot.engine.plotly.axis_range import estimate_axis_range
-            x_min = estimate_axis_range(self._fig, axis='x', mode='min')
+            x_min = estimate_axis_range(self.internal, axis='x', mode='min', bounds=self._data_bounds())
 
         if x_max is None:
             from uplot.engine.plotly.axis_range import estimate_axis_range
-            x_max = estimate_axis_range(self._fig, axis='x', mode='max')
+            x_max = estimate_axis_range(self.internal, axis='x', mode='max', bounds=self._data_bounds())
 
         return self.plot([x_min, x_max], [y, y],
                          color=color,
@@ -163,6 +207,7 @@ class PlotlyFigure5(IFigure):
                          legend_group=legend_group,
                          **kwargs)
 
+    @utool.mutating
     def vline(self, x           : float,
                     y_min       : float | None = None,
                     y_max       : float | None = None,
@@ -177,11 +222,11 @@ class PlotlyFigure5(IFigure):
 
         if y_min is None:
             from uplot.engine.plotly.axis_range import estimate_axis_range
-            y_min = estimate_axis_range(self._fig, axis='y', mode='min')
+            y_min = estimate_axis_range(self.internal, axis='y', mode='min', bounds=self._data_bounds())
 
         if y_max is None:
             from uplot.engine.plotly.axis_range import estimate_axis_range
-            y_max = estimate_axis_range(self._fig, axis='y', mode='max')
+            y_max = estimate_axis_range(self.internal, axis='y', mode='max', bounds=self._data_bounds())
 
         return self.plot([x, x], [y_min, y_max],
                          color=color,
@@ -191,6 +236,40 @@ class PlotlyFigure5(IFigure):
                          legend_group=legend_group,
                          **kwargs)
 
+    @utool.mutating
+    def extend(self, trace     : TraceHandle,
+                     x         : ArrayLike,
+                     y         : ArrayLike | None = None,
+                     max_points: int | None = None) -> IFigure:
+        if self.is_3d:
+            raise RuntimeError('3D figure is not supported')
+
+        plotly_trace = trace.internal
+        series = self._series.get(trace.index)
+        if series is None or series.max_points != max_points:
+            # the first extension or the storage change: copy plotted data to the buffer
+            if series is not None:
+                x_data, y_data = series.x, series.y
+            else:
+                x_data, y_data = plotly_trace.x, plotly_trace.y
+            series = utool.SeriesBuffer(x_data, y_data, max_points=max_points)
+            self._series[trace.index] = series
+
+        x, y = series.extend(x, y)
+
+        if max_points is None:
+            self._bounds.update('x', x)
+            self._bounds.update('y', y)
+        else:
+            self._bounds.reset() # old samples are dropped: rebuild on the next query
+
+        # plotly stores and validates the whole arrays of a trace (there is no appending):
+        # the trace is updated once on the next use of the figure, see `_sync_series()`
+        self._pending.add(trace.index)
+
+        return self
+
+    @utool.mutating
     def surface3d(self, x            : ArrayLike,
                         y            : ArrayLike | None = None,
                         z            : ArrayLike | None = None,
@@ -199,8 +278,10 @@ class PlotlyFigure5(IFigure):
                         colormap     : Colormap = 'viridis',
                         opacity      : float = 1.0,
                         interpolation: Interpolator = 'cubic',
-                        interpolation_range: int = 100,
+                        interpolation_range: int | None = 100,
                         legend_group : str | None = None,
+                        max_facets   : int | Literal['auto'] | None = 'auto',
+                        downsampling : GridDownsampling = 'mean',
                         **kwargs) -> IFigure:
         # check if x is a custom object and a plugin is available
         if plugin.plot(plot_method=self.surface3d,
@@ -212,6 +293,8 @@ class PlotlyFigure5(IFigure):
                        interpolation=interpolation,
                        interpolation_range=interpolation_range,
                        legend_group=legend_group,
+                       max_facets=max_facets,
+                       downsampling=downsampling,
                        **kwargs):
             return self
 
@@ -221,15 +304,22 @@ class PlotlyFigure5(IFigure):
         assert x.ndim == y.ndim == 1, 'x, y must be 1D arrays'
         assert z.ndim == 1 or z.ndim == 2, 'z must be 1D or 2D array'
 
+        if max_facets == 'auto':
+            max_facets = self.engine.SURFACE_MAX_FACETS
+
         if z.ndim == 2:
             # uniform grid
             assert (len(y), len(x)) == z.shape, 'uniform grid: x and y range must match z'
-            x, y = np.meshgrid(x, y)
         else:
             # non-uniform grid - array of points (x, y, z)
             x, y, z = utool.array_to_grid(x, y, z,
                                           interpolation=interpolation,
                                           interpolation_range=interpolation_range)
+            x, y = x[0, :], y[:, 0]
+
+        if max_facets is not None:
+            # level of detail: large grids are reduced by blocks
+            x, y, z = utool.downsample_grid(x, y, z, max_facets=max_facets, method=downsampling)
 
         self._is_3d = True
 
@@ -241,6 +331,7 @@ class PlotlyFigure5(IFigure):
 
         self._update_group_counter(plot_name=name, legend_group=legend_group)
 
+        # uniform grid: 1D coordinates, not expanded to 2D arrays
         self._fig.add_surface(x=x, y=y, z=z,
                               name=name,
                               showlegend=(name != '') and (name is not None),
@@ -253,6 +344,7 @@ class PlotlyFigure5(IFigure):
                               **kwargs)
         return self
 
+    @utool.mutating
     def bar(self, x           : ArrayLike,
                   y           : ArrayLike | None = None,
                   name        : str | None = None,
@@ -293,23 +385,36 @@ class PlotlyFigure5(IFigure):
                           **kwargs)
         return self
 
-    def imshow(self, image: ArrayLike, **kwargs) -> IFigure:
+    @utool.mutating
+    def imshow(self, image: ArrayLike, value_range: float | None = None, **kwargs) -> IFigure:
         image = np.asarray(image)
-        value_range = utool.image_range(image)
+        if value_range is None:
+            value_range = utool.image_range(image)
 
-        if image.ndim == 2 or image.shape[2] == 1:
-            # workaround for a grayscale image
-            # https://github.com/plotly/plotly.py/issues/2885  # issuecomment-724679904
-            image = np.stack([image, image, image], axis=2)
+        bit_depth = kwargs.pop('bit_depth', self.engine.IMAGE_BIT_DEPTH)
+        hover_values = kwargs.pop('hover_values', False) or 'zmin' in kwargs or 'zmax' in kwargs
 
         self._is_3d = False
 
-        self._fig.add_trace(self.engine.go.Image(
-            z=image,
-            zmax=kwargs.pop('zmax', [value_range]*4),
-            zmin=kwargs.pop('zmin', [0]*4),
-            **kwargs,
-        ))
+        if hover_values:
+            # raw pixel values: large json payload
+            if image.ndim == 2 or image.shape[2] == 1:
+                # workaround for a grayscale image
+                # https://github.com/plotly/plotly.py/issues/2885  # issuecomment-724679904
+                image = np.stack([image, image, image], axis=2)
+
+            self._fig.add_trace(self.engine.go.Image(
+                z=image,
+                zmax=kwargs.pop('zmax', [value_range]*4),
+                zmin=kwargs.pop('zmin', [0]*4),
+                **kwargs,
+            ))
+        else:
+            # compressed image (display only): grayscale is encoded as is
+            self._fig.add_trace(self.engine.go.Image(
+                source=utool.image_encode_base64(image, value_range, bit_depth=bit_depth),
+                **kwargs,
+            ))
 
         # configure layout
         self._fig.update_layout(margin=self.engine.go.layout.Margin(b=30, t=30))
@@ -319,10 +424,12 @@ class PlotlyFigure5(IFigure):
 
         return self
 
+    @utool.mutating
     def title(self, text: str) -> IFigure:
         self._fig.update_layout(title=text)
         return self
 
+    @utool.mutating
     def legend(self, show: bool = True,
                      equal_marker_size: bool = True,
                      **kwargs) -> IFigure:
@@ -337,6 +444,7 @@ class PlotlyFigure5(IFigure):
         ))
         return self
 
+    @utool.mutating
     def grid(self, show: bool = True) -> IFigure:
         from uplot.engine.plotly.scale import get_scale
 
@@ -360,6 +468,7 @@ class PlotlyFigure5(IFigure):
         self._show_grid = show
         return self
 
+    @utool.mutating
     def xlabel(self, text: str) -> IFigure:
         if self.is_3d:
             self._fig.update_layout(scene=dict(xaxis_title=text))
@@ -367,6 +476,7 @@ class PlotlyFigure5(IFigure):
             self._fig.update_xaxes(title=text)
         return self
 
+    @utool.mutating
     def ylabel(self, text: str) -> IFigure:
         if self.is_3d:
             self._fig.update_layout(scene=dict(yaxis_title=text))
@@ -374,24 +484,26 @@ class PlotlyFigure5(IFigure):
             self._fig.update_yaxes(title=text)
         return self
 
+    @utool.mutating
     def zlabel(self, text: str) -> IFigure:
         if self.is_3d:
             self._fig.update_layout(scene=dict(zaxis_title=text))
         return self
 
+    @utool.mutating
     def xlim(self, min_value: float | None = None,
                    max_value: float | None = None) -> IFigure:
         from uplot.engine.plotly.axis_range import estimate_axis_range
         from uplot.engine.plotly.scale import get_scale
 
         if min_value is None:
-            min_value = estimate_axis_range(self._fig, axis='x', mode='min')
+            min_value = estimate_axis_range(self.internal, axis='x', mode='min', bounds=self._data_bounds())
 
         if get_scale(self._fig, 'x') == 'log':
             min_value = np.log10(min_value)
 
         if max_value is None:
-            max_value = estimate_axis_range(self._fig, axis='x', mode='max')
+            max_value = estimate_axis_range(self.internal, axis='x', mode='max', bounds=self._data_bounds())
 
         if get_scale(self._fig, 'x') == 'log':
             max_value = np.log10(max_value)
@@ -402,19 +514,20 @@ class PlotlyFigure5(IFigure):
             self._fig.update_xaxes(range=[min_value, max_value])
         return self
 
+    @utool.mutating
     def ylim(self, min_value: float | None = None,
                    max_value: float | None = None) -> IFigure:
         from uplot.engine.plotly.axis_range import estimate_axis_range
         from uplot.engine.plotly.scale import get_scale
 
         if min_value is None:
-            min_value = estimate_axis_range(self._fig, axis='y', mode='min')
+            min_value = estimate_axis_range(self.internal, axis='y', mode='min', bounds=self._data_bounds())
 
         if get_scale(self._fig, 'y') == 'log':
             min_value = np.log10(min_value)
 
         if max_value is None:
-            max_value = estimate_axis_range(self._fig, axis='y', mode='max')
+            max_value = estimate_axis_range(self.internal, axis='y', mode='max', bounds=self._data_bounds())
 
         if get_scale(self._fig, 'y') == 'log':
             max_value = np.log10(max_value)
@@ -425,6 +538,7 @@ class PlotlyFigure5(IFigure):
             self._fig.update_yaxes(range=[min_value, max_value])
         return self
 
+    @utool.mutating
     def zlim(self, min_value: float | None = None,
                    max_value: float | None = None) -> IFigure:
         if not self.is_3d:
@@ -432,15 +546,16 @@ class PlotlyFigure5(IFigure):
 
         if min_value is None:
             from uplot.engine.plotly.axis_range import estimate_axis_range
-            min_value = estimate_axis_range(self._fig, axis='z', mode='min')
+            min_value = estimate_axis_range(self.internal, axis='z', mode='min', bounds=self._data_bounds())
 
         if max_value is None:
             from uplot.engine.plotly.axis_range import estimate_axis_range
-            max_value = estimate_axis_range(self._fig, axis='z', mode='max')
+            max_value = estimate_axis_range(self.internal, axis='z', mode='max', bounds=self._data_bounds())
 
         self._fig.update_layout(scene=dict(zaxis=dict(range=[min_value, max_value])))
         return self
 
+    @utool.mutating
     def xscale(self, scale: AxisScale, base: float = 10) -> IFigure:
         from uplot.engine.plotly.scale import set_scale
 
@@ -448,6 +563,7 @@ class PlotlyFigure5(IFigure):
         self.grid(self._show_grid) # update grid if visible
         return self
 
+    @utool.mutating
     def yscale(self, scale: AxisScale, base: float = 10) -> IFigure:
         from uplot.engine.plotly.scale import set_scale
 
@@ -465,6 +581,7 @@ class PlotlyFigure5(IFigure):
         self._color_scroller.reset()
         return self
 
+    @utool.mutating
     def axis_aspect(self, mode: AspectMode) -> IFigure:
         if self.is_3d:
             aspectmode = 'cube' if mode == 'equal' else 'auto'
@@ -474,34 +591,165 @@ class PlotlyFigure5(IFigure):
             self._fig.update_yaxes(scaleanchor=scaleanchor)
         return self
 
-    def as_image(self) -> ndarray:
+    def as_image(self, dpi     : float | None = None,
+                       channels: ImageChannels | None = None,
+                       out     : ndarray | None = None) -> ndarray:
         import io
         from PIL import Image
 
-        fig_bytes = io.BytesIO(
-            self._fig.to_image(format='png', scale=self.engine.FILE_RESOLUTION_SCALE)
-        )
+        if dpi is None:
+            scale = self.engine.FILE_RESOLUTION_SCALE
+        else:
+            scale = dpi / self.engine.SHOWING_DPI
+        if channels is None:
+            channels = 'rgb'
 
-        image = Image.open(fig_bytes)
-        image = np.asarray(image)
-        image = image[..., :3] # RGBA -> RGB
-        return image
+        cache = self._render_cache()
+        image = None if cache is None else cache.get(self._cache_owner, self._revision, ('image', scale))
+
+        if image is None:
+            fig_bytes = io.BytesIO(
+                self.engine.to_images([ self ], format='png', scale=scale)[0]
+            )
+
+            image = Image.open(fig_bytes)
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA')
+
+            image = np.asarray(image)
+            if cache is not None:
+                cache.put(self._cache_owner, self._revision, ('image', scale), image)
+
+        return utool.image_to_channels(image, channels, out)
 
     def save(self, filename: str):
-        if '.html' in filename:
-            self._fig.write_html(filename)
+        import os
+        format = os.path.splitext(filename)[1][1:].lower() or 'png'
+
+        cache = self._render_cache()
+        content = None if cache is None else cache.get(self._cache_owner, self._revision, ('file', format))
+
+        if content is None:
+            if format == 'html':
+                content = self.engine.pio.to_html(self._export_figure(), validate=False)
+            else:
+                content = self.engine.to_images([ self ], format=format)[0]
+            if cache is not None:
+                cache.put(self._cache_owner, self._revision, ('file', format), content)
+
+        if isinstance(content, str):
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write(content)
         else:
-            self._fig.write_image(filename)
+            with open(filename, 'wb') as file:
+                file.write(content)
 
+    @utool.mutating
     def close(self):
         self._fig.data = []
         self._fig.layout = {}
+        self._pending.clear()
+        self._bounds.reset()
+        self.engine.render_cache.clear(self._cache_owner)
 
     def show(self, block: bool=True):
-        self.engine.pio.show(self._fig)
+        self.engine.pio.show(self._export_figure(), validate=False)
 
     ## Protected ##
 
+    def _export_figure(self):
+        """
+        The figure for html/notebook export: binary encoded arrays (dict) or the figure itself.
+        """
+        if not self.engine.BINARY_ENCODING:
+            return self.internal
+
+        from uplot.engine.plotly.encoding import encode_typed_arrays
+
+        figure = self.internal.to_dict()
+        figure['data'] = encode_typed_arrays(figure['data'])
+        return figure
+
+    def _watch_changes(self) -> bool:
+        """
+        Increment the revision on each change of the figure made directly via plotly (`internal`):
+        the rendered outputs of the previous content are not used anymore.
+        All changes of a plotly figure are sent as messages to the frontend (`FigureWidget`),
+        the message stubs of `go.Figure` are wrapped (no scan of the figure content).
+        Returns False if the stubs are not found (a plotly version with other internals): nothing is wrapped.
+        """
+        if not all(callable(getattr(self._fig, name, None)) for name in CHANGE_MESSAGES):
+            return False
+
+        for name in CHANGE_MESSAGES:
+            setattr(self._fig, name, self._on_change(name, getattr(self._fig, name)))
+        return True
+
+    def _on_change(self, name: str, send: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            if not self._is_syncing:
+                self._revision += 1
+                if self._changes_data(name, *args, **kwargs):
+                    # traces are edited, removed or reordered: the data bounds are rebuilt on the next query
+                    self._bounds.reset()
+            return send(*args, **kwargs)
+
+        return wrapper
+
+    @staticmethod
+    def _changes_data(name: str, *args, **kwargs) -> bool:
+        """
+        Whether the message changes the data of the indexed traces.
+        Added traces are appended (indexed incrementally), layout changes don't touch the data.
+        """
+        if name in ('_send_addTraces_msg', '_send_relayout_msg'):
+            return False
+        if name == '_send_update_msg':
+            restyle_data = args[0] if len(args) > 0 else kwargs.get('restyle_data')
+            return bool(restyle_data)
+        return True
+
+    def _render_cache(self) -> utool.RenderCache | None:
+        """
+        The engine render cache or None if the direct changes of the figure are not tracked.
+        """
+        return self.engine.render_cache if self._is_watched else None
+
+    def _data_bounds(self) -> AxisBounds:
+        """
+        The data bounds for xlim/ylim/hline/vline, rebuilt on each query if the direct changes are not tracked.
+        """
+        if not self._is_watched:
+            self._bounds.reset()
+        return self._bounds
+
+    def _sync_series(self):
+        """
+        Pass the extended series to their traces. `extend()` only appends to the buffers (O(new samples)),
+        the whole arrays are validated by plotly once per use of the figure instead of once per extension.
+        """
+        if len(self._pending) == 0:
+            return
+
+        # the change is already counted by `extend()`
+        self._is_syncing = True
+        try:
+            with self._fig.batch_update():
+                for index in self._pending:
+                    plotly_trace = self._traces[index].internal
+                    plotly_trace.x = self._series[index].x
+                    plotly_trace.y = self._series[index].y
+        finally:
+            self._is_syncing = False
+
+        self._pending.clear()
+
+    def _pixel_width(self) -> int:
+        """
+        The figure width in pixels for the highest (file) resolution.
+        """
+        return int(self._fig.layout.width * self.engine.FILE_RESOLUTION_SCALE)
+
     def _update_group_counter(self, plot_name: str | None, legend_group: str | None):
         """
         Count visible legend's items for the same group
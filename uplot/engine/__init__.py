@@ -1,6 +1,6 @@
 from uplot.engine.MatplotEngine import MatplotEngine
 from uplot.engine.PlotlyEngine5 import PlotlyEngine5
-from uplot.engine.manage import register, get, available
+from uplot.engine.manage import register, get, available, EngineFactory
 
 
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
 
     'MatplotEngine',
     'PlotlyEngine5',
+    'EngineFactory',
 
     # functions
 
@@ -18,17 +19,18 @@ __all__ = [
 ]
 
 
-# register available engines
+# register available engines:
+# the engines are created (and plotting libs imported) on the first use
 
 
 if MatplotEngine.is_available():
     # matplotlib GUI
-    mpl_gui = MatplotEngine()
+    mpl_gui = EngineFactory(MatplotEngine, name='matplotlib')
     register(engine=mpl_gui, name='matplotlib')
     register(engine=mpl_gui, name='mpl')
 
     # matplotlib without GUI (save to file only)
-    mpl_no_gui = MatplotEngine(backend='agg')
+    mpl_no_gui = EngineFactory(MatplotEngine, name='matplotlib-agg', backend='agg')
     register(mpl_no_gui, name='matplotlib-nogui')
     register(mpl_no_gui, name='mpl-nogui')
     register(mpl_no_gui, name='mpl-ng')
@@ -36,7 +38,7 @@ if MatplotEngine.is_available():
     register(mpl_no_gui, name='mpl-file')
 
 if PlotlyEngine5.is_available():
-    plotly5 = PlotlyEngine5()
+    plotly5 = EngineFactory(PlotlyEngine5, name='plotly5')
     register(engine=plotly5, name='plotly')
     register(engine=plotly5, name='plotly5')
     register(engine=plotly5, name='pl')
@@ -2,7 +2,53 @@ from uplot.interface import IPlotEngine
 from typing import OrderedDict
 
 
-DEFAULT_ENGINES: dict[str, IPlotEngine] = OrderedDict[str, IPlotEngine]()
+class EngineFactory:
+    """
+    Deferred engine creation: the plotting library is imported on the first use of the engine.
+    """
+
+    def __init__(self, engine_type: type[IPlotEngine], name: str, **kwargs):
+        """
+        Parameters
+        ----------
+        engine_type : type[IPlotEngine]
+            The engine class.
+
+        name : str
+            The engine name, reported by **available()** without creating the engine.
+            It must be the name of the created engine (`IPlotEngine.name`).
+
+        kwargs : dict
+            Parameters for the engine constructor.
+        """
+        self._engine_type = engine_type
+        self._name = name
+        self._kwargs = kwargs
+        self._engine: IPlotEngine | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def is_created(self) -> bool:
+        return self._engine is not None
+
+    def is_available(self) -> bool:
+        return self._engine_type.is_available()
+
+    def create(self) -> IPlotEngine:
+        """
+        Create the engine on the first call, return the same engine afterwards.
+        """
+        if self._engine is None:
+            engine = self._engine_type(**self._kwargs)
+            assert engine.name == self._name, f'engine name mismatch: {engine.name} != {self._name}'
+            self._engine = engine
+        return self._engine
+
+
+DEFAULT_ENGINES: dict[str, IPlotEngine | EngineFactory] = OrderedDict[str, IPlotEngine | EngineFactory]()
 
 
 def available() -> dict[str, list[str]]:
@@ -26,14 +72,15 @@ def available() -> dict[str, list[str]]:
     return engine_name_mapping
 
 
-def register(engine: IPlotEngine, name: str) -> bool:
+def register(engine: IPlotEngine | EngineFactory, name: str) -> bool:
     """
     Register a plot engine object with a specified shortcut name for use in the **figure()** function.
 
     Parameters
     ----------
-    engine : IPlotEngine
+    engine : IPlotEngine or EngineFactory
         The plot engine object to register.
+        The factory defers the engine creation (and the plotting library import) to the first **get()**.
 
     name : str
         The shortcut name for the engine.
@@ -75,7 +122,11 @@ def get(name: str | None = None) -> IPlotEngine | None:
 
     if name is None:
         # return the first available engine
-        return list(DEFAULT_ENGINES.values())[0]
+        engine = next(iter(DEFAULT_ENGINES.values()))
+    else:
+        engine = DEFAULT_ENGINES.get(name.lower())
+
+    if isinstance(engine, EngineFactory):
+        engine = engine.create()
 
-    engine = DEFAULT_ENGINES.get(name.lower())
     return engine
\ No newline at end of file
@@ -0,0 +1,108 @@
+import numpy as np
+
+from matplotlib.artist import Artist
+from matplotlib.collections import PolyCollection
+from matplotlib.container import BarContainer
+
+
+# style options of the bars supported by a collection (the rest requires `Axes.bar()`)
+COLLECTION_KWARGS = { 'edgecolor', 'linewidth', 'linestyle', 'hatch', 'zorder' }
+
+
+class BarLayout(Artist):
+    """
+    Deferred layout of grouped bars: positions and widths of all bar series are updated once before drawing.
+
+    Adding a series changes the width of all bars in the group, updating them on each `bar()` call
+    costs O(K²·N) for K series of N bars. The layout is an invisible artist of the axes drawn before the bars,
+    so it's applied on any rendering (show, save, notebook) and only if the group changed.
+    A series is either a `BarContainer` (a patch per bar) or a `PolyCollection` (all bars at once, see `bar_collection()`).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.set_zorder(-np.inf) # drawn before the bars
+        self.set_in_layout(False)
+
+        self._total_width = 0.8
+        self._containers: list[BarContainer | PolyCollection] = [ ]
+        self._heights: list[np.ndarray | None] = [ ] # heights of the collection bars
+        self._is_dirty = False
+
+
+    def __len__(self) -> int:
+        return len(self._containers)
+
+
+    @staticmethod
+    def bar_position(n_bars: int, index: int, n_series: int, total_width: float) -> tuple[np.ndarray, float]:
+        """
+        Centers and width of the bars of the series with the index in the group of n_series.
+        """
+        bar_width = total_width / n_series
+        offset = (1 - total_width) / 2
+        return np.arange(n_bars) + offset + index*bar_width, bar_width
+
+
+    def add(self, container: BarContainer | PolyCollection, total_width: float, heights: np.ndarray | None = None):
+        """
+        Add the series to the group, the group occupies total_width of each category slot.
+        The heights are required for a collection.
+        """
+        self._containers.append(container)
+        self._heights.append(heights)
+        self._total_width = total_width
+        self._is_dirty = True
+
+
+    def apply(self):
+        """
+        Update positions and widths of all bars (each bar is updated once).
+        """
+        if not self._is_dirty:
+            return
+
+        for index, (container, heights) in enumerate(zip(self._containers, self._heights)):
+            if heights is not None:
+                center, bar_width = self.bar_position(len(heights), index, len(self), self._total_width)
+                container.set_verts(bar_vertices(center, heights, bar_width))
+                continue
+
+            center, bar_width = self.bar_position(len(container.patches), index, len(self), self._total_width)
+            left = center - bar_width/2
+            for patch, x in zip(container.patches, left.tolist()):
+                patch.set_x(x)
+                patch.set_width(bar_width)
+
+        self._is_dirty = False
+
+
+    def draw(self, renderer):
+        self.apply()
+
+
+def bar_collection(axis, x: np.ndarray, height: np.ndarray, width: float, **kwargs) -> PolyCollection:
+    """
+    Vertical bars as a single collection: the equivalent of `Axes.bar()` without an artist per bar.
+    """
+    collection = PolyCollection(bar_vertices(x, height, width), **kwargs)
+    collection.sticky_edges.y.append(0) # no margin below the bars as `Axes.bar()`
+
+    axis.add_collection(collection, autolim=True)
+    axis.autoscale_view()
+    return collection
+
+
+def bar_vertices(x: np.ndarray, height: np.ndarray, width: float) -> np.ndarray:
+    """
+    Rectangles (n, 4, 2) of the bars centered at x.
+    """
+    left = x - width/2
+    right = x + width/2
+    bottom = np.zeros_like(height, dtype=np.float64)
+    top = np.asarray(height, dtype=np.float64)
+
+    return np.stack([ np.stack([ left, bottom ], axis=-1),
+                      np.stack([ left, top ], axis=-1),
+                      np.stack([ right, top ], axis=-1),
+                      np.stack([ right, bottom ], axis=-1) ], axis=1)
@@ -0,0 +1,86 @@
+class BlitManager:
+    """
+    Fast redraw of changing (animated) artists over the cached static background:
+    axes, grid, labels, legend and the rest of the figure are rendered only if the figure changed.
+
+    https://matplotlib.org/stable/users/explain/animations/blitting.html
+    """
+
+    def __init__(self, figure):
+        self._fig = figure
+        self._artists = []
+        self._background = None
+        self._background_state = None
+
+        # capture the background on every full redraw
+        self._cid = figure.canvas.mpl_connect('draw_event', self._on_draw)
+
+
+    def add_artist(self, artist):
+        """
+        Register an artist which will be updated frequently.
+        """
+        if artist in self._artists:
+            return
+
+        # animated artists are excluded from the regular drawing (but not from saving)
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+        # the background contains the artist, recapture is needed
+        self._background = None
+
+
+    def update(self):
+        """
+        Redraw the figure: only the animated artists if possible, the full figure otherwise.
+        """
+        canvas = self._fig.canvas
+
+        if not self.is_valid():
+            canvas.draw() # the background is captured by draw_event
+            return
+
+        canvas.restore_region(self._background)
+        self._draw_animated()
+        canvas.blit(self._fig.bbox)
+        canvas.flush_events()
+
+
+    def is_valid(self) -> bool:
+        """
+        Check if the cached background is valid: only the animated artists are changed since the last drawing.
+        """
+        # any change of a regular artist marks the figure as stale
+        # (changes of animated artists are not propagated)
+        return self._background is not None and not self._fig.stale and self._background_state == self._state()
+
+
+    def disconnect(self):
+        self._fig.canvas.mpl_disconnect(self._cid)
+
+
+    ## Protected ##
+
+    def _on_draw(self, event):
+        canvas = self._fig.canvas
+        if canvas.is_saving():
+            return # savefig with a different renderer
+
+        self._background = canvas.copy_from_bbox(self._fig.bbox)
+        self._background_state = self._state()
+        self._draw_animated()
+
+
+    def _draw_animated(self):
+        for artist in self._artists:
+            if artist.figure is not None: # skip removed artists
+                self._fig.draw_artist(artist)
+
+
+    def _state(self) -> tuple:
+        """
+        Figure layout parameters: the background is valid while the layout is the same.
+        """
+        limits = tuple(tuple(axis.viewLim.bounds) for axis in self._fig.axes)
+        return self._fig.dpi, self._fig.canvas.get_width_height(), limits
@@ -2,13 +2,15 @@ import numpy as np
 from numpy.typing import ArrayLike
 
 import uplot.color as ucolor
+import uplot.utool as utool
 
 from uplot.interface import LineStyle, MarkerStyle
+from uplot.utool import Decimation
 from uplot.default import DEFAULT
 
 
 def plot_line_marker(axis,
-                     color       : str | list[str],
+                     color       : str | ArrayLike,
                      x           : ArrayLike,
                      y           : ArrayLike | None = None,
                      z           : ArrayLike | None = None,
@@ -17,10 +19,24 @@ def plot_line_marker(axis,
                      marker_style: MarkerStyle | list[MarkerStyle] | None = None,
                      marker_size : float | None = None,
                      opacity     : float = 1.0,
+                     decimate    : Decimation | None = None,
+                     n_pixels    : int = 1000,
                      **kwargs):
     """
     General plot: line, line+markers, markers(scatter).
+    Returns the created artist: Line2D or PathCollection.
     """
+    if line_style == ' ':
+        decimate = None # only markers (scatter mode): each point is visible, there is no envelope to keep
+
+    if decimate is not None and z is None and (utool.is_out_of_core(x) or utool.is_out_of_core(y)):
+        # np.memmap or chunked arrays: min/max reduction by blocks, the series is never loaded entirely
+        assert isinstance(color, str), 'per-point colors are not supported for out-of-core arrays'
+        reduced = utool.reduce_out_of_core(x, y, n_bins=n_pixels, workers=DEFAULT.reduction_workers)
+        if reduced is not None:
+            x, y = reduced
+        decimate = None # reduced or not applicable (x is not monotonic)
+
     x = np.atleast_1d(np.asarray(x))
 
     if y is None:
@@ -34,6 +50,21 @@ def plot_line_marker(axis,
     assert x.ndim == y.ndim == 1, 'the input must be 1d arrays'
     assert len(x) == len(y), 'the length of the input arrays must be the same'
 
+    if isinstance(color, str):
+        color = ucolor.name_to_hex(color)
+    else:
+        # color specified for each point (x, y): RGBA array
+        color = ucolor.to_rgba_array(color)
+        assert len(color) == len(x), 'the number of colors must match the number of points'
+
+    if decimate is not None and z is None:
+        # keep only the points which affect the rendered image
+        index = utool.decimation_index(x, y, n_pixels=n_pixels, method=decimate)
+        if index is not None:
+            x, y = x[index], y[index]
+            if not isinstance(color, str):
+                color = color[index]
+
     if z is not None:
         z = np.atleast_1d(np.asarray(z))
         assert z.ndim == 1, 'the input must be 1d arrays'
@@ -45,26 +76,21 @@ def plot_line_marker(axis,
     if marker_size is None:
         marker_size = DEFAULT.marker_size
 
-    if isinstance(color, str):
-        color = ucolor.name_to_hex(color)
-    else:
-        # color specified for each point (x, y)
-        color = [ ucolor.name_to_hex(c) for c in color ]
-
     if line_style == ' ':  # only markers (scatter mode)
-        axis.scatter(*plot_data,
-                     color=color,
-                     label=name,
-                     marker=marker_style,
-                     s=marker_size ** 2,
-                     alpha=opacity,
-                     **kwargs)
+        return axis.scatter(*plot_data,
+                            color=color,
+                            label=name,
+                            marker=marker_style,
+                            s=marker_size ** 2,
+                            alpha=opacity,
+                            **kwargs)
     else:
-        axis.plot(*plot_data,
-                  color=color,
-                  label=name,
-                  marker=marker_style,
-                  markersize=marker_size,
-                  linestyle=line_style,
-                  alpha=opacity,
-                  **kwargs)
\ No newline at end of file
+        lines = axis.plot(*plot_data,
+                          color=color,
+                          label=name,
+                          marker=marker_style,
+                          markersize=marker_size,
+                          linestyle=line_style,
+                          alpha=opacity,
+                          **kwargs)
+        return lines[0]
\ No newline at end of file
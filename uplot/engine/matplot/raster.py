@@ -0,0 +1,25 @@
+import io
+import numpy as np
+from numpy import ndarray
+from typing import Callable
+
+
+class RasterWriter(io.RawIOBase):
+    """
+    Writable stream for `savefig(format='raw')`: the rendered RGBA buffer is passed to **consume**
+    as (height, width, 4) uint8 array without intermediate copies (valid only during the call).
+    """
+
+    def __init__(self, consume: Callable[[ndarray], None]):
+        super().__init__()
+        self._consume = consume
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer) -> int:
+        rgba = np.asarray(buffer) # memoryview of the renderer buffer
+        assert rgba.ndim == 3, 'RGBA buffer of the renderer is expected'
+
+        self._consume(rgba)
+        return rgba.nbytes
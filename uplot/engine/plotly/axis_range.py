@@ -1,12 +1,101 @@
 import numpy as np
-from typing import Literal
+from typing import Any, Literal
 
 from uplot.engine.plotly.scale import get_scale
 
 
+AxisName = Literal['x', 'y', 'z']
+
+
+class AxisBounds:
+    """
+    Running min/max of the plotted data per axis (index):
+    traces are scanned once when they are added, range queries don't touch the data.
+
+    Supported data:
+      - numbers: NaN values are ignored.
+      - datetimes (datetime64, datetime objects): NaT values are ignored.
+      - categories (str, other objects): the first and the last category in the order of appearance.
+    """
+
+    def __init__(self):
+        self._min: dict[str, Any] = { }
+        self._max: dict[str, Any] = { }
+        self._categories: dict[str, dict] = { } # axis -> ordered categories
+        self._indexed = 0 # number of indexed traces
+
+
+    def sync(self, traces: tuple):
+        """
+        Index the traces added since the last call. The index is rebuilt if traces are removed.
+        """
+        if len(traces) < self._indexed:
+            self.reset()
+
+        for trace in traces[self._indexed:]:
+            for axis in ('x', 'y', 'z'):
+                if axis in trace:
+                    self.update(axis, trace[axis])
+
+        self._indexed = len(traces)
+
+
+    def update(self, axis: AxisName, values: Any):
+        """
+        Extend the bounds of the axis by the values.
+        """
+        if values is None:
+            return
+
+        values = np.asarray(values)
+        if values.size == 0:
+            return
+
+        values = _as_datetime(values)
+
+        if values.dtype.kind in 'biufM':
+            # numbers and datetimes: NaN, NaT are ignored
+            valid = values[~np.isnan(values)] if values.dtype.kind in 'fM' else values
+            if valid.size == 0:
+                return
+
+            min_value, max_value = np.min(valid), np.max(valid)
+            if axis in self._min:
+                min_value = min(self._min[axis], min_value)
+                max_value = max(self._max[axis], max_value)
+        else:
+            # categories: plotly places them in the order of appearance
+            categories = self._categories.setdefault(axis, { })
+            categories.update(dict.fromkeys(values.ravel().tolist()))
+
+            min_value, max_value = next(iter(categories)), next(reversed(categories))
+
+        self._min[axis] = min_value
+        self._max[axis] = max_value
+
+
+    def get(self, axis: AxisName, mode: Literal['min', 'max']) -> Any | None:
+        """
+        The min/max data value of the axis or None if there is no data.
+        """
+        return { 'min': self._min, 'max': self._max }[mode].get(axis)
+
+
+    def is_categorical(self, axis: AxisName) -> bool:
+        return axis in self._categories
+
+
+    def reset(self):
+        self._min.clear()
+        self._max.clear()
+        self._categories.clear()
+        self._indexed = 0
+
+
 def estimate_axis_range(figure,
-                        axis: Literal['x', 'y', 'z'],
-                        mode: Literal['min', 'max']) -> float:
+                        axis  : AxisName,
+                        mode  : Literal['min', 'max'],
+                        bounds: AxisBounds) -> Any:
     """
     Setting only min or only max is not implemented in plotly,
     so manual estimation of min/max is required:
@@ -14,35 +103,51 @@ def estimate_axis_range(figure,
         https://github.com/plotly/plotly.js/issues/400
         https://github.com/plotly/plotly.py/issues/3634
     """
-    if figure.data is None:
-        raise RuntimeError('there is no any graph, use xlim/ylim after plotting or '
-                           'specify both range_min and range_max')
-
     # estimate min/max from data
-    data_minmax = []
-    for trace_data in figure.data:
-        values = trace_data[axis]
-        if np.issubdtype(values.dtype, np.number):
-            # array of numbers
-            minmax_estimate = { 'min': np.min, 'max': np.max }[mode]
-        else:
-            # array of str or other objects
-            minmax_estimate = { 'min': lambda x: x[0], 'max': lambda x: x[-1] }[mode]
+    bounds.sync(figure.data)
+    minmax = bounds.get(axis, mode)
 
-        data_minmax.append(minmax_estimate(values))
+    if minmax is None:
+        raise RuntimeError('there is no any graph, use xlim/ylim after plotting or '
+                           'specify both range_min and range_max')
 
-    minmax = minmax_estimate(data_minmax)
+    if bounds.is_categorical(axis):
+        return minmax # categories are not comparable with the range
 
     # estimate min/max from range
-    axis_name: str = {
+    axis_name: str | None = {
         'x': 'xaxis',
         'y': 'yaxis'
-    }[axis]
+    }.get(axis)
 
-    axis_range = figure.layout[axis_name]['range']
+    axis_range = None if axis_name is None else figure.layout[axis_name]['range']
     if axis_range is not None:
-        if get_scale(figure, axis) == 'log':
+        if isinstance(minmax, np.datetime64):
+            axis_range = np.asarray(axis_range, dtype=minmax.dtype)
+        elif get_scale(figure, axis) == 'log':
             axis_range = 10**np.asarray(axis_range)
+
+        minmax_estimate = { 'min': min, 'max': max }[mode]
         minmax = minmax_estimate([ minmax, *axis_range ])
 
-    return minmax
\ No newline at end of file
+    return minmax
+
+
+## Protected ##
+
+def _as_datetime(values: np.ndarray) -> np.ndarray:
+    """
+    Object arrays of datetime objects as datetime64, other arrays as is.
+    """
+    if values.dtype != object:
+        return values
+
+    import datetime
+    first = next((value for value in values.flat if value is not None), None)
+    if not isinstance(first, (datetime.date, np.datetime64)):
+        return values
+
+    try:
+        return values.astype('datetime64[us]')
+    except (TypeError, ValueError):
+        return values
@@ -0,0 +1,89 @@
+import base64
+import numpy as np
+from typing import Any
+
+
+# numpy dtype -> plotly.js typed array dtype
+TYPED_ARRAY_DTYPE: dict[str, str] = {
+    'int8'   : 'i1',
+    'uint8'  : 'u1',
+    'int16'  : 'i2',
+    'uint16' : 'u2',
+    'int32'  : 'i4',
+    'uint32' : 'u4',
+    'float32': 'f4',
+    'float64': 'f8',
+}
+
+
+def encode_typed_arrays(obj: Any) -> Any:
+    """
+    Replace numeric numpy arrays in a (nested) figure structure with plotly.js typed array specs:
+
+        { 'dtype': 'f8', 'bdata': '<base64>', 'shape': 'rows,cols' }
+
+    The original dtype is preserved (64-bit integers are narrowed to 32-bit if possible).
+    Typed arrays are supported by plotly.js >= 2.28.
+    The input is not modified, a new structure is returned.
+    """
+    if isinstance(obj, np.ndarray):
+        return to_typed_array(obj)
+
+    if isinstance(obj, dict):
+        return { key: encode_typed_arrays(value) for key, value in obj.items() }
+
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(encode_typed_arrays(value) for value in obj)
+
+    return obj
+
+
+def to_typed_array(array: np.ndarray) -> dict | np.ndarray:
+    """
+    Convert a numpy array to a plotly.js typed array spec.
+    Unsupported arrays (non-numeric, empty, ndim > 3) are returned as is.
+    """
+    if array.size == 0 or not 1 <= array.ndim <= 3:
+        return array
+
+    dtype = _typed_array_dtype(array)
+    if dtype is None:
+        return array
+
+    # plotly.js expects little-endian C-ordered data
+    array = np.ascontiguousarray(array, dtype=dtype.newbyteorder('<'))
+
+    spec = {
+        'dtype': TYPED_ARRAY_DTYPE[dtype.name],
+        'bdata': base64.b64encode(array).decode('ascii'),
+    }
+    if array.ndim > 1:
+        spec['shape'] = ','.join(str(n) for n in array.shape)
+
+    return spec
+
+
+## Protected ##
+
+def _typed_array_dtype(array: np.ndarray) -> np.dtype | None:
+    """
+    Typed array compatible dtype for the array or None if the conversion is not possible.
+    """
+    dtype = array.dtype
+
+    if dtype.name in TYPED_ARRAY_DTYPE:
+        return dtype
+
+    if dtype.kind == 'f':
+        # float16, longdouble
+        return np.dtype(np.float64)
+
+    if dtype.kind in 'iu':
+        # 64-bit integers: not supported by plotly.js
+        narrow = np.dtype(np.int32 if dtype.kind == 'i' else np.uint32)
+        info = np.iinfo(narrow)
+        if info.min <= array.min() and array.max() <= info.max:
+            return narrow
+        return np.dtype(np.float64)
+
+    return None
@@ -2,15 +2,22 @@ import numpy as np
 from numpy.typing import ArrayLike
 
 import uplot.color as ucolor
+import uplot.utool as utool
 
 from uplot.interface import LineStyle, MarkerStyle
+from uplot.utool import Decimation
 from uplot.default import DEFAULT
+from uplot.engine.PlotlyEngine5 import RenderMode
 
 from plotly.graph_objs import Figure
 
 
+# max number of palette colors for per-point colors (more unique colors are quantized)
+PALETTE_MAX_SIZE = 4096
+
+
 def plot_line_marker(figure      : Figure,
-                     color       : str | list[str],
+                     color       : str | ArrayLike,
                      x           : ArrayLike,
                      y           : ArrayLike | None = None,
                      z           : ArrayLike | None = None,
@@ -22,10 +29,26 @@ def plot_line_marker(figure      : Figure,
                      opacity     : float = 1.0,
                      legend_group: str | None = None,
                      legend_group_title: str | None = None,
+                     decimate          : Decimation | None = None,
+                     n_pixels          : int = 1000,
+                     render_mode       : RenderMode = 'auto',
+                     webgl_threshold   : int = 50_000,
                      **kwargs):
     """
     General plot: line, line+markers, markers(scatter).
+    Returns the created trace.
     """
+    if line_style == ' ':
+        decimate = None # only markers (scatter mode): each point is visible, there is no envelope to keep
+
+    if decimate is not None and z is None and (utool.is_out_of_core(x) or utool.is_out_of_core(y)):
+        # np.memmap or chunked arrays: min/max reduction by blocks, the series is never loaded entirely
+        assert isinstance(color, str), 'per-point colors are not supported for out-of-core arrays'
+        reduced = utool.reduce_out_of_core(x, y, n_bins=n_pixels, workers=DEFAULT.reduction_workers)
+        if reduced is not None:
+            x, y = reduced
+        decimate = None # reduced or not applicable (x is not monotonic)
+
     x = np.atleast_1d(np.asarray(x))
 
     if y is None:
@@ -39,6 +62,21 @@ def plot_line_marker(figure      : Figure,
     assert x.ndim == y.ndim == 1, 'the input must be 1d arrays'
     assert len(x) == len(y), 'the length of the input arrays must be the same'
 
+    if isinstance(color, str):
+        color = ucolor.name_to_hex(color)
+    else:
+        # color specified for each point (x, y): RGBA array
+        color = ucolor.to_rgba_array(color)
+        assert len(color) == len(x), 'the number of colors must match the number of points'
+
+    if decimate is not None and z is None:
+        # keep only the points which affect the rendered image
+        index = utool.decimation_index(x, y, n_pixels=n_pixels, method=decimate)
+        if index is not None:
+            x, y = x[index], y[index]
+            if not isinstance(color, str):
+                color = color[index]
+
     if z is not None:
         z = np.atleast_1d(np.asarray(z))
         assert z.ndim == 1, 'the input must be 1d arrays'
@@ -54,12 +92,6 @@ def plot_line_marker(figure      : Figure,
     else:
         show_legend = kwargs.pop('showlegend', True)
 
-    if isinstance(color, str):
-        color = ucolor.name_to_hex(color)
-    else:
-        # color specified for each point (x, y)
-        color = [ ucolor.name_to_hex(c) for c in color ]
-
     from uplot.engine.plotly.mapping import LINE_STYLE_MAPPING, MARKER_STYLE_MAPPING
     line_style_str = LINE_STYLE_MAPPING[line_style]
     marker_style_str = MARKER_STYLE_MAPPING[marker_style]
@@ -72,13 +104,21 @@ def plot_line_marker(figure      : Figure,
         mode = 'markers'
         line['dash'] = None
     else:
-        line.setdefault('color', color)
+        if isinstance(color, str):
+            line.setdefault('color', color)
         line.setdefault('width', line_width)
         line['dash'] = line_style_str
 
-    marker.setdefault('color', color)
-    marker.setdefault('line_color', color)
-    marker.setdefault('line_width', line_width)
+    if isinstance(color, str):
+        marker.setdefault('color', color)
+        marker.setdefault('line_color', color)
+        marker.setdefault('line_width', line_width)
+    else:
+        for key, value in palette_colors(color).items():
+            marker.setdefault(key, value)
+        # no outline colors per point: the outline of the marker color is a part of the marker
+        marker.setdefault('line_width', 0)
+        marker_size += line_width
     marker['symbol'] = marker_style_str
     marker['size'] = marker_size
 
@@ -86,17 +126,26 @@ def plot_line_marker(figure      : Figure,
     hoverlabel.setdefault('namelength', -1)
 
     if z is None:
-        figure.add_scatter(x=x, y=y,
-                           name=name,
-                           mode=mode,
-                           line=line,
-                           marker=marker,
-                           opacity=opacity,
-                           showlegend=show_legend,
-                           hoverlabel=hoverlabel,
-                           legendgroup=legend_group,
-                           legendgrouptitle_text=legend_group_title,
-                           **kwargs)
+        if render_mode == 'auto':
+            render_mode = 'webgl' if len(x) >= webgl_threshold else 'svg'
+
+        # Scattergl shares the style attributes with Scatter
+        add_scatter = {
+            'svg'  : figure.add_scatter,
+            'webgl': figure.add_scattergl,
+        }[render_mode]
+
+        add_scatter(x=x, y=y,
+                    name=name,
+                    mode=mode,
+                    line=line,
+                    marker=marker,
+                    opacity=opacity,
+                    showlegend=show_legend,
+                    hoverlabel=hoverlabel,
+                    legendgroup=legend_group,
+                    legendgrouptitle_text=legend_group_title,
+                    **kwargs)
     else:
         figure.add_scatter3d(x=x, y=y, z=z,
                              name=name,
@@ -108,4 +157,29 @@ def plot_line_marker(figure      : Figure,
                              hoverlabel=hoverlabel,
                              legendgroup=legend_group,
                              legendgrouptitle_text=legend_group_title,
-                             **kwargs)
\ No newline at end of file
+                             **kwargs)
+
+    return figure.data[-1]
+
+
+def palette_colors(rgba: np.ndarray) -> dict:
+    """
+    Compact per-point colors for plotly: a color index per point and a discrete colorscale (palette)
+    instead of a color string per point. More than PALETTE_MAX_SIZE unique colors are quantized.
+    """
+    palette, index = ucolor.to_palette(rgba, max_size=PALETTE_MAX_SIZE)
+
+    if len(palette) == 1:
+        # colorscale requires at least two colors
+        palette = np.concatenate([palette, palette])
+
+    # each index value is exactly at a color stop: no interpolation between colors
+    stops = np.linspace(0, 1, num=len(palette))
+    colorscale = [ [stop, f'rgba({r},{g},{b},{a/255:.3g})'] for stop, (r, g, b, a) in zip(stops, palette) ]
+
+    return {
+        'color'     : index,
+        'colorscale': colorscale,
+        'cmin'      : 0,
+        'cmax'      : len(palette) - 1,
+    }
@@ -0,0 +1,147 @@
+import threading
+
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+
+
+# minimal figure for the renderer start up
+WARM_UP_FIGURE = {
+    'data': [ { 'type': 'scatter', 'x': [0, 1], 'y': [0, 1] } ],
+    'layout': { 'width': 100, 'height': 100 },
+}
+
+
+class RendererPool:
+    """
+    Pool of warm renderers for static image export (png, jpeg, webp, svg, pdf).
+
+    Each renderer is a worker process exporting figures with `plotly.io.to_image()`: the first export
+    in a process is slow (kaleido start up), the next ones are fast (kaleido is kept by plotly).
+    Figures are distributed between idle renderers, so the throughput scales with the pool size.
+    The renderers are started on the first export and kept until `close()`, kaleido is stopped
+    with its worker process (only the public plotly API is used, any kaleido supported by plotly works).
+    """
+
+    def __init__(self, size: int, warm_up: bool = True):
+        """
+        Parameters
+        ----------
+        size : int
+            The number of renderer processes.
+
+        warm_up : bool, optional
+            Render a minimal figure by each renderer at start up
+            so the first real export is not slowed down, by default True.
+        """
+        assert size > 0, 'the pool size must be positive'
+
+        self._size = size
+        self._warm_up = warm_up
+
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def is_started(self) -> bool:
+        return self._executor is not None
+
+
+    def start(self):
+        """
+        Start the renderer processes (called automatically on the first export).
+        """
+        with self._lock:
+            if self._executor is not None:
+                return
+
+            initializer = _warm_up if self._warm_up else None
+            executor = ProcessPoolExecutor(max_workers=self._size, initializer=initializer)
+
+            # start all processes now: the warm up is done in parallel, not on the first exports
+            wait([ executor.submit(_ping) for _ in range(self._size) ])
+
+            self._executor = executor
+
+
+    def submit(self, figure: dict,
+                     format: str = 'png',
+                     width : int | None = None,
+                     height: int | None = None,
+                     scale : float | None = None) -> Future:
+        """
+        Schedule the figure export to the first idle renderer.
+
+        Parameters
+        ----------
+        figure : dict
+            The figure as a dict, see `plotly.graph_objs.Figure.to_dict()`.
+
+        format : str, optional
+            The image format: 'png', 'jpg', 'webp', 'svg' or 'pdf', by default 'png'.
+
+        width, height : int or None, optional
+            The image size, by default the figure layout size.
+
+        scale : float or None, optional
+            The image scale factor (resolution), by default 1.
+
+        Returns
+        -------
+        Future
+            The future of the image file content (bytes).
+        """
+        self.start()
+        return self._executor.submit(_render, figure,
+                                     format=format, width=width, height=height, scale=scale)
+
+
+    def to_image(self, figure: dict, **kwargs) -> bytes:
+        """
+        Export the figure to the image file content, see `submit()` for the parameters.
+        """
+        return self.submit(figure, **kwargs).result()
+
+
+    def to_images(self, figures: list[dict], **kwargs) -> list[bytes]:
+        """
+        Export the figures in parallel, see `submit()` for the parameters.
+        Returns the image file contents in the order of figures.
+        """
+        futures = [ self.submit(figure, **kwargs) for figure in figures ]
+        return [ future.result() for future in futures ]
+
+
+    def close(self):
+        """
+        Stop the renderer processes.
+        """
+        with self._lock:
+            if self._executor is None:
+                return
+
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+## Protected ##
+
+def _warm_up():
+    import plotly.io as pio
+    pio.to_image(WARM_UP_FIGURE, format='png', validate=False)
+
+
+def _ping():
+    pass
+
+
+def _render(figure: dict, format: str, **kwargs) -> bytes:
+    import plotly.io as pio
+
+    if format == 'jpg':
+        format = 'jpeg'
+
+    return pio.to_image(figure, format=format, validate=False, **kwargs)
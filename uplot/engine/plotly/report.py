@@ -0,0 +1,185 @@
+import os
+import html
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+
+# lazy rendering: a figure is rendered when it's close to the visible area
+REPORT_SCRIPT = '''
+const uplotReport = {
+    figures: {},
+    add(index, figure) {
+        // directory mode: called by the loaded figure script
+        this.figures[index] = figure;
+        this.render(index);
+    },
+    render(index) {
+        const div = document.getElementById('uplot-figure-' + index);
+        if (div.dataset.visible !== 'true' || div.dataset.rendered === 'true') {
+            return;
+        }
+        let figure = this.figures[index];
+        if (figure === undefined) {
+            const data = document.getElementById('uplot-data-' + index);
+            if (data === null) {
+                // directory mode: load the figure script once
+                if (div.dataset.loading !== 'true') {
+                    div.dataset.loading = 'true';
+                    const script = document.createElement('script');
+                    script.src = div.dataset.src;
+                    document.head.appendChild(script);
+                }
+                return;
+            }
+            // single file mode: the figure json is parsed when it's needed only
+            figure = JSON.parse(data.textContent);
+        }
+        div.dataset.rendered = 'true';
+        div.textContent = '';
+        Plotly.newPlot(div, figure.data, figure.layout, {});
+        delete this.figures[index];
+    },
+};
+
+const uplotObserver = new IntersectionObserver((entries) => {
+    for (const entry of entries) {
+        if (entry.isIntersecting) {
+            entry.target.dataset.visible = 'true';
+            uplotObserver.unobserve(entry.target);
+            uplotReport.render(entry.target.dataset.index);
+        }
+    }
+}, { rootMargin: '500px 0px' });
+
+document.querySelectorAll('.uplot-figure').forEach((div) => uplotObserver.observe(div));
+'''
+
+REPORT_STYLE = '''
+body { font-family: sans-serif; margin: 20px; }
+.uplot-figure { margin: 0 auto 20px auto; color: #888; display: flex; align-items: center; justify-content: center; }
+'''
+
+PLOTLYJS_FILENAME = 'plotly.min.js'
+FIGURE_DIR = 'figures'
+
+# fewer figures are serialized in the current process by default:
+# the start up of worker processes and pickling of figures cost more than the parallel serialization saves
+PARALLEL_MIN_FIGURES = 8
+
+
+def write_report(figures : Sequence,
+                 path    : str,
+                 title   : str = 'Report',
+                 encoding: bool = False,
+                 workers : int | None = None):
+    """
+    Write multiple plotly figures to one HTML report with a single copy of plotly.js.
+    Figures are rendered by the browser when they are scrolled into view.
+
+    Parameters
+    ----------
+    figures : Sequence[PlotlyFigure5]
+        The figures of the report.
+
+    path : str
+        'report.html' - a single self-contained file,
+        'report/' (no extension) - a directory with `index.html`, `plotly.min.js` and a script per figure
+        (figures are loaded on scrolling too).
+
+    title : str, optional
+        The page title.
+
+    encoding : bool, optional
+        Encode trace arrays as base64 typed arrays, see `PlotlyEngine5.BINARY_ENCODING`.
+
+    workers : int or None, optional
+        The number of processes for JSON serialization of figures, by default the number of CPUs
+        (at most one per figure, no processes for less than PARALLEL_MIN_FIGURES figures).
+        If 0, figures are serialized in the current process.
+    """
+    from plotly.offline import get_plotlyjs
+
+    specs = [ (figure.internal.to_plotly_json(), encoding) for figure in figures ]
+    sizes = [ (figure.internal.layout.width, figure.internal.layout.height) for figure in figures ]
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(specs) >= PARALLEL_MIN_FIGURES else 0
+    workers = min(workers, len(specs))
+
+    if workers <= 1:
+        figures_json = list(map(_serialize, specs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            figures_json = list(executor.map(_serialize, specs, chunksize=max(1, len(specs) // (4*workers))))
+
+    is_single_file = os.path.splitext(path)[1] != ''
+
+    if is_single_file:
+        plotlyjs = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+        figure_divs = [ _figure_div(index, size) + _figure_data(index, figure_json)
+                        for index, (size, figure_json) in enumerate(zip(sizes, figures_json)) ]
+        index_file = path
+    else:
+        os.makedirs(os.path.join(path, FIGURE_DIR), exist_ok=True)
+
+        with open(os.path.join(path, PLOTLYJS_FILENAME), 'w', encoding='utf-8') as file:
+            file.write(get_plotlyjs())
+
+        figure_divs = [ ]
+        for index, (size, figure_json) in enumerate(zip(sizes, figures_json)):
+            src = f'{FIGURE_DIR}/figure_{index:05d}.js'
+            with open(os.path.join(path, src), 'w', encoding='utf-8') as file:
+                file.write(f'uplotReport.add({index}, {figure_json});')
+            figure_divs.append(_figure_div(index, size, src=src))
+
+        plotlyjs = f'<script type="text/javascript" src="{PLOTLYJS_FILENAME}"></script>'
+        index_file = os.path.join(path, 'index.html')
+
+    page = '\n'.join([
+        '<!DOCTYPE html>',
+        '<html>',
+        '<head>',
+        '<meta charset="utf-8" />',
+        f'<title>{html.escape(title)}</title>',
+        f'<style>{REPORT_STYLE}</style>',
+        plotlyjs,
+        '</head>',
+        '<body>',
+        *figure_divs,
+        f'<script type="text/javascript">{REPORT_SCRIPT}</script>',
+        '</body>',
+        '</html>',
+    ])
+
+    with open(index_file, 'w', encoding='utf-8') as file:
+        file.write(page)
+
+
+## Protected ##
+
+def _serialize(spec: tuple[dict, bool]) -> str:
+    import plotly.io as pio
+    figure, encoding = spec
+
+    if encoding:
+        from uplot.engine.plotly.encoding import encode_typed_arrays
+        figure = dict(figure, data=encode_typed_arrays(figure['data']))
+
+    # `<` and `>` are escaped, safe for embedding to html
+    return pio.json.to_json_plotly(figure)
+
+
+def _figure_div(index: int, size: tuple[float | None, float | None], src: str | None = None) -> str:
+    width, height = size
+    style = ''.join([
+        '' if width is None else f'width:{width}px;',
+        '' if height is None else f'height:{height}px;',
+    ])
+    src_attribute = '' if src is None else f' data-src="{src}"'
+    return (f'<div class="uplot-figure" id="uplot-figure-{index}" data-index="{index}"{src_attribute} '
+            f'style="{style}">loading...</div>')
+
+
+def _figure_data(index: int, figure_json: str) -> str:
+    return f'<script type="application/json" id="uplot-data-{index}">{figure_json}</script>'
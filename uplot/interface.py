@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 from numpy import ndarray
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Literal, NamedTuple, Protocol, runtime_checkable
 from abc import abstractmethod as abstract
 from numpy.typing import ArrayLike
 
-from uplot.utype import LineStyle, MarkerStyle, AspectMode, AxisScale, Colormap
-from uplot.utool import Interpolator
+from uplot.utype import LineStyle, MarkerStyle, AspectMode, AxisScale, Colormap, ImageChannels
+from uplot.utool import Interpolator, Decimation, GridDownsampling
+
+
+class TraceHandle(NamedTuple):
+    """
+    Reference to a data series (trace) of a figure, see `IFigure.extend()`.
+    """
+    index: int    # index of the trace in the figure
+    internal: Any # engine-specific object: matplotlib artist, plotly trace, ...
 
 
 @runtime_checkable
@@ -59,6 +67,32 @@ class IFigure(Protocol):
             True if the figure is in 3D mode, False otherwise.
         """
 
+    @property
+    @abstract
+    def revision(self) -> int:
+        """
+        Get the figure revision: incremented by each method which changes the figure
+        and by direct changes of the `internal` figure (detected by the engine).
+        Rendered outputs (`as_image()`, `save()`) of the same revision are cached by the engine.
+
+        Returns
+        -------
+        int
+            The figure revision.
+        """
+
+    @property
+    @abstract
+    def last_trace(self) -> TraceHandle | None:
+        """
+        Get the handle of the last data series added by `plot()` or `scatter()`.
+
+        Returns
+        -------
+        TraceHandle or None
+            The trace handle or None if nothing is plotted.
+        """
+
     @abstract
     def plot(self, x           : ArrayLike | Any,
                    y           : ArrayLike | None = None,
@@ -70,6 +104,7 @@ class IFigure(Protocol):
                    marker_size : float | None = None,
                    opacity     : float = 1.0,
                    legend_group: str | None = None,
+                   decimate    : Decimation | None = None,
                    **kwargs) -> IFigure:
         """
         Plot 2D or 3D line.
@@ -102,6 +137,16 @@ class IFigure(Protocol):
             Sets the legend group for this plot.
             Plots from the same group will be combined in the legend.
 
+        decimate : Decimation or None, optional
+            Reduce the number of points passed to the engine (2D only).
+            The pixel width of the figure is used to keep only the points that affect the image:
+              - 'minmax': keep the first, last, min and max values per pixel column (M4, spikes remain visible).
+              - 'lttb': Largest-Triangle-Three-Buckets downsampling.
+              - 'auto': use 'minmax' if the data is much denser than the pixel grid.
+            None disables decimation. The data is not decimated if x is not monotonic.
+            Out-of-core arrays (`np.memmap`, zarr, dask, h5py) are reduced as by 'minmax'
+            by blocks (any method) without loading the whole series, with None they are loaded entirely.
+
         kwargs : dict
             Other keyword arguments are forwarded to the underlying engine.
 
@@ -116,11 +161,12 @@ class IFigure(Protocol):
                       y           : ArrayLike | None = None,
                       z           : ArrayLike | None = None,
                       name        : str | None = None,
-                      color       : str | list[str] | None = None,
+                      color       : str | ArrayLike | None = None,
                       marker_style: MarkerStyle | None = None,
                       marker_size : float | None = None,
                       opacity     : float = 1.0,
                       legend_group: str | None = None,
+                      decimate    : Decimation | None = None,
                       **kwargs) -> IFigure:
         """
         Scatter plot for 2D or 3D data points.
@@ -133,8 +179,9 @@ class IFigure(Protocol):
         name : str or None, optional
             The plot name, which will appear as the legend item.
 
-        color : str, list of str, or None, optional
-            The color(s) of the markers.
+        color : str, ArrayLike, or None, optional
+            The color of the markers or a color per point:
+            an array of color names/hex strings (N) or RGB(A) values (N x 3 or N x 4) in the [0, 1] range.
 
         marker_style : MarkerStyle or None, optional
             The marker style.
@@ -148,6 +195,10 @@ class IFigure(Protocol):
         legend_group : str or None, optional
             Sets the legend group for this plot. Plots from the same group will be combined in the legend.
 
+        decimate : Decimation or None, optional
+            Not applied to markers: each point of a scatter is visible, the data is passed as is.
+            The parameter is accepted for the same signature as `plot()` (plugins).
+
         kwargs : dict
             Other keyword arguments are forwarded to the underlying engine.
 
@@ -251,6 +302,48 @@ class IFigure(Protocol):
             The figure object representing the plot.
         """
 
+    @abstract
+    def extend(self, trace     : TraceHandle,
+                     x         : ArrayLike,
+                     y         : ArrayLike | None = None,
+                     max_points: int | None = None) -> IFigure:
+        """
+        Append new samples to the plotted data series in place (live plotting).
+        The samples are appended to a buffer without a copy of the history (amortized O(new samples)).
+        The engines can't append to their traces: the whole series is passed to the engine once before
+        the next drawing or export of the figure (or access to `internal`), not on each extension.
+        An interactive matplotlib figure is redrawn on each extension, so the update is O(history) there,
+        the sliding window (**max_points**) also rescans the axes data limits in matplotlib.
+        Use **max_points** to bound the per-update cost for long-running streams.
+        It supports 2d figures only.
+
+        Parameters
+        ----------
+        trace : TraceHandle
+            The data series to extend, see `last_trace`.
+
+        x, y : ArrayLike
+            1D arrays of new samples.
+            If y is None, x is treated as y and x continues the sample index.
+
+        max_points : int or None, optional
+            Keep only the last **max_points** samples of the series (sliding window).
+            The samples are stored in a preallocated ring buffer: the memory footprint is constant.
+            If None, the whole history is kept.
+
+        Returns
+        -------
+        IFigure
+            The figure object representing the plot.
+
+        Examples
+        --------
+        >>> fig.plot(t, signal)
+        >>> trace = fig.last_trace
+        >>> fig.extend(trace, t_new, signal_new)
+        >>> fig.extend(trace, t_new, signal_new, max_points=10000) # the last 10000 samples only
+        """
+
     @abstract
     def surface3d(self, x            : ArrayLike | Any,
                         y            : ArrayLike | None = None,
@@ -260,8 +353,10 @@ class IFigure(Protocol):
                         colormap     : Colormap = 'viridis',
                         opacity      : float = 1.0,
                         interpolation: Interpolator = 'cubic',
-                        interpolation_range: int = 100,
+                        interpolation_range: int | None = 100,
                         legend_group : str | None = None,
+                        max_facets   : int | Literal['auto'] | None = 'auto',
+                        downsampling : GridDownsampling = 'mean',
                         **kwargs) -> IFigure:
         """
         Plot a surface in 3D space where the color scale corresponds to the z-values.
@@ -290,12 +385,22 @@ class IFigure(Protocol):
         interpolation : Interpolator, optional
             The interpolation method for the case when (x, y, z) is a non-uniform grid.
 
-        interpolation_range : int, optional
-            The number of points in the interpolated grid.
+        interpolation_range : int or None, optional
+            The number of points in the interpolated grid (per axis).
+            If None, it's derived from the density of points.
 
         legend_group : str or None, optional
             Sets the legend group for this plot. Plots from the same group will be combined in the legend.
 
+        max_facets : int, 'auto' or None, optional
+            The maximum number of facets of the surface, larger grids are reduced by blocks (level of detail).
+            'auto' uses the engine limit (`SURFACE_MAX_FACETS`), None disables the reduction.
+
+        downsampling : GridDownsampling, optional
+            The reduction of a block of the grid:
+              - 'mean': NaN-aware mean of the block.
+              - 'minmax': the block min or max, whichever is farther from the mean (peaks remain visible).
+
         kwargs : dict
             Other keyword arguments are forwarded to the underlying engine.
 
@@ -347,7 +452,7 @@ class IFigure(Protocol):
         """
 
     @abstract
-    def imshow(self, image: ArrayLike, **kwargs) -> IFigure:
+    def imshow(self, image: ArrayLike, value_range: float | None = None, **kwargs) -> IFigure:
         """
         Display an image.
 
@@ -356,6 +461,10 @@ class IFigure(Protocol):
         image : ArrayLike
             Image data. Supported ranges: double [0, 1], uint8, uint16.
 
+        value_range : float or None, optional
+            The max value of the image range [0, value_range].
+            By default the range is detected by the image type and values (the image is scanned).
+
         kwargs : dict
             Other keyword arguments are forwarded to the underlying engine.
 
@@ -622,14 +731,41 @@ class IFigure(Protocol):
         """
 
     @abstract
-    def as_image(self) -> ndarray:
+    def as_image(self, dpi     : float | None = None,
+                       channels: ImageChannels | None = None,
+                       out     : ndarray | None = None) -> ndarray:
         """
-        Get the figure as a numpy array.
+        Render the figure to a numpy array. The figure state is not changed.
+
+        Parameters
+        ----------
+        dpi : float or None, optional
+            The image resolution: the figure width (in pixels) corresponds to 100 dpi,
+            by default the engine saving resolution (2x).
+
+        channels : ImageChannels, optional
+            The pixel layout: 'rgb' - (height, width, 3) or 'rgba' - (height, width, 4), uint8.
+            By default the engine layout: 'rgba' for matplotlib, 'rgb' for plotly.
+
+        out : ndarray or None, optional
+            Preallocated C-contiguous uint8 array of the image shape to render into (no allocation per frame).
 
         Returns
         -------
         ndarray
-            The figure as an image.
+            The figure as an image: **out** or a new array.
+
+        Raises
+        ------
+        ValueError
+            If **out** is not a uint8 array of the image shape.
+
+        Examples
+        --------
+        >>> frame = fig.as_image(dpi=100)
+        >>> for x, y in stream:
+        ...     fig.extend(fig.last_trace, x, y)
+        ...     fig.as_image(dpi=100, out=frame)
         """
 
     @abstract
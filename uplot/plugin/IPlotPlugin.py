@@ -98,11 +98,17 @@ def plot(plot_method: Callable,
     No further actions are needed.
     Otherwise, returns False, and x, y, z are regular arrays.
     """
-    # check if x is a custom object or regular arrays
-    x_type = get_type(x)
     if y is not None or z is not None:
         return False
-    
+
+    # check if x is a custom object or regular arrays:
+    # items are inspected only if a plugin is registered for homogeneous containers of this type (e.g. list[T])
+    x_type = type(x)
+    if plugin.is_container_registered(x_type) and len(x) > 0:
+        # all items are checked only if a plugin is registered for the type of the first one
+        if plugin.is_registered(_container_type(x_type, type(x[0]))):
+            x_type = get_type(x)
+
     if not plugin.is_registered(x_type):
         return False
 
@@ -145,16 +151,30 @@ def get_type(obj: Any) -> type | GenericAlias:
         return obj_type
 
     item0_type = type(obj[0])
-    is_homogeneous = all([type(i) is item0_type for i in obj])
+    # stops at the first item of another type
+    is_homogeneous = all(type(i) is item0_type for i in obj)
 
     if not is_homogeneous:
         return obj_type
 
+    container_type = _container_type(obj_type, item0_type)
+    if container_type is None:
+        raise NotImplementedError(obj_type)
+
+    return container_type
+
+
+## Protected ##
+
+def _container_type(obj_type: type, item_type: type) -> GenericAlias | None:
+    """
+    The type of a homogeneous container: list[T] or tuple[T, ...], None for other containers.
+    """
     if obj_type is list:
         # homogeneous list
-        return GenericAlias(list, item0_type)
+        return GenericAlias(list, item_type)
     elif obj_type is tuple:
         # homogeneous tuple
-        return GenericAlias(tuple, (item0_type, ...))
-    else:
-        raise NotImplementedError(obj_type)
\ No newline at end of file
+        return GenericAlias(tuple, (item_type, ...))
+
+    return None
\ No newline at end of file
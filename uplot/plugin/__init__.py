@@ -1,6 +1,6 @@
 from uplot.plugin.IPlotPlugin import IPlotPlugin, PlotData, PlotType
 from uplot.plugin.IPlotPlugin import plot
-from uplot.plugin.manage import register, is_registered, get_handler
+from uplot.plugin.manage import register, is_registered, is_container_registered, get_handler
 
 
 __all__ = [
@@ -16,5 +16,6 @@ __all__ = [
     'plot',
     'register',
     'is_registered',
+    'is_container_registered',
     'get_handler'
 ]
\ No newline at end of file
@@ -1,25 +1,43 @@
+from abc import ABCMeta, get_cache_token
 from types import GenericAlias
 from uplot.plugin.IPlotPlugin import IPlotPlugin
 
 
 REGISTERED_TYPES: dict[type | GenericAlias, IPlotPlugin] = {}
+# container types of the registered generic aliases: list for list[T], tuple for tuple[T, ...]
+REGISTERED_CONTAINERS: set[type] = set()
+
+# resolved handler (or None) per concrete type, cleared by `register()`
+# and by `ABC.register()` of any ABC (it changes the ABC cache token)
+RESOLVED_TYPES: dict[type | GenericAlias, IPlotPlugin | None] = {}
+RESOLVED_TOKEN = get_cache_token()
 
 
 def is_registered(t: type | GenericAlias) -> bool:
     """
-    Checks whether type **t** is registered and has a handler.
+    Checks whether type **t** has a handler: registered for the type itself, a base class,
+    an ABC or a runtime checkable Protocol which **t** is a subclass of.
     """
-    return t in REGISTERED_TYPES
+    return get_handler(t) is not None
+
+
+def is_container_registered(t: type) -> bool:
+    """
+    Checks whether a handler is registered for homogeneous containers of type **t** (e.g. list[T] for list).
+    """
+    return t in REGISTERED_CONTAINERS
 
 
 def register(t: type | GenericAlias, handler: IPlotPlugin, force: bool = False) -> bool:
     """
     Register a handler for the specified type **t**.
+    The handler is used for subclasses of **t** too (unless they have their own handler).
 
     Parameters
     ----------
     t : type
-        The type to register.
+        The type to register: a class, an ABC, a runtime checkable Protocol,
+        or a homogeneous container: list[T], tuple[T, ...].
 
     handler : IPlotPlugin
         The plugin for data extraction from the specified type **t**.
@@ -35,19 +53,94 @@ def register(t: type | GenericAlias, handler: IPlotPlugin, force: bool = False)
     if isinstance(handler, type):
         raise RuntimeError('handler must be instance not a type')
 
-    if is_registered(t) and not force:
+    if t in REGISTERED_TYPES and not force:
         # already registered
         return False
 
     REGISTERED_TYPES[t] = handler
+    if isinstance(t, GenericAlias) and t.__origin__ in (list, tuple):
+        # items of other generic containers (e.g. dict[K, V]) are not inspected by `plot()`
+        REGISTERED_CONTAINERS.add(t.__origin__)
+
+    RESOLVED_TYPES.clear()
     return True
 
 
 def get_handler(t: type | GenericAlias) -> IPlotPlugin | None:
     """
-    Get plotting plugin(handler) for the registered type.
+    Get plotting plugin(handler) for the type: the handler of the closest class in the MRO,
+    otherwise the first registered ABC/Protocol which the type is a subclass of.
+    list[T] and tuple[T, ...] are resolved by the item type T.
+    """
+    global RESOLVED_TOKEN
+    if RESOLVED_TOKEN != get_cache_token():
+        # virtual subclasses are changed: cached results (misses too) could be outdated
+        RESOLVED_TYPES.clear()
+        RESOLVED_TOKEN = get_cache_token()
+
+    try:
+        return RESOLVED_TYPES[t]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable (e.g. a generic alias of unhashable args): no caching
+        return _resolve(t)
+
+    handler = _resolve(t)
+    RESOLVED_TYPES[t] = handler
+    return handler
+
+
+## Protected ##
+
+def _resolve(t: type | GenericAlias) -> IPlotPlugin | None:
+    handler = REGISTERED_TYPES.get(t)
+    if handler is not None:
+        return handler
+
+    if isinstance(t, GenericAlias):
+        return _resolve_container(t)
+
+    if not isinstance(t, type):
+        return None
+
+    # the closest registered base class
+    for base in t.__mro__[1:]:
+        handler = REGISTERED_TYPES.get(base)
+        if handler is not None:
+            return handler
+
+    # virtual base classes: ABC (`ABC.register()`) and runtime checkable Protocols
+    for registered, handler in REGISTERED_TYPES.items():
+        if _is_virtual_base(registered) and _is_subclass(t, registered):
+            return handler
+
+    return None
+
+
+def _resolve_container(t: GenericAlias) -> IPlotPlugin | None:
+    """
+    list[T] or tuple[T, ...]: the handler of the closest base class of T.
     """
-    if is_registered(t):
-        return REGISTERED_TYPES[t]
+    origin, args = t.__origin__, t.__args__
+    if not isinstance(args[0], type):
+        return None
 
-    return None
\ No newline at end of file
+    for base in args[0].__mro__[1:]:
+        handler = REGISTERED_TYPES.get(GenericAlias(origin, (base, *args[1:])))
+        if handler is not None:
+            return handler
+
+    return None
+
+
+def _is_virtual_base(t: type | GenericAlias) -> bool:
+    return isinstance(t, ABCMeta) or getattr(t, '_is_runtime_protocol', False)
+
+
+def _is_subclass(t: type, base: type) -> bool:
+    try:
+        return issubclass(t, base)
+    except TypeError:
+        # e.g. protocols with data members don't support issubclass()
+        return False
@@ -1,18 +1,39 @@
 from uplot.utool.param import unpack_param
-from uplot.utool.image import image_range, image_encode_base64
-from uplot.utool.grid import array_to_grid, Interpolator
+from uplot.utool.image import image_range, image_encode_base64, image_encode_png, image_to_channels
+from uplot.utool.grid import array_to_grid, auto_grid_range, clear_grid_cache, downsample_grid, Interpolator, GridDownsampling
+from uplot.utool.decimate import decimation_index, is_out_of_core, reduce_out_of_core, Decimation
+from uplot.utool.buffer import AppendBuffer, RingBuffer, SeriesBuffer
+from uplot.utool.cache import RenderCache, mutating
 
 
 __all__ = [ 
 
+    # classes
+
+    'AppendBuffer',
+    'RingBuffer',
+    'SeriesBuffer',
+    'RenderCache',
+
     # functions
 
     'unpack_param',
     'image_range',
     'image_encode_base64',
+    'image_encode_png',
+    'image_to_channels',
     'array_to_grid',
+    'auto_grid_range',
+    'clear_grid_cache',
+    'downsample_grid',
+    'decimation_index',
+    'is_out_of_core',
+    'reduce_out_of_core',
+    'mutating',
 
     # types
 
-    'Interpolator'
+    'Interpolator',
+    'GridDownsampling',
+    'Decimation',
 ]
\ No newline at end of file
@@ -0,0 +1,223 @@
+import numpy as np
+from numpy import ndarray
+from numpy.typing import ArrayLike
+
+
+class AppendBuffer:
+    """
+    1D array with amortized O(1) appending: the storage grows geometrically,
+    so the cost of `append()` depends on the size of appended data only.
+    """
+    GROWTH_FACTOR = 2
+
+
+    def __init__(self, data: ArrayLike, capacity: int | None = None):
+        """
+        Parameters
+        ----------
+        data : ArrayLike
+            Initial 1D data.
+
+        capacity : int or None, optional
+            Initial capacity of the storage, by default twice the data size.
+        """
+        data = np.atleast_1d(np.asarray(data))
+        assert data.ndim == 1, 'the input must be 1d array'
+
+        if capacity is None:
+            capacity = self.GROWTH_FACTOR*len(data)
+        capacity = max(capacity, len(data), 1)
+
+        self._storage = np.empty(capacity, dtype=data.dtype)
+        self._storage[:len(data)] = data
+        self._size = len(data)
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    @property
+    def data(self) -> ndarray:
+        """
+        The buffer content (view, no copy).
+        """
+        return self._storage[:self._size]
+
+
+    def append(self, values: ArrayLike):
+        """
+        Append values to the end of the buffer.
+        """
+        values = np.atleast_1d(np.asarray(values))
+        assert values.ndim == 1, 'the input must be 1d array'
+
+        size = self._size + len(values)
+        dtype = np.result_type(self._storage, values)
+
+        if size > len(self._storage) or dtype != self._storage.dtype:
+            # reallocate the storage with a reserve for future appending
+            storage = np.empty(max(size, self.GROWTH_FACTOR*len(self._storage)), dtype=dtype)
+            storage[:self._size] = self.data
+            self._storage = storage
+
+        self._storage[self._size:size] = values
+        self._size = size
+
+
+class RingBuffer:
+    """
+    1D array of fixed capacity: appending overwrites the oldest values, no reallocation.
+    The values are stored twice (mirrored storage) so the content is always
+    available as a contiguous view in the chronological order.
+    """
+
+    def __init__(self, capacity: int, data: ArrayLike | None = None, dtype: np.dtype | type | None = None):
+        """
+        Parameters
+        ----------
+        capacity : int
+            The max number of stored values.
+
+        data : ArrayLike or None, optional
+            Initial 1D data, only the last **capacity** values are kept.
+
+        dtype : np.dtype or None, optional
+            The data type of the storage, by default the type of the initial data or float64.
+        """
+        assert capacity > 0, 'capacity must be positive'
+
+        if data is not None:
+            data = np.atleast_1d(np.asarray(data))
+            assert data.ndim == 1, 'the input must be 1d array'
+            if dtype is None:
+                dtype = data.dtype
+
+        self._storage = np.empty(2*capacity, dtype=np.float64 if dtype is None else dtype)
+        self._capacity = capacity
+        self._start = 0 # index of the oldest value
+        self._size = 0
+
+        if data is not None:
+            self.append(data)
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def data(self) -> ndarray:
+        """
+        The buffer content from the oldest to the newest value (view, no copy).
+        """
+        return self._storage[self._start:self._start + self._size]
+
+
+    def append(self, values: ArrayLike):
+        """
+        Append values to the end of the buffer, the oldest values are overwritten if the buffer is full.
+        """
+        values = np.atleast_1d(np.asarray(values))
+        assert values.ndim == 1, 'the input must be 1d array'
+
+        dtype = np.result_type(self._storage, values)
+        if dtype != self._storage.dtype:
+            # promote the storage type (e.g. int -> float), the capacity is not changed
+            self._storage = self._storage.astype(dtype)
+
+        capacity = self._capacity
+        values = values[-capacity:]
+        count = len(values)
+
+        # write position, split into two parts if the end of the storage is reached
+        pos = (self._start + self._size) % capacity
+        head = min(count, capacity - pos)
+        tail = count - head
+
+        for ofs in (0, capacity):
+            # main and mirrored storage
+            self._storage[ofs + pos:ofs + pos + head] = values[:head]
+            self._storage[ofs:ofs + tail] = values[head:]
+
+        overflow = max(self._size + count - capacity, 0)
+        self._start = (self._start + overflow) % capacity
+        self._size = min(self._size + count, capacity)
+
+
+class SeriesBuffer:
+    """
+    Data (x, y) of a plotted series with appending of new samples:
+      - unlimited: amortized growable storage, see `AppendBuffer`.
+      - limited to **max_points**: fixed memory storage with the last samples only, see `RingBuffer`.
+    """
+
+    def __init__(self, x: ArrayLike, y: ArrayLike, max_points: int | None = None):
+        if max_points is None:
+            self._x = AppendBuffer(x)
+            self._y = AppendBuffer(y)
+        else:
+            self._x = RingBuffer(capacity=max_points, data=x)
+            self._y = RingBuffer(capacity=max_points, data=y)
+
+        assert len(self._x) == len(self._y), 'the length of the input arrays must be the same'
+
+        self._max_points = max_points
+        self._count = np.size(y) # total number of samples ever added
+
+
+    def __len__(self) -> int:
+        return len(self._y)
+
+
+    @property
+    def max_points(self) -> int | None:
+        return self._max_points
+
+    @property
+    def x(self) -> ndarray:
+        return self._x.data
+
+    @property
+    def y(self) -> ndarray:
+        return self._y.data
+
+
+    def extend(self, x: ArrayLike, y: ArrayLike | None = None) -> tuple[ndarray, ndarray]:
+        """
+        Append new samples. If y is None, x is treated as y and x continues the sample index.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray]
+            The appended x, y samples.
+        """
+        x, y = normalize_samples(x, y, start=self._count)
+
+        self._x.append(x)
+        self._y.append(y)
+        self._count += len(y)
+
+        return x, y
+
+
+def normalize_samples(x: ArrayLike, y: ArrayLike | None, start: int) -> tuple[ndarray, ndarray]:
+    """
+    Convert new samples to 1D arrays. If y is None, x is treated as y and x is the sample index from **start**.
+    """
+    x = np.atleast_1d(np.asarray(x))
+
+    if y is None:
+        y = x
+        x = np.arange(start, start + len(y))
+    else:
+        y = np.atleast_1d(np.asarray(y))
+
+    assert x.ndim == y.ndim == 1, 'the input must be 1d arrays'
+    assert len(x) == len(y), 'the length of the input arrays must be the same'
+
+    return x, y
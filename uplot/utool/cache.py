@@ -0,0 +1,137 @@
+import functools
+import numpy as np
+
+from typing import Any, Callable, Hashable
+from collections import OrderedDict
+
+
+class RenderCache:
+    """
+    LRU cache of rendered outputs (images, file contents) bounded by the memory size.
+
+    Entries are grouped by an owner (e.g. a figure) and are valid for the owner revision only:
+    storing an entry for a new revision drops the entries of the previous one.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Parameters
+        ----------
+        max_bytes : int
+            The memory limit of the stored values, 0 - caching is disabled.
+        """
+        self._max_bytes = max_bytes
+        self._size = 0
+
+        self._entries: OrderedDict[tuple[Hashable, Hashable], tuple[Any, int]] = OrderedDict()
+        self._revisions: dict[Hashable, int] = { }
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    @property
+    def size(self) -> int:
+        """
+        The memory size of the stored values in bytes.
+        """
+        return self._size
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        self._max_bytes = value
+        self._evict()
+
+
+    def get(self, owner: Hashable, revision: int, key: Hashable) -> Any | None:
+        """
+        Get the value stored for the owner revision or None.
+        """
+        if self._revisions.get(owner) != revision:
+            return None
+
+        entry = self._entries.get((owner, key))
+        if entry is None:
+            return None
+
+        self._entries.move_to_end((owner, key))
+        return entry[0]
+
+
+    def put(self, owner: Hashable, revision: int, key: Hashable, value: Any):
+        """
+        Store the value: ndarray, bytes or str. The least recently used values are evicted if the limit is exceeded.
+        """
+        size = value_size(value)
+        if size > self._max_bytes:
+            return
+
+        if self._revisions.get(owner) != revision:
+            self.clear(owner)
+            self._revisions[owner] = revision
+
+        self._remove((owner, key))
+        self._entries[(owner, key)] = (value, size)
+        self._size += size
+
+        self._evict()
+
+
+    def clear(self, owner: Hashable | None = None):
+        """
+        Remove the values of the owner or all values.
+        """
+        if owner is None:
+            self._entries.clear()
+            self._revisions.clear()
+            self._size = 0
+            return
+
+        for entry_key in [ entry_key for entry_key in self._entries if entry_key[0] == owner ]:
+            self._remove(entry_key)
+        self._revisions.pop(owner, None)
+
+
+    ## Protected ##
+
+    def _remove(self, entry_key: tuple[Hashable, Hashable]):
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def _evict(self):
+        while self._size > self._max_bytes and len(self._entries) > 0:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+
+
+def value_size(value: Any) -> int:
+    """
+    Approximate memory size of a cached value in bytes.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+
+    raise TypeError(f'unsupported value type: {type(value)}')
+
+
+def mutating(method: Callable) -> Callable:
+    """
+    Decorator of a method which changes the object content: increments `self._revision`,
+    so the cached outputs of the previous revision are not used anymore.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._revision += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
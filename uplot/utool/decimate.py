@@ -0,0 +1,383 @@
+import numpy as np
+from numpy import ndarray
+from typing import Any, Literal
+
+
+Decimation = Literal[
+    'minmax', # first, last, min & max per pixel column (M4)
+    'lttb',   # Largest-Triangle-Three-Buckets
+    'auto',   # 'minmax' if the data is much denser than the pixel grid
+]
+
+# 'auto' mode: decimate only if there are more points per pixel column
+AUTO_POINTS_PER_PIXEL = 4
+
+# out-of-core series: the number of values read at once (per worker)
+BLOCK_SIZE = 2**22
+
+
+def decimation_index(x       : ndarray,
+                     y       : ndarray,
+                     n_pixels: int,
+                     method  : Decimation) -> ndarray | None:
+    """
+    Select points which affect the rendered image of a 2D line/scatter plot.
+
+    Parameters
+    ----------
+    x, y : np.ndarray
+        1D arrays of the same size.
+    n_pixels : int
+        The number of pixel columns available for the plot (figure width in pixels).
+    method : Decimation
+        Decimation method:
+          - 'minmax': keep the first, last, min and max points for each pixel column (M4).
+          - 'lttb': Largest-Triangle-Three-Buckets downsampling to 2 points per pixel column.
+          - 'auto': 'minmax' if the data is much denser than the pixel grid.
+
+    Returns
+    -------
+    np.ndarray or None
+        Sorted indices of the points to keep or None if decimation is not required
+        (or not applicable: x is not monotonic).
+    """
+    assert n_pixels > 0, 'number of pixels must be positive'
+
+    if method == 'auto':
+        if len(y) <= AUTO_POINTS_PER_PIXEL*n_pixels:
+            return None
+        method = 'minmax'
+
+    if method == 'minmax':
+        return minmax_index(x, y, n_bins=n_pixels)
+
+    if method == 'lttb':
+        return lttb_index(x, y, n_out=2*n_pixels)
+
+    raise ValueError(f'unsupported decimation method: {method}')
+
+
+def minmax_index(x: ndarray, y: ndarray, n_bins: int) -> ndarray | None:
+    """
+    M4 decimation: split the data into **n_bins** uniform in x and keep the first, last, min and max points
+    of each bin, the rasterized line is the same as of the full data.
+    NaN values are preserved (one per bin) to keep gaps in lines.
+    Returns None (no decimation) if x is not monotonic (e.g. scatter data): bins of points
+    which are not neighbours in x don't represent the visual envelope.
+    """
+    n = len(y)
+    if n <= 4*n_bins:
+        return None
+
+    x = _as_numeric(x, n)
+    if not _is_monotonic(x):
+        return None
+
+    bounds = _bin_bounds(x, x[0], x[-1], n_bins)
+    starts = np.concatenate([[0], bounds])
+    ends = np.concatenate([bounds, [n]])
+
+    index = [ ]
+    for start, end in zip(starts, ends):
+        if start == end:
+            continue # empty bin
+        index.append(start + _segment_m4(y[start:end]))
+
+    return np.unique(np.concatenate(index))
+
+
+def lttb_index(x: ndarray, y: ndarray, n_out: int) -> ndarray | None:
+    """
+    Largest-Triangle-Three-Buckets downsampling to **n_out** points.
+    Visually preserves the shape of the line including spikes.
+    Returns None (no decimation) if x is not monotonic (e.g. scatter data).
+
+    Reference: S. Steinarsson, "Downsampling Time Series for Visual Representation", 2013.
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return None
+
+    x = _as_numeric(x, n)
+    if not _is_monotonic(x):
+        return None
+    # differences of unsigned/datetime values would wrap around
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # the first and the last points are always selected,
+    # the rest is split into (n_out - 2) buckets
+    edges = np.linspace(1, n - 1, num=n_out - 1).astype(np.int64)
+
+    index = np.empty(n_out, dtype=np.int64)
+    index[0] = 0
+    index[-1] = n - 1
+
+    a = 0 # previously selected point
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # average point of the next bucket
+        if i < n_out - 3:
+            next_start, next_end = end, edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        with np.errstate(invalid='ignore'):
+            avg_x = np.nanmean(x[next_start:next_end])
+            avg_y = np.nanmean(y[next_start:next_end])
+
+        # the area of the triangle (a, point, avg) for each point in the bucket
+        area = np.abs((x[a] - avg_x)*(y[start:end] - y[a]) -
+                      (x[a] - x[start:end])*(avg_y - y[a]))
+
+        if np.all(np.isnan(area)):
+            a = start
+        else:
+            a = start + int(np.nanargmax(area))
+        index[i + 1] = a
+
+    return index
+
+
+def is_out_of_core(a: Any) -> bool:
+    """
+    Check if the array is not (necessarily) in memory: `np.memmap` or a chunked array-like
+    (zarr, dask, h5py, ...: exposes `__array__` and `chunks`).
+    """
+    if isinstance(a, np.memmap):
+        return True
+
+    return (not isinstance(a, np.ndarray) and hasattr(a, '__array__') and
+            hasattr(a, 'shape') and getattr(a, 'chunks', None) is not None)
+
+
+def reduce_out_of_core(x      : Any,
+                       y      : Any | None,
+                       n_bins : int,
+                       workers: int = 1) -> tuple[ndarray, ndarray] | None:
+    """
+    M4 decimation of an out-of-core series (see `is_out_of_core()`) in a bounded-memory pass:
+    the data is read by blocks (~BLOCK_SIZE values, aligned to the array chunks), the first, last, min, max
+    (and one NaN) points of each bin are kept. Bins are uniform in x: the selected points are the same
+    as of `minmax_index()` for the in-memory series.
+    The order of x is checked in the same pass: as `decimation_index()`, the series is not reduced
+    if x is not monotonic (e.g. scatter data).
+
+    Parameters
+    ----------
+    x, y : ArrayLike
+        1D arrays of the same size. If y is None, x is treated as y and x is the point index.
+
+    n_bins : int
+        The number of bins (pixel columns).
+
+    workers : int, optional
+        The number of threads reading and reducing blocks in parallel, by default 1.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray] or None
+        The decimated x, y series (in memory) or None if x is not monotonic.
+    """
+    if y is None:
+        x, y = None, x
+
+    # in-memory arguments (e.g. lists) as arrays
+    if not is_out_of_core(y):
+        y = np.asarray(y)
+    if x is not None and not is_out_of_core(x):
+        x = np.asarray(x)
+
+    n = len(y)
+    assert x is None or len(x) == n, 'the length of the input arrays must be the same'
+    assert len(y.shape) == 1, 'the input must be 1d arrays'
+
+    if n <= AUTO_POINTS_PER_PIXEL*n_bins:
+        # small data: in memory as is
+        y = np.asarray(y)
+        return (np.arange(n) if x is None else np.asarray(x)), y
+
+    # the bins are uniform in x between the first and the last values (x is monotonic)
+    if x is None:
+        x_first, x_last = 0, n - 1
+    else:
+        x_first = _numeric_block(np.asarray(x[:1]), 0)[0]
+        x_last = _numeric_block(np.asarray(x[n - 1:]), n - 1)[0]
+
+    block_size = _aligned_block_size(y)
+    blocks = [ (start, min(start + block_size, n)) for start in range(0, n, block_size) ]
+
+    def reduce_block(block: tuple[int, int]) -> tuple[ndarray, ...]:
+        return _reduce_block(x, y, *block, x_range=(x_first, x_last), n_bins=n_bins)
+
+    if workers <= 1:
+        reduced = list(map(reduce_block, blocks))
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            reduced = list(executor.map(reduce_block, blocks))
+
+    # candidates of all blocks: bin, x, y and the order of x in the blocks
+    bins, x_values, y_values, order = (np.concatenate(values) for values in zip(*reduced))
+
+    if not _is_monotonic_blocks(order):
+        return None
+
+    # the final M4 selection for each bin from the candidates of blocks (sorted by the point index)
+    keep = [ ]
+    bounds = np.searchsorted(bins, np.arange(n_bins + 1), side='left')
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        if start < end:
+            keep.append(start + _segment_m4(y_values[start:end]))
+
+    keep = np.unique(np.concatenate(keep))
+    return x_values[keep], y_values[keep]
+
+
+## Protected ##
+
+def _bin_bounds(x: ndarray, x_first: Any, x_last: Any, n_bins: int) -> ndarray:
+    """
+    Split the monotonic (numeric) x into **n_bins** uniform in [x_first, x_last] (pixel columns):
+    the indices of the n_bins - 1 inner bounds. x may be a block of the series: the bounds are clipped to it.
+    """
+    n = len(x)
+    x_edges = np.linspace(x_first, x_last, num=n_bins + 1)[1:-1]
+    if x_first > x_last:
+        # decreasing x: search in the reversed (increasing) order, no negation (unsigned types)
+        return n - np.searchsorted(x[::-1], x_edges, side='right')
+
+    return np.searchsorted(x, x_edges, side='left')
+
+
+def _is_monotonic(x: ndarray) -> bool:
+    """
+    Check if x is non-decreasing or non-increasing (NaN values break the order).
+    """
+    if len(x) < 2:
+        return True
+
+    return bool(np.all(x[1:] >= x[:-1]) or np.all(x[1:] <= x[:-1]))
+
+
+def _segment_minmax(segment: ndarray) -> ndarray:
+    """
+    Indices of min and max values in the segment (NaN-aware).
+    """
+    i_min = int(np.argmin(segment))
+    i_max = int(np.argmax(segment))
+
+    if segment.dtype.kind == 'f' and np.isnan(segment[i_min]):
+        # argmin/argmax stop at NaN: keep one NaN for the line gap
+        is_nan = np.isnan(segment)
+        if np.all(is_nan):
+            return np.array([i_min])
+        return np.array([i_min, np.nanargmin(segment), np.nanargmax(segment)])
+
+    return np.array([i_min, i_max])
+
+
+def _segment_m4(segment: ndarray) -> ndarray:
+    """
+    Sorted indices of the first, last, min and max values in the segment (NaN-aware).
+    """
+    return np.unique(np.concatenate([ [0, len(segment) - 1], _segment_minmax(segment) ]))
+
+
+def _as_numeric(x: ndarray, n: int) -> ndarray:
+    """
+    Numeric representation of x: datetime as int64, categorical (str, object, ...) as index.
+    """
+    if np.issubdtype(x.dtype, np.datetime64) or np.issubdtype(x.dtype, np.timedelta64):
+        return x.view(np.int64)
+
+    if np.issubdtype(x.dtype, np.number):
+        return x
+
+    return np.arange(n)
+
+
+def _aligned_block_size(a: Any) -> int:
+    """
+    BLOCK_SIZE rounded to the array chunks: each chunk is read (decompressed) once.
+    """
+    chunks = getattr(a, 'chunks', None)
+    if not chunks:
+        return BLOCK_SIZE
+
+    chunk = chunks[0]
+    if isinstance(chunk, tuple):
+        chunk = chunk[0] # dask: sizes of chunks per dimension
+
+    chunk = max(int(chunk), 1)
+    return max(BLOCK_SIZE // chunk, 1) * chunk
+
+
+def _reduce_block(x       : Any | None,
+                  y       : Any,
+                  start   : int,
+                  end     : int,
+                  x_range : tuple[Any, Any],
+                  n_bins  : int) -> tuple[ndarray, ...]:
+    """
+    M4 candidates of the bins (their parts) in the block [start, end): bin, x, y arrays
+    and the order of x in the block, see `_block_order()`.
+    """
+    y_block = np.asarray(y[start:end])
+    x_block = np.arange(start, end) if x is None else np.asarray(x[start:end])
+    x_numeric = _numeric_block(x_block, start)
+
+    # the bins are global (uniform in the x range of the series), the block may be a part of a bin
+    bounds = _bin_bounds(x_numeric, *x_range, n_bins=n_bins)
+    segment_starts = np.concatenate([[0], bounds])
+    segment_ends = np.concatenate([bounds, [len(y_block)]])
+
+    bins, index = [ ], [ ]
+    for i, (segment_start, segment_end) in enumerate(zip(segment_starts, segment_ends)):
+        if segment_start >= segment_end:
+            continue
+
+        selected = _segment_m4(y_block[segment_start:segment_end])
+        index.append(segment_start + selected)
+        bins.append(np.full(len(selected), i))
+
+    index = np.concatenate(index)
+    return np.concatenate(bins), x_block[index], y_block[index], _block_order(x_numeric)
+
+
+def _numeric_block(x_block: ndarray, start: int) -> ndarray:
+    """
+    Numeric representation of the block of x starting at **start**, see `_as_numeric()`:
+    categorical x as the point index in the series.
+    """
+    if x_block.dtype.kind in 'iufmM':
+        return _as_numeric(x_block, len(x_block))
+
+    return np.arange(start, start + len(x_block))
+
+
+def _block_order(x_block: ndarray) -> ndarray:
+    """
+    The order of the (numeric) x block as a record: (non-decreasing, non-increasing, first x, last x).
+    """
+    order = np.empty(1, dtype=[ ('increasing', bool), ('decreasing', bool),
+                                ('first', x_block.dtype), ('last', x_block.dtype) ])
+    order[0] = (np.all(x_block[1:] >= x_block[:-1]), np.all(x_block[1:] <= x_block[:-1]),
+                x_block[0], x_block[-1])
+    return order
+
+
+def _is_monotonic_blocks(order: ndarray) -> bool:
+    """
+    Check if x is monotonic over all blocks: in the same direction inside the blocks and across their borders.
+    """
+    # x values at the borders of the blocks in the series order: first0, last0, first1, last1, ...
+    borders = np.column_stack([ order['first'], order['last'] ]).ravel()
+
+    if np.all(order['increasing']):
+        return bool(np.all(borders[1:] >= borders[:-1]))
+
+    if np.all(order['decreasing']):
+        return bool(np.all(borders[1:] <= borders[:-1]))
+
+    return False
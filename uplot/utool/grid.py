@@ -1,5 +1,10 @@
+import os
+import hashlib
+import threading
 import numpy as np
-from typing import Literal
+
+from typing import Any, Callable, Literal
+from collections import OrderedDict
 
 
 Interpolator = Literal[
@@ -8,15 +13,41 @@ Interpolator = Literal[
     'cubic',
 ]
 
+GridDownsampling = Literal[
+    'mean',   # block average: smooth, anti-aliased
+    'minmax', # block min or max (the farther from the block mean): peaks and pits are preserved
+]
+
+# memory limit (bytes) of the cached triangulations / interpolation weights (point set + target grid), 0 - no caching
+GRID_CACHE_SIZE = 256 * 2**20
+
+# the memory limit of temporary arrays of all tiles evaluated at once (split between workers),
+# a tile is rows of the target grid
+GRID_TILE_BYTES = 64 * 2**20
+# approximate memory of temporary arrays per a target grid point (coordinates, simplex transforms, weights)
+GRID_POINT_BYTES = 160
+# the same for 'cubic': Clough-Tocher coefficients of each grid point
+GRID_CUBIC_POINT_BYTES = 2400
+
+# automatic grid size: the number of grid points per axis for N scattered points is ~ GRID_AUTO_DENSITY*sqrt(N)
+GRID_AUTO_DENSITY = 2.0
+GRID_AUTO_RANGE = (32, 1000)
+
 
 def array_to_grid(x: np.ndarray,
                   y: np.ndarray,
                   z: np.ndarray,
                   interpolation: Interpolator,
-                  interpolation_range: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+                  interpolation_range: int | None,
+                  workers: int | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Convert an array of non-uniformly distributed points to a uniformly interpolated grid.
 
+    The triangulation and the interpolation weights are cached for the point set (x, y) and the target grid,
+    so the interpolation of new z values for the same points is a sparse matrix-vector product
+    ('cubic' also estimates the gradients of z at the points).
+    The target grid is evaluated by row tiles in a thread pool, the temporary memory of the tiles is limited by GRID_TILE_BYTES.
+
     parameters
     ----------
     x, y : np.ndarray
@@ -25,8 +56,11 @@ def array_to_grid(x: np.ndarray,
         1D array of corresponding values for (x, y).
     interpolation : Interpolator
         Interpolation method to be used ('nearest', 'linear', or 'cubic').
-    interpolation_range : int
+    interpolation_range : int or None
         Number of points for creating the uniform grid.
+        If None, it's derived from the number of points, see `auto_grid_range()`.
+    workers : int or None, optional
+        The number of threads evaluating tiles, by default the number of CPUs.
 
     returns
     -------
@@ -34,14 +68,455 @@ def array_to_grid(x: np.ndarray,
         x, y, z - 2D arrays representing uniform grid coordinates and a 2D array of corresponding values.
     """
     assert len(x) == len(y) == len(z), 'sizes of x, y, z must match'
-    from scipy.interpolate import griddata
+
+    if interpolation_range is None:
+        interpolation_range = auto_grid_range(len(x))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
 
     # create a uniform grid based on the specified interpolation range
     x_range = np.linspace(x.min(), x.max(), num=interpolation_range)
     y_range = np.linspace(y.min(), y.max(), num=interpolation_range)
 
     # perform interpolation to obtain the uniformly distributed grid
-    z = griddata((x, y), z, (x_range[None, :], y_range[:, None]), method=interpolation)
+    grid = _grid_interpolation(x, y, x_range, y_range, interpolation, workers)
+    z = grid.interpolate(z, workers).reshape(len(y_range), len(x_range))
     x, y = np.meshgrid(x_range, y_range)
 
-    return x, y, z
\ No newline at end of file
+    return x, y, z
+
+
+def auto_grid_range(n_points: int) -> int:
+    """
+    The number of grid points per axis matching the density of N scattered points (clipped to GRID_AUTO_RANGE).
+    """
+    low, high = GRID_AUTO_RANGE
+    return int(np.clip(round(GRID_AUTO_DENSITY*np.sqrt(n_points)), low, high))
+
+
+def downsample_grid(x     : np.ndarray,
+                    y     : np.ndarray,
+                    z     : np.ndarray,
+                    max_facets: int,
+                    method: GridDownsampling = 'mean') -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Level of detail of a uniform grid: reduce z by square blocks so the surface has at most **max_facets** facets.
+
+    parameters
+    ----------
+    x, y : np.ndarray
+        1D arrays of the grid coordinates.
+    z : np.ndarray
+        2D array (len(y), len(x)) of the grid values.
+    max_facets : int
+        The maximum number of facets (cells) of the surface: (rows - 1)*(columns - 1).
+    method : GridDownsampling, optional
+        Reduction of a block: 'mean' or 'minmax' (NaN-aware), by default 'mean'.
+
+    returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        x, y - 1D arrays of the block centers, z - 2D array of the block values.
+        The input is returned as is if it doesn't exceed the limit.
+    """
+    assert z.shape == (len(y), len(x)), 'uniform grid: x and y range must match z'
+    assert max_facets > 0, 'max_facets must be positive'
+
+    n_facets = (len(y) - 1)*(len(x) - 1)
+    if n_facets <= max_facets:
+        return x, y, z
+
+    block = int(np.ceil(np.sqrt(n_facets/max_facets)))
+    while (-(-len(y) // block) - 1)*(-(-len(x) // block) - 1) > max_facets:
+        block += 1
+
+    x = _block_mean(x[None, :].astype(np.float64), block)[0]
+    y = _block_mean(y[:, None].astype(np.float64), block)[:, 0]
+    z = np.asarray(z, dtype=np.result_type(z.dtype, np.float32))
+
+    with np.errstate(invalid='ignore'):
+        mean = _block_mean(z, block) # NaN for all-NaN blocks
+        if method == 'mean':
+            return x, y, mean
+        if method == 'minmax':
+            # fmin/fmax ignore NaN values
+            z_min = _block_reduce(z, block, np.fmin)
+            z_max = _block_reduce(z, block, np.fmax)
+            return x, y, np.where(z_max - mean > mean - z_min, z_max, z_min)
+
+    raise ValueError(f'unsupported downsampling method: {method}')
+
+
+def clear_grid_cache():
+    """
+    Remove all cached triangulations and interpolation weights.
+    """
+    global _grid_cache_bytes
+
+    with _GRID_CACHE_LOCK:
+        _GRID_CACHE.clear()
+        _grid_cache_bytes = 0
+
+
+## Protected ##
+
+class _GridInterpolation:
+    """
+    Interpolation of values at the scattered points (x, y) to the target grid (x_range * y_range):
+      - 'nearest': index of the nearest point (KD-tree) for each grid point;
+      - 'linear': sparse weights matrix (grid points x points), NaN outside the convex hull;
+      - 'cubic': sparse weights matrix (grid points x values and gradients at the points), NaN outside
+        the convex hull. The gradients depend on z, they are estimated for each z (O(points)).
+    """
+
+    def __init__(self, points       : np.ndarray,
+                       x_range      : np.ndarray,
+                       y_range      : np.ndarray,
+                       interpolation: Interpolator,
+                       workers      : int):
+        self.points = points
+        self.x_range = x_range
+        self.y_range = y_range
+        self.interpolation = interpolation
+
+        self.triangulation = None
+        self.weights = None
+        self.index = None
+        self.outside = None
+
+        if interpolation == 'nearest':
+            self._init_nearest(workers)
+        elif interpolation == 'linear':
+            self._init_linear(workers)
+        elif interpolation == 'cubic':
+            self._init_cubic(workers)
+        else:
+            raise ValueError(f'unsupported interpolation: {interpolation}')
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory size of the interpolation: points, weights, index and triangulation.
+        """
+        arrays = [ self.points, self.x_range, self.y_range, self.index, self.outside ]
+
+        if self.weights is not None:
+            arrays += [ self.weights.data, self.weights.indices, self.weights.indptr ]
+
+        if self.triangulation is not None:
+            arrays += [ self.triangulation.points, self.triangulation.simplices,
+                        self.triangulation.neighbors, self.triangulation.equations ]
+            # computed lazily by scipy
+            arrays.append(getattr(self.triangulation, '_transform', None))
+
+        return sum(a.nbytes for a in arrays if a is not None)
+
+
+    def interpolate(self, z: np.ndarray, workers: int) -> np.ndarray:
+        """
+        Values at the grid points (1D, row-major) for the values z at the points.
+        """
+        z = np.asarray(z)
+
+        if self.interpolation == 'nearest':
+            return z[self.index]
+
+        if self.interpolation == 'cubic':
+            from scipy.interpolate import CloughTocher2DInterpolator
+            # the gradients at the points as estimated by scipy (global curvature minimization)
+            gradients = CloughTocher2DInterpolator(self.triangulation, z).grad.reshape(len(z), 2)
+            values = self.weights @ np.concatenate([ z, gradients[:, 0], gradients[:, 1] ])
+        else:
+            values = self.weights @ z
+
+        if self.outside is not None:
+            values = values.astype(np.result_type(values.dtype, np.float32))
+            values[self.outside] = np.nan
+
+        return values
+
+
+    def _init_nearest(self, workers: int):
+        from scipy.spatial import cKDTree
+
+        tree = cKDTree(self.points)
+        self.index = np.concatenate(self._map_tiles(lambda grid_points: tree.query(grid_points)[1], workers))
+
+
+    def _init_linear(self, workers: int):
+        from scipy.sparse import csr_matrix
+        from scipy.spatial import Delaunay
+
+        self.triangulation = Delaunay(self.points)
+        # computed lazily by scipy and not thread-safe: before the parallel evaluation
+        _ = self.triangulation.transform
+
+        tiles = self._map_tiles(self._linear_weights, workers)
+        barycentric = np.concatenate([ tile[0] for tile in tiles ])
+        vertices = np.concatenate([ tile[1] for tile in tiles ])
+        self.outside = np.concatenate([ tile[2] for tile in tiles ])
+
+        n = len(self.outside)
+        self.weights = csr_matrix((barycentric.ravel(), vertices.ravel(), np.arange(0, 3*n + 1, 3)),
+                                  shape=(n, len(self.points)))
+
+        if not np.any(self.outside):
+            self.outside = None
+
+
+    def _init_cubic(self, workers: int):
+        from scipy.sparse import csr_matrix
+        from scipy.spatial import Delaunay
+
+        self.triangulation = Delaunay(self.points)
+        # computed lazily by scipy and not thread-safe: before the parallel evaluation
+        _ = self.triangulation.transform
+        edges, directions = _clough_tocher_triangles(self.triangulation)
+
+        tiles = self._map_tiles(lambda grid_points: self._cubic_weights(grid_points, edges, directions),
+                                workers, point_bytes=GRID_CUBIC_POINT_BYTES)
+        weights = np.concatenate([ tile[0] for tile in tiles ])
+        vertices = np.concatenate([ tile[1] for tile in tiles ])
+        self.outside = np.concatenate([ tile[2] for tile in tiles ])
+
+        # columns: values, x and y gradients at the points (in the order of `_clough_tocher_weights()`)
+        n, n_points = len(self.outside), len(self.points)
+        columns = np.column_stack([ vertices,
+                                    *(np.column_stack([ n_points + vertices[:, j], 2*n_points + vertices[:, j] ])
+                                      for j in range(3)) ])
+        self.weights = csr_matrix((weights.ravel(), columns.ravel(), np.arange(0, 9*n + 1, 9)),
+                                  shape=(n, 3*n_points))
+
+        if not np.any(self.outside):
+            self.outside = None
+
+
+    def _cubic_weights(self, grid_points: np.ndarray,
+                             edges      : np.ndarray,
+                             directions : np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Clough-Tocher weights of the values and gradients at the vertices of the grid points triangles:
+        weights, vertices, outside mask. See `_clough_tocher_triangles()` for edges and directions.
+        """
+        simplex = self.triangulation.find_simplex(grid_points)
+        barycentric, vertices, outside = self._linear_weights(grid_points, simplex)
+
+        weights = _clough_tocher_weights(barycentric, edges[simplex], directions[simplex])
+        weights[outside] = 0
+
+        return weights, vertices, outside
+
+
+    def _linear_weights(self, grid_points: np.ndarray,
+                              simplex    : np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Barycentric coordinates of the grid points in their triangles: weights, vertices, outside mask.
+        """
+        if simplex is None:
+            simplex = self.triangulation.find_simplex(grid_points)
+        outside = simplex < 0
+
+        transform = self.triangulation.transform[simplex]
+        delta = grid_points - transform[:, 2]
+        barycentric = np.einsum('ijk,ik->ij', transform[:, :2], delta)
+        barycentric = np.hstack([ barycentric, 1 - barycentric.sum(axis=1, keepdims=True) ])
+
+        vertices = self.triangulation.simplices[simplex].astype(np.int32)
+        barycentric[outside] = 0
+        vertices[outside] = 0
+
+        return barycentric, vertices, outside
+
+
+    def _map_tiles(self, function   : Callable[[np.ndarray], Any],
+                         workers    : int,
+                         point_bytes: int = GRID_POINT_BYTES) -> list:
+        """
+        Apply the function to the grid points by row tiles (in parallel), results are in the row order.
+        """
+        # the memory budget is shared by the tiles evaluated in parallel
+        workers = max(workers, 1)
+        n_columns = len(self.x_range)
+        tile_rows = max(GRID_TILE_BYTES // (workers*point_bytes*n_columns), 1)
+        tiles = [ (start, min(start + tile_rows, len(self.y_range))) for start in range(0, len(self.y_range), tile_rows) ]
+
+        def evaluate(tile: tuple[int, int]) -> Any:
+            start, end = tile
+            grid_x, grid_y = np.meshgrid(self.x_range, self.y_range[start:end])
+            return function(np.column_stack([ grid_x.ravel(), grid_y.ravel() ]))
+
+        if workers <= 1 or len(tiles) == 1:
+            return list(map(evaluate, tiles))
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(workers, len(tiles))) as executor:
+            return list(executor.map(evaluate, tiles))
+
+
+def _clough_tocher_triangles(triangulation) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Geometry of the Clough-Tocher interpolant per triangle (as scipy `CloughTocher2DInterpolator`):
+    edge vectors e12, e23, e31 (triangles x 3 x 2) and the directions g (triangles x 3) of the cross-boundary
+    derivatives: to the centroid of the neighbour triangle (affine invariant), to the own centroid on the hull.
+    """
+    vertices = triangulation.points[triangulation.simplices]
+    edges = np.stack([ vertices[:, 1] - vertices[:, 0],
+                       vertices[:, 2] - vertices[:, 1],
+                       vertices[:, 0] - vertices[:, 2] ], axis=1)
+
+    centroids = vertices.mean(axis=1)
+    directions = np.full((len(vertices), 3), -0.5)
+
+    for k, (i, j) in enumerate([ (2, 1), (0, 2), (1, 0) ]):
+        neighbors = triangulation.neighbors[:, k]
+        has_neighbor = neighbors >= 0
+
+        # the centroid of the neighbour in the barycentric coordinates of the triangle
+        transform = triangulation.transform[has_neighbor]
+        c = np.einsum('ijk,ik->ij', transform[:, :2], centroids[neighbors[has_neighbor]] - transform[:, 2])
+        c = np.column_stack([ c, 1 - c.sum(axis=1) ])
+
+        directions[has_neighbor, k] = (2*c[:, i] + c[:, j] - 1) / (2 - 3*c[:, i] - 3*c[:, j])
+
+    return edges, directions
+
+
+def _clough_tocher_weights(barycentric: np.ndarray, edges: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """
+    Weights (points x 9) of the Clough-Tocher interpolant at points of triangles: the interpolant is linear
+    in the values f1, f2, f3 and the gradients (x, y) df1, df2, df3 at the triangle vertices.
+    The Bezier coefficients follow scipy `CloughTocher2DInterpolator` (each coefficient is a weights vector).
+    """
+    n = len(barycentric)
+
+    def unit(i: int) -> np.ndarray:
+        u = np.zeros((1, 9))
+        u[0, i] = 1
+        return u
+
+    def derivative(vertex: int, edge: int) -> np.ndarray:
+        # the derivative at the vertex along the edge
+        d = np.zeros((n, 9))
+        d[:, 3 + 2*vertex:5 + 2*vertex] = edges[:, edge]
+        return d
+
+    g = [ directions[:, k, None] for k in range(3) ]
+
+    c3000, c0300, c0030 = unit(0), unit(1), unit(2)
+    c2100 = derivative(0, 0)/3 + c3000
+    c2010 = -derivative(0, 2)/3 + c3000
+    c1200 = -derivative(1, 0)/3 + c0300
+    c0210 = derivative(1, 1)/3 + c0300
+    c1020 = derivative(2, 2)/3 + c0030
+    c0120 = -derivative(2, 1)/3 + c0030
+
+    c2001 = (c2100 + c2010 + c3000)/3
+    c0201 = (c1200 + c0300 + c0210)/3
+    c0021 = (c1020 + c0120 + c0030)/3
+
+    c0111 = (g[0]*(-c0300 + 3*c0210 - 3*c0120 + c0030) + (-c0300 + 2*c0210 - c0120 + c0021 + c0201))/2
+    c1011 = (g[1]*(-c0030 + 3*c1020 - 3*c2010 + c3000) + (-c0030 + 2*c1020 - c2010 + c2001 + c0021))/2
+    c1101 = (g[2]*(-c3000 + 3*c2100 - 3*c1200 + c0300) + (-c3000 + 2*c2100 - c1200 + c2001 + c0201))/2
+
+    c1002 = (c1101 + c1011 + c2001)/3
+    c0102 = (c1101 + c0111 + c0201)/3
+    c0012 = (c1011 + c0111 + c0021)/3
+    c0003 = (c1002 + c0102 + c0012)/3
+
+    # extended barycentric coordinates: the sub-triangle of the point (one of b1, b2, b3 is zero)
+    minimum = barycentric.min(axis=1)
+    b1, b2, b3 = (barycentric[:, k, None] - minimum[:, None] for k in range(3))
+    b4 = 3*minimum[:, None]
+
+    return (b1**3*c3000 + 3*b1**2*b2*c2100 + 3*b1**2*b3*c2010 +
+            3*b1**2*b4*c2001 + 3*b1*b2**2*c1200 +
+            6*b1*b2*b4*c1101 + 3*b1*b3**2*c1020 + 6*b1*b3*b4*c1011 +
+            3*b1*b4**2*c1002 + b2**3*c0300 + 3*b2**2*b3*c0210 +
+            3*b2**2*b4*c0201 + 3*b2*b3**2*c0120 + 6*b2*b3*b4*c0111 +
+            3*b2*b4**2*c0102 + b3**3*c0030 + 3*b3**2*b4*c0021 +
+            3*b3*b4**2*c0012 + b4**3*c0003)
+
+
+def _block_reduce(a: np.ndarray, block: int, function: np.ufunc) -> np.ndarray:
+    """
+    Reduce the 2D array by (block x block) blocks with the binary ufunc, the edge blocks may be incomplete.
+    The rows (columns) of the blocks are accumulated in place: one pass over the data per axis.
+    """
+    for axis in (0, 1):
+        a = np.moveaxis(a, axis, 0)
+        out = a[0::block].copy()
+        for i in range(1, block):
+            part = a[i::block]
+            function(out[:len(part)], part, out=out[:len(part)])
+        a = np.moveaxis(out, 0, axis)
+
+    return a
+
+
+def _block_mean(a: np.ndarray, block: int) -> np.ndarray:
+    """
+    NaN-aware mean of the 2D array by (block x block) blocks, the edge blocks may be incomplete.
+    """
+    is_nan = np.isnan(a)
+    if is_nan.any():
+        sums = _block_reduce(np.where(is_nan, 0, a), block, np.add)
+        counts = _block_reduce((~is_nan).astype(np.int32), block, np.add)
+    else:
+        # no NaN values: the sizes of the blocks
+        sums = _block_reduce(a, block, np.add)
+        rows = np.minimum(a.shape[0] - np.arange(0, a.shape[0], block), block)
+        columns = np.minimum(a.shape[1] - np.arange(0, a.shape[1], block), block)
+        counts = rows[:, None]*columns[None, :]
+
+    return (sums / counts).astype(a.dtype, copy=False)
+
+
+_GRID_CACHE: OrderedDict[Any, tuple[_GridInterpolation, int]] = OrderedDict()
+_GRID_CACHE_LOCK = threading.Lock()
+_grid_cache_bytes = 0
+
+
+def _grid_interpolation(x            : np.ndarray,
+                        y            : np.ndarray,
+                        x_range      : np.ndarray,
+                        y_range      : np.ndarray,
+                        interpolation: Interpolator,
+                        workers      : int) -> _GridInterpolation:
+    """
+    The cached interpolation for the point set and the target grid (LRU bounded by GRID_CACHE_SIZE bytes).
+    """
+    global _grid_cache_bytes
+
+    points = np.column_stack([ x, y ]).astype(np.float64)
+    key = (_digest(points), len(points), interpolation, _digest(x_range), _digest(y_range))
+
+    with _GRID_CACHE_LOCK:
+        entry = _GRID_CACHE.get(key)
+        if entry is not None:
+            _GRID_CACHE.move_to_end(key)
+            return entry[0]
+
+    grid = _GridInterpolation(points, x_range, y_range, interpolation, workers)
+    size = grid.nbytes
+    if size > GRID_CACHE_SIZE:
+        return grid
+
+    with _GRID_CACHE_LOCK:
+        previous = _GRID_CACHE.pop(key, None)
+        if previous is not None:
+            _grid_cache_bytes -= previous[1]
+
+        _GRID_CACHE[key] = (grid, size)
+        _grid_cache_bytes += size
+
+        while _grid_cache_bytes > GRID_CACHE_SIZE:
+            _, (_, evicted_size) = _GRID_CACHE.popitem(last=False)
+            _grid_cache_bytes -= evicted_size
+
+    return grid
+
+
+def _digest(a: np.ndarray) -> bytes:
+    return hashlib.blake2b(np.ascontiguousarray(a).data, digest_size=16).digest()
@@ -1,10 +1,28 @@
+import weakref
 import numpy as np
 from numpy import ndarray
 
+from uplot.utype import ImageChannels
 
-def image_range(image: ndarray) -> int | float:
+
+# value ranges in ascending order: the first one which contains the image max is chosen
+IMAGE_RANGES = (1.0, 255, 65535)
+# tolerance of [0, 1] range for float images
+FLOAT_RANGE_TOLERANCE = 0.01
+# max number of bytes for reading at once: memory-mapped images are not loaded entirely
+CHUNK_BYTES = 16 * 2**20
+
+# cached ranges of read-only images: (buffer address, shape, strides, dtype) -> (weakref(buffer owner), range)
+_RANGE_CACHE: dict[tuple, tuple[weakref.ref, int | float]] = { }
+
+
+def image_range(image: ndarray, chunk_bytes: int = CHUNK_BYTES) -> int | float:
     """
-    Guess the range by an image type and values
+    Guess the range by an image type and values: 1.0, 255 or 65535.
+
+    The max value is found by chunks (memory-mapped images are read sequentially),
+    the scan stops as soon as the max exceeds the largest range.
+    The range of read-only images (e.g. `np.memmap` in 'r' mode) is cached.
     """
     # int image
     if image.dtype.type == np.uint8:
@@ -13,33 +31,183 @@ def image_range(image: ndarray) -> int | float:
     if image.dtype.type == np.uint16:
         return 65535
 
-    # float image
-    max_value = np.max(image)
-
-    if max_value < 1.01:
+    if image.dtype.type == np.bool_:
         return 1.0
 
-    if max_value < 255:
-        return 255
+    # views of the same buffer (e.g. `np.asarray(memmap)` on each call) share the cached range
+    owner = _buffer_owner(image)
+    key = (image.__array_interface__['data'][0], image.shape, image.strides, image.dtype.str)
 
-    if max_value < 65535:
-        return 65535
+    cached = _RANGE_CACHE.get(key)
+    if cached is not None and cached[0]() is owner:
+        return cached[1]
+
+    value_range = _detect_range(image, chunk_bytes)
+
+    if not image.flags.writeable and not owner.flags.writeable:
+        # the content can't be changed: the range is valid for the buffer lifetime
+        _RANGE_CACHE[key] = (weakref.ref(owner, lambda _: _RANGE_CACHE.pop(key, None)), value_range)
+
+    return value_range
 
-    raise RuntimeError('image range detection failure')
 
+def image_encode_base64(image: ndarray, value_range: float, bit_depth: int = 8) -> str:
+    """
+    Encode the image [0, value_range] as PNG data URI: 'data:image/png;base64,...'.
+
+    Parameters
+    ----------
+    image : ndarray
+        Grayscale (height, width) or RGB(A) (height, width, 3|4) image.
 
-def image_encode_base64(image: ndarray, value_range: float) -> str:
+    value_range : float
+        The max value of the image range.
+
+    bit_depth : int, optional
+        8 - compact, 16 - lossless for uint16 images, by default 8.
+    """
     import base64
-    from io import BytesIO
-    from PIL import Image
 
-    image_u8 = (255 * (image / value_range)).astype(np.uint8)
+    png = image_encode_png(image, value_range, bit_depth=bit_depth)
+    return 'data:image/png;base64,' + base64.b64encode(png).decode('utf-8')
+
+
+def image_encode_png(image: ndarray, value_range: float, bit_depth: int = 8) -> bytes:
+    """
+    Encode the image [0, value_range] as PNG file content, see `image_encode_base64()`.
+    """
+    assert bit_depth in (8, 16), 'supported bit depth: 8, 16'
+
+    if image.ndim == 3 and image.shape[2] == 1:
+        image = image[..., 0]
+    assert image.ndim == 2 or (image.ndim == 3 and image.shape[2] in (3, 4)), \
+           'grayscale or RGB(A) image is expected'
+
+    dtype = np.uint8 if bit_depth == 8 else np.uint16
+    image = _quantize(image, value_range, dtype)
+
+    if bit_depth == 8:
+        from io import BytesIO
+        from PIL import Image
+
+        with BytesIO() as stream:
+            Image.fromarray(image).save(stream, format='png')
+            return stream.getvalue()
+
+    return _encode_png16(image)
+
+
+def image_to_channels(image: ndarray, channels: ImageChannels, out: ndarray | None = None) -> ndarray:
+    """
+    Copy RGB or RGBA uint8 image (height, width, 3|4) to **out** (or a new array) with the specified channels.
+    The alpha channel is opaque if it is added. Raises ValueError if **out** doesn't match the image.
+    """
+    assert image.ndim == 3 and image.shape[-1] in (3, 4), 'the input must be RGB or RGBA image'
+
+    n_channels = { 'rgb': 3, 'rgba': 4 }[channels]
+    shape = image.shape[:2] + (n_channels,)
+
+    if out is None:
+        out = np.empty(shape, dtype=np.uint8)
+    elif out.shape != shape or out.dtype != np.uint8:
+        raise ValueError(f'the output must be uint8 array of shape {shape}, got {out.dtype} {out.shape}')
+
+    out[..., :3] = image[..., :3]
+    if n_channels == 4:
+        out[..., 3] = image[..., 3] if image.shape[-1] == 4 else 255
+
+    return out
+
+
+## Protected ##
+
+def _buffer_owner(image: ndarray) -> ndarray:
+    """
+    The outermost array of the view chain: it keeps the image buffer (e.g. `np.memmap`) alive.
+    """
+    owner = image
+    while isinstance(owner.base, np.ndarray):
+        owner = owner.base
+    return owner
+
+
+def _detect_range(image: ndarray, chunk_bytes: int) -> int | float:
+    max_value = -np.inf
+
+    for chunk in _iterate_chunks(image, chunk_bytes):
+        # NaN values are ignored
+        max_value = max(max_value, float(np.fmax.reduce(chunk, axis=None)))
+        if max_value >= IMAGE_RANGES[-1]:
+            break # early stop: out of all ranges
+
+    if max_value < IMAGE_RANGES[0] + FLOAT_RANGE_TOLERANCE:
+        return IMAGE_RANGES[0]
+
+    for value_range in IMAGE_RANGES[1:]:
+        if max_value < value_range:
+            return value_range
+
+    raise RuntimeError('image range detection failure')
+
+
+def _iterate_chunks(image: ndarray, chunk_bytes: int):
+    """
+    Split the image to chunks of rows (views) with the size ~chunk_bytes.
+    """
+    if image.ndim == 0 or image.size == 0:
+        yield image.reshape(-1)
+        return
+
+    row_bytes = max(image.nbytes // len(image), 1)
+    rows = max(chunk_bytes // row_bytes, 1)
+
+    for start in range(0, len(image), rows):
+        yield image[start:start + rows]
+
+
+def _quantize(image: ndarray, value_range: float, dtype: type) -> ndarray:
+    """
+    Convert the image [0, value_range] to the full range of the integer type, no copy if possible.
+    """
+    max_value = np.iinfo(dtype).max
+
+    if image.dtype == dtype and value_range == max_value:
+        return image
+
+    scaled = image.astype(np.float32) # the only copy
+    scaled *= max_value / value_range
+    np.nan_to_num(scaled, copy=False)
+    np.clip(scaled, 0, max_value, out=scaled)
+    np.rint(scaled, out=scaled)
+
+    return scaled.astype(dtype)
+
+
+def _encode_png16(image: ndarray) -> bytes:
+    """
+    Minimal 16-bit PNG encoder (PIL doesn't support 16-bit RGB): grayscale or RGB(A).
+    """
+    import zlib
+    import struct
+
+    height, width = image.shape[:2]
+    channels = 1 if image.ndim == 2 else image.shape[2]
+    color_type = { 1: 0, 3: 2, 4: 6 }[channels] # gray, RGB, RGBA
+
+    # big-endian samples, each row starts with the filter type (0 - none)
+    rows = np.ascontiguousarray(image, dtype='>u2').reshape(height, -1).view(np.uint8)
+    raw = np.empty((height, rows.shape[1] + 1), dtype=np.uint8)
+    raw[:, 0] = 0
+    raw[:, 1:] = rows
 
-    pil_image = Image.fromarray(image_u8)
-    prefix = 'data:image/png;base64,'
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
 
-    with BytesIO() as stream:
-        pil_image.save(stream, format='png')
-        image_base64 = prefix + base64.b64encode(stream.getvalue()).decode('utf-8')
+    header = struct.pack('>IIBBBBB', width, height, 16, color_type, 0, 0, 0)
 
-    return image_base64
\ No newline at end of file
+    return b''.join([
+        b'\x89PNG\r\n\x1a\n',
+        chunk(b'IHDR', header),
+        chunk(b'IDAT', zlib.compress(raw.tobytes(), level=6)),
+        chunk(b'IEND', b''),
+    ])
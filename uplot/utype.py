@@ -7,6 +7,12 @@ AxisScale = Literal[
 ]
 
 
+ImageChannels = Literal[
+    'rgb',  # (height, width, 3) uint8
+    'rgba', # (height, width, 4) uint8
+]
+
+
 AspectMode = Literal[
     'auto',
     'equal' # equal scale for all axis